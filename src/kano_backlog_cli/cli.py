@@ -6,8 +6,6 @@ from pathlib import Path
 from typing import Optional
 import typer
 
-from kano_backlog_core import __version__
-
 from .util import (
     configure_stdio,
     ensure_core_on_path,
@@ -19,9 +17,21 @@ from .util import (
 app = typer.Typer(help="kano-backlog: Backlog management CLI (MVP)")
 
 
+def __getattr__(name: str):
+    # Resolved on demand: importing kano_backlog_core costs more than the rest
+    # of CLI startup, and `--help` never needs it.
+    if name == "__version__":
+        from kano_backlog_core import __version__
+
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def version_callback(value: bool):
     """Display version information."""
     if value:
+        from kano_backlog_core import __version__
+
         typer.echo(f"kano-backlog version {__version__}")
         raise typer.Exit()
 
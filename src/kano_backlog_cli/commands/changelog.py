@@ -9,10 +9,7 @@ from typing import Optional
 
 import typer
 
-from kano_backlog_ops.changelog import (
-    generate_changelog_from_backlog,
-    merge_unreleased_to_version,
-)
+from ..util import ensure_core_on_path
 
 app = typer.Typer(help="Changelog generation from backlog")
 
@@ -31,6 +28,9 @@ def generate(
     Example:
         kano-backlog changelog generate --version 0.0.1 --product kano-agent-backlog-skill
     """
+    ensure_core_on_path()
+    from kano_backlog_ops.changelog import generate_changelog_from_backlog
+
     try:
         result = generate_changelog_from_backlog(
             version=version,
@@ -65,6 +65,9 @@ def merge_unreleased(
         kano-backlog changelog merge-unreleased --version 0.0.1
         kano-backlog changelog merge-unreleased --version 0.0.1 --dry-run
     """
+    ensure_core_on_path()
+    from kano_backlog_ops.changelog import merge_unreleased_to_version
+
     try:
         # Resolve changelog path relative to current directory or skill root
         if not changelog.is_absolute():
@@ -650,6 +650,31 @@ def check_optional_dependencies() -> CheckResult:
     )
 
 
+def check_hash_backend() -> CheckResult:
+    """Report which SHA-256 implementation hashlib uses (noop embeddings, hashing)."""
+    from kano_backlog_core.embedding.noop import sha256_backend
+
+    backend = sha256_backend()
+    if backend["implementation"] == "openssl":
+        return CheckResult(
+            name="Hash Backend",
+            passed=True,
+            message=f"hashlib.sha256 uses {backend['openssl_version']}",
+        )
+
+    return CheckResult(
+        name="Hash Backend",
+        passed=True,  # Informational: hashing works, just without CPU SHA extensions
+        message="Warning: hashlib.sha256 uses Python's built-in implementation",
+        details=(
+            f"Module: {backend['module']}, OpenSSL: {backend['openssl_version']}\n"
+            "Use a Python linked against OpenSSL >= 1.1.1 so SHA-256 can use CPU "
+            "SHA extensions (SHA-NI / ARMv8). OpenSSL selects them automatically; "
+            "the OPENSSL_ia32cap environment variable can override CPU detection."
+        ),
+    )
+
+
 def check_permissions(
     backlog_root: Optional[Path] = None,
 ) -> CheckResult:
@@ -1223,6 +1248,7 @@ def run_doctor(
         check_python_prereqs(),
         check_sqlite_availability(),
         check_optional_dependencies(),
+        check_hash_backend(),
         check_skill_layout(),
         check_backlog_structure(backlog_root=backlog_root),
         check_permissions(backlog_root=backlog_root),
@@ -247,6 +247,7 @@ def build_index(
                 "items_processed": result.items_processed,
                 "chunks_generated": result.chunks_generated,
                 "chunks_indexed": result.chunks_indexed,
+                "chunks_reused": result.chunks_reused,
                 "duration_ms": result.duration_ms,
                 "backend_type": result.backend_type,
             }
@@ -257,6 +258,7 @@ def build_index(
         typer.echo(f"- items_processed: {result.items_processed}")
         typer.echo(f"- chunks_generated: {result.chunks_generated}")
         typer.echo(f"- chunks_indexed: {result.chunks_indexed}")
+        typer.echo(f"- chunks_reused: {result.chunks_reused}")
         typer.echo(f"- duration_ms: {result.duration_ms:.2f}")
         typer.echo(f"- backend_type: {result.backend_type}")
 
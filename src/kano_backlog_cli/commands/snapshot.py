@@ -8,15 +8,16 @@ import subprocess
 import sys
 from dataclasses import asdict
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 
 import typer
 from rich.console import Console
 
-from kano_backlog_ops import snapshot as snapshot_ops
-from kano_backlog_ops.template_engine import TemplateEngine
 from kano_backlog_cli.util import ensure_core_on_path, resolve_product_root
 
+if TYPE_CHECKING:
+    from kano_backlog_ops import snapshot as snapshot_ops
+
 app = typer.Typer()
 console = Console()
 
@@ -26,6 +27,8 @@ def _collect_cli_remotely() -> List[snapshot_ops.CliCommand]:
     Collect CLI tree by running 'kano-backlog --help' and parsing output.
     This simulates an external audit of the surface.
     """
+    from kano_backlog_ops import snapshot as snapshot_ops
+
     # Find the kano-backlog script wrapper or module
     # We try to run the same command that invoked us, or default to standard locations
     cmd = [sys.executable, "skills/kano-agent-backlog-skill/scripts/kano-backlog"]
@@ -137,6 +140,8 @@ def create(
     """
     cwd = Path.cwd()
     ensure_core_on_path()
+    from kano_backlog_ops import snapshot as snapshot_ops
+
     meta_mode = _validate_meta_mode(meta_mode)
     
     # Parse scope
@@ -225,6 +230,9 @@ def report(
     """
     cwd = Path.cwd()
     ensure_core_on_path()
+    from kano_backlog_ops import snapshot as snapshot_ops
+    from kano_backlog_ops.template_engine import TemplateEngine
+
     meta_mode = _validate_meta_mode(meta_mode)
     
     console.print(f"[bold blue]Generating {persona} report for {scope}...[/bold blue]")
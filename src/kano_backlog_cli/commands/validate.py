@@ -1,10 +1,9 @@
 from __future__ import annotations
 from typing import Optional, Union
-import json
 from pathlib import Path
 import typer
 
-from ..util import ensure_core_on_path
+from ..util import echo_json, ensure_core_on_path
 
 app = typer.Typer(help="Validation helpers")
 
@@ -113,7 +112,7 @@ def validate_links(
                     ],
                 }
             )
-        typer.echo(json.dumps(payload, ensure_ascii=True, indent=2))
+        echo_json(payload, ensure_ascii=True, indent=2)
         return
 
     total_issues = 0
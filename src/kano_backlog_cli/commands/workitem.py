@@ -7,6 +7,7 @@ from typing import List
 import typer
 
 from ..util import (
+    echo_json,
     ensure_core_on_path,
     resolve_backlog_root,
     resolve_product_root,
@@ -55,7 +56,7 @@ def read(
     if output_format == "json":
         data = item.model_dump()
         data["file_path"] = str(data.get("file_path"))
-        typer.echo(json.dumps(data, ensure_ascii=True))
+        echo_json(data, ensure_ascii=True)
     else:
         typer.echo(f"ID: {item.id}\nTitle: {item.title}\nState: {item.state.value}\nOwner: {item.owner}")
 
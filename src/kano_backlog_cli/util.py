@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import json
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 # Global variable to store custom config file path
 _global_config_file: Optional[Path] = None
@@ -40,6 +41,17 @@ def configure_stdio() -> None:
             continue
 
 
+def echo_json(payload: Any, **kwargs: Any) -> None:
+    """Write payload as JSON plus a newline to stdout, like typer.echo(json.dumps(...)).
+
+    json.dump hands the encoder's chunks straight to the stream, so large items
+    and reports are never held as one string next to the data they encode.
+    """
+    json.dump(payload, sys.stdout, **kwargs)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
 def load_env_file(path: Path, *, required: bool = False) -> None:
     """Load environment variables from a simple KEY=VALUE file.
 
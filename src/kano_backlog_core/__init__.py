@@ -35,6 +35,7 @@ from .token_budget import (
     TokenBudgetResult,
     budget_chunks,
     enforce_token_budget,
+    enforce_token_budget_many,
 )
 from .errors import (
     BacklogError,
@@ -93,6 +94,7 @@ __all__ = [
     "TokenBudgetResult",
     "budget_chunks",
     "enforce_token_budget",
+    "enforce_token_budget_many",
     # Errors
     "BacklogError",
     "ConfigError",
@@ -0,0 +1,64 @@
+"""Optional Numba kernel for the heuristic tokenizer's character scan.
+
+Numba is not a dependency of this package. When it is installed,
+:func:`get_scan_kernel` returns a JIT-compiled version of :func:`scan_codes`;
+otherwise it returns None and callers keep their NumPy/pure-Python paths.
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def scan_codes(codes: Any, ascii_punct_lut: Any, rest: Any) -> Tuple[int, int, int]:
+    """Scan a ``uint32`` code point array in a single typed loop.
+
+    Counts CJK code points and ASCII punctuation (via ``ascii_punct_lut``, a
+    128-entry bool array). Every other non-ASCII code point is copied into
+    ``rest`` (same length as ``codes``) for Unicode classification by the
+    caller, since isalnum/isspace are not available in nopython mode.
+
+    Returns ``(cjk_count, ascii_punct_count, rest_count)``. The ranges mirror
+    ``tokenizer._CJK_RANGES``.
+    """
+    cjk = 0
+    punct = 0
+    n_rest = 0
+    for i in range(codes.shape[0]):
+        c = codes[i]
+        if c < 128:
+            if ascii_punct_lut[c]:
+                punct += 1
+        elif (
+            (0x4E00 <= c and c <= 0x9FFF)
+            or (0x3040 <= c and c <= 0x30FF)
+            or (0xAC00 <= c and c <= 0xD7AF)
+            or (0x3400 <= c and c <= 0x4DBF)
+        ):
+            cjk += 1
+        else:
+            rest[n_rest] = c
+            n_rest += 1
+    return cjk, punct, n_rest
+
+
+@lru_cache(maxsize=None)
+def get_scan_kernel() -> Optional[Callable[[Any, Any, Any], Tuple[int, int, int]]]:
+    """Return the compiled :func:`scan_codes`, or None when Numba is unavailable.
+
+    Compilation happens once per process; ``cache=True`` also persists the
+    machine code next to this module so later processes skip the JIT.
+    """
+    try:
+        from numba import njit  # type: ignore
+    except ImportError:
+        return None
+    try:
+        return njit(cache=True, boundscheck=False, nogil=True)(scan_codes)
+    except Exception as e:  # pragma: no cover - depends on the numba install
+        logger.debug("Numba heuristic kernel unavailable: %s", e)
+        return None
@@ -11,6 +11,22 @@ import frontmatter
 from .models import BacklogItem, ItemType, ItemState, WorklogEntry
 from .errors import ItemNotFoundError, ParseError, ValidationError, WriteError
 
+# CanonicalStore._slugify: characters dropped, then runs collapsed to "-".
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_DASH_RE = re.compile(r"[-\s]+")
+
+# Body section headings, matched as line prefixes in this order.
+_SECTION_MARKERS = (
+    ("context", "# Context"),
+    ("goal", "# Goal"),
+    ("non_goals", "# Non-Goals"),
+    ("approach", "# Approach"),
+    ("alternatives", "# Alternatives"),
+    ("acceptance_criteria", "# Acceptance Criteria"),
+    ("risks", "# Risks / Dependencies"),
+    ("worklog", "# Worklog"),
+)
+
 # Conditional import for UUIDv7
 if sys.version_info >= (3, 12):
     from uuid import uuid7  # type: ignore
@@ -310,26 +326,17 @@ class CanonicalStore:
         """Parse body sections from markdown."""
         sections = {}
 
-        # Define section markers
-        section_markers = {
-            "context": r"# Context",
-            "goal": r"# Goal",
-            "non_goals": r"# Non-Goals",
-            "approach": r"# Approach",
-            "alternatives": r"# Alternatives",
-            "acceptance_criteria": r"# Acceptance Criteria",
-            "risks": r"# Risks / Dependencies",
-            "worklog": r"# Worklog",
-        }
-
         # Split body into sections
         current_section = None
         current_content = []
 
         for line in body.split("\n"):
             matched_section = None
-            for key, marker in section_markers.items():
-                if re.match(marker, line.strip()):
+            stripped = line.strip()
+            # Every marker starts with "# "; most lines are prose and skip the scan.
+            markers = _SECTION_MARKERS if stripped.startswith("# ") else ()
+            for key, marker in markers:
+                if stripped.startswith(marker):
                     # Save previous section
                     if current_section:
                         content = "\n".join(current_content).strip()
@@ -380,6 +387,6 @@ class CanonicalStore:
         """Convert title to filesystem-safe slug."""
         # Lowercase and replace spaces/special chars with hyphens
         slug = text.lower()
-        slug = re.sub(r"[^\w\s-]", "", slug)
-        slug = re.sub(r"[-\s]+", "-", slug)
+        slug = _SLUG_STRIP_RE.sub("", slug)
+        slug = _SLUG_DASH_RE.sub("-", slug)
         return slug.strip("-")[:50]  # Limit length
@@ -11,15 +11,15 @@ This module provides a small, local-first, dependency-free chunking core that:
 from __future__ import annotations
 
 from bisect import bisect_left, bisect_right
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import hashlib
 import logging
 import re
 import unicodedata
-from typing import Iterable, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from .tokenizer import TokenizerAdapter, TokenizerRegistry
+    from .tokenizer import TokenCount, TokenizerAdapter, TokenizerRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -56,9 +56,16 @@ class Chunk:
     end_char: int
     text: str
     chunk_id: str
+    # Token count of ``text`` when the chunker already measured it with the
+    # caller's tokenizer (chunk_text_with_tokenizer only); lets the budget
+    # step skip re-counting. Not part of the chunk's identity.
+    token_count: Optional["TokenCount"] = field(default=None, compare=False, repr=False)
 
 
 _PARA_BREAK_RE = re.compile(r"\n{2,}")
+_LINE_TRAILING_WS_RE = re.compile(r"[ \t]+\n")
+_SPACE_RUN_RE = re.compile(r"[ \t]{4,}")
+_TEXT_TRAILING_WS_RE = re.compile(r"[ \t]+$")
 _SENT_END_RE = re.compile(r"(?:[.!?]+|[。！？]+)(?=\s|$)")
 
 
@@ -92,26 +99,32 @@ def normalize_text(text: str) -> str:
     
     # Step 3: Enhanced whitespace normalization
     # Remove trailing whitespace from lines (but preserve intentional line breaks)
-    normalized = re.sub(r"[ \t]+\n", "\n", normalized)
+    normalized = _LINE_TRAILING_WS_RE.sub("\n", normalized)
     
     # Normalize multiple consecutive spaces to single spaces (but preserve intentional formatting)
     # This is conservative - only collapse excessive spaces, not all multiple spaces
-    normalized = re.sub(r"[ \t]{4,}", "   ", normalized)  # 4+ spaces -> 3 spaces (preserve some formatting)
+    normalized = _SPACE_RUN_RE.sub("   ", normalized)  # 4+ spaces -> 3 spaces (preserve some formatting)
     
     # Step 4: Control character handling
     # Remove or normalize problematic control characters while preserving essential ones
     # Keep: \n (newline), \t (tab), and printable characters
     # Remove: other control characters that can cause issues
-    normalized = "".join(
-        char for char in normalized 
-        if char == "\n" or char == "\t" or not unicodedata.category(char).startswith("C")
-        or unicodedata.category(char) in ("Cf",)  # Keep format characters like zero-width space
-    )
+    # Classify each distinct character once instead of every position; text is
+    # usually built from a few hundred distinct characters.
+    dropped = {
+        ord(char): None
+        for char in set(normalized)
+        if char != "\n" and char != "\t"
+        and unicodedata.category(char).startswith("C")
+        and unicodedata.category(char) != "Cf"  # Keep format characters like zero-width space
+    }
+    if dropped:
+        normalized = normalized.translate(dropped)
     
     # Step 5: Final cleanup
     # Remove trailing whitespace from the entire text while preserving internal structure
     # Only remove trailing spaces and tabs, but preserve trailing newlines if they're significant
-    normalized = re.sub(r"[ \t]+$", "", normalized)
+    normalized = _TEXT_TRAILING_WS_RE.sub("", normalized)
     
     return normalized
 
@@ -701,7 +714,10 @@ def _chunk_text_with_adapter(
     para_boundaries = _paragraph_boundary_chars(normalized)
     sent_boundaries = _sentence_boundary_chars(normalized)
     
-    chunks: List[Chunk] = []
+    # The boundary, target and overlap searches probe many of the same slices;
+    # count each distinct slice once per call.
+    counter = _MemoizedCounter(tokenizer)
+    spans: List[Tuple[int, int]] = []
     current_pos = 0
     text_len = len(normalized)
     
@@ -711,7 +727,7 @@ def _chunk_text_with_adapter(
             text=normalized,
             start_pos=current_pos,
             options=options,
-            tokenizer=tokenizer,
+            tokenizer=counter,
             para_boundaries=para_boundaries,
             sent_boundaries=sent_boundaries
         )
@@ -720,24 +736,7 @@ def _chunk_text_with_adapter(
             # Ensure progress - take at least one character
             chunk_end = min(current_pos + 1, text_len)
         
-        # Extract chunk text
-        chunk_text = normalized[current_pos:chunk_end]
-        
-        # Create chunk with stable ID
-        chunk = Chunk(
-            source_id=source_id,
-            start_char=current_pos,
-            end_char=chunk_end,
-            text=chunk_text,
-            chunk_id=build_chunk_id(
-                source_id=source_id,
-                version=options.version,
-                start_char=current_pos,
-                end_char=chunk_end,
-                span_text=chunk_text,
-            ),
-        )
-        chunks.append(chunk)
+        spans.append((current_pos, chunk_end))
         
         if chunk_end >= text_len:
             break
@@ -747,15 +746,57 @@ def _chunk_text_with_adapter(
             text=normalized,
             chunk_end=chunk_end,
             options=options,
-            tokenizer=tokenizer,
+            tokenizer=counter,
             previous_chunk_start=current_pos  # Pass the current chunk start for validation
         )
         
         current_pos = max(next_start, current_pos + 1)  # Ensure progress
     
+    # Build chunks after the loop so each one can carry the count the overlap
+    # search took of its full text.
+    chunks: List[Chunk] = []
+    for start, end in spans:
+        chunk_text = normalized[start:end]
+        chunks.append(
+            Chunk(
+                source_id=source_id,
+                start_char=start,
+                end_char=end,
+                text=chunk_text,
+                chunk_id=build_chunk_id(
+                    source_id=source_id,
+                    version=options.version,
+                    start_char=start,
+                    end_char=end,
+                    span_text=chunk_text,
+                ),
+                token_count=counter.known_count(chunk_text),
+            )
+        )
     return chunks
 
 
+class _MemoizedCounter:
+    """count_tokens() proxy that remembers results for one chunking pass.
+
+    Failed counts are not cached, so a tokenizer error still reaches each
+    caller's own fallback.
+    """
+
+    def __init__(self, tokenizer: "TokenizerAdapter") -> None:
+        self._tokenizer = tokenizer
+        self._counts: Dict[str, "TokenCount"] = {}
+
+    def count_tokens(self, text: str) -> "TokenCount":
+        count = self._counts.get(text)
+        if count is None:
+            count = self._counts[text] = self._tokenizer.count_tokens(text)
+        return count
+
+    def known_count(self, text: str) -> Optional["TokenCount"]:
+        return self._counts.get(text)
+
+
 def _find_optimal_chunk_end(
     text: str,
     start_pos: int,
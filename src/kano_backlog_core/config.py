@@ -18,10 +18,12 @@ Topic selection is agent-scoped via active topic marker:
 _kano/backlog/.cache/worksets/active_topic.<agent>.txt
 """
 
+import copy
 import json
 import logging
 import re
 import os
+import threading
 import warnings
 from datetime import datetime, timezone
 from pathlib import Path
@@ -49,6 +51,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Parsed TOML config files keyed by path; the stat signature detects edits.
+_TOML_CACHE: dict[str, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+_TOML_CACHE_LOCK = threading.Lock()
+
 
 class BacklogContext(BaseModel):
     """Resolved backlog context with project and product roots."""
@@ -106,20 +112,33 @@ class ConfigLoader:
 
     @staticmethod
     def _read_toml_optional(path: Path) -> dict[str, Any]:
-        """Read TOML config file; return {} if not found."""
-        if not path.exists():
+        """Read TOML config file; return {} if not found.
+
+        Parsed files are cached until they change on disk; callers get a copy.
+        """
+        try:
+            st = path.stat()
+        except OSError:
             return {}
         if tomllib is None:
             logger.warning("tomllib/tomli not available; install tomli for TOML support")
             return {}
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        key = str(path.absolute())
+        with _TOML_CACHE_LOCK:
+            entry = _TOML_CACHE.get(key)
+        if entry is not None and entry[0] == signature:
+            return copy.deepcopy(entry[1])
         try:
             with open(path, "rb") as f:
                 data = tomllib.load(f)
             if not isinstance(data, dict):
                 raise ConfigError(f"Config TOML must be a table: {path}")
-            return data
         except Exception as e:
             raise ConfigError(f"Failed to load TOML from {path}: {e}")
+        with _TOML_CACHE_LOCK:
+            _TOML_CACHE[key] = (signature, data)
+        return copy.deepcopy(data)
 
     @staticmethod
     def _read_config_optional(base_path: Path, filename_stem: str) -> dict[str, Any]:
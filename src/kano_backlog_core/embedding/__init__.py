@@ -1,10 +1,11 @@
 from .adapter import EmbeddingAdapter
 from .factory import resolve_embedder
 from .noop import NoOpEmbeddingAdapter
-from .types import EmbeddingResult, EmbeddingTelemetry
+from .types import EmbeddingBatch, EmbeddingResult, EmbeddingTelemetry
 
 __all__ = [
     "EmbeddingAdapter",
+    "EmbeddingBatch",
     "EmbeddingResult",
     "EmbeddingTelemetry",
     "NoOpEmbeddingAdapter",
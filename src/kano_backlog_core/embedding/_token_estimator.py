@@ -0,0 +1,60 @@
+"""Branch-free token estimate over UTF-8 bytes (SWAR on Python big ints).
+
+The whole encoded text is loaded into one arbitrary-precision integer, one byte
+per 8-bit lane, and byte classes are tested with lane-wise bit masks. Every step
+is a single big-int operation implemented in C, so there is no per-character
+Python loop.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+_WHITESPACE = (0x20, 0x09, 0x0A, 0x0D)
+
+
+def _lanes(byte: int, n: int) -> int:
+    return int.from_bytes(bytes((byte,)) * n, "little")
+
+
+def _zero_lanes(x: int, low7: int, high: int) -> int:
+    """Return ``high`` bits set exactly for the zero bytes of ``x``."""
+    return high & ~(((x & low7) + low7) | x)
+
+
+def swar_counts(data: bytes) -> Tuple[int, int]:
+    """Return ``(words, non_ascii_chars)`` for UTF-8 ``data``.
+
+    ``words`` counts runs of non-whitespace bytes; ``non_ascii_chars`` counts
+    UTF-8 lead bytes (``0b11xxxxxx``), i.e. multi-byte characters.
+    """
+    n = len(data)
+    if n == 0:
+        return 0, 0
+
+    v = int.from_bytes(data, "little")
+    ones = _lanes(0x01, n)
+    low7 = ones * 0x7F
+    high = ones * 0x80
+
+    space = 0
+    for ch in _WHITESPACE:
+        space |= _zero_lanes(v ^ (ones * ch), low7, high)
+
+    # A word starts at a non-space byte whose previous lane is a space; lane 0
+    # is treated as preceded by a space.
+    word_starts = (high & ~space) & (((space << 8) | 0x80) & high)
+    # Bit 7 of (v << 1) is bit 6 of the same byte: lead bytes have both set.
+    lead_bytes = v & (v << 1) & high
+
+    return bin(word_starts).count("1"), bin(lead_bytes).count("1")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate tokens as whitespace-separated words plus multi-byte characters.
+
+    Tracks word-piece tokenizers more closely than ``len(text) // 4`` for prose
+    and for CJK text without spaces.
+    """
+    words, non_ascii = swar_counts(text.encode("utf-8"))
+    return words + non_ascii
@@ -1,25 +1,56 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
-from .types import EmbeddingResult
+from .types import EmbeddingBatch, EmbeddingResult
 
 
 class EmbeddingAdapter(ABC):
     """Abstract base class for embedding providers."""
 
-    def __init__(self, model_name: str):
+    def __init__(self, model_name: str, max_concurrent: int = 1):
         if not model_name:
             raise ValueError("model_name must be non-empty")
+        if max_concurrent <= 0:
+            raise ValueError("max_concurrent must be > 0")
         self._model_name = model_name
+        self._max_concurrent = int(max_concurrent)
+        # Created lazily inside the running loop (a Semaphore is bound to one loop).
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._sem_loop: Optional[asyncio.AbstractEventLoop] = None
 
     @property
     def model_name(self) -> str:
         return self._model_name
 
+    @property
+    def max_concurrent(self) -> int:
+        return self._max_concurrent
+
     @abstractmethod
     def embed_batch(self, texts: List[str]) -> List[EmbeddingResult]:
         """Generate embeddings for a batch of texts."""
         raise NotImplementedError
 
+    async def embed_batch_async(self, texts: List[str]) -> List[EmbeddingResult]:
+        """Run embed_batch() in a worker thread, at most max_concurrent at a time.
+
+        CPU-bound providers oversubscribe cores when many batches run at once, so
+        concurrent callers queue on a per-adapter semaphore instead.
+        """
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._sem_loop is not loop:
+            self._sem = asyncio.Semaphore(self._max_concurrent)
+            self._sem_loop = loop
+        async with self._sem:
+            return await loop.run_in_executor(None, self.embed_batch, texts)
+
+    def embed_batch_soa(self, texts: List[str]) -> EmbeddingBatch:
+        """Generate embeddings as a structure-of-arrays batch.
+
+        The default implementation columnarizes embed_batch(); adapters that can
+        write vectors straight into a contiguous buffer should override it.
+        """
+        return EmbeddingBatch.from_results(self.embed_batch(texts), self.model_name)
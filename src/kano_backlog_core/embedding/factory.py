@@ -2,129 +2,177 @@ from __future__ import annotations
 
 import importlib.util
 import os
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from .adapter import EmbeddingAdapter
-from .noop import NoOpEmbeddingAdapter
 
 
-def resolve_embedder(config: Dict[str, Any]) -> EmbeddingAdapter:
-    """Resolve embedding adapter from configuration."""
-
-    def resolve_env_ref(value: Any) -> Any:
-        if not isinstance(value, str):
-            return value
-        s = value.strip()
-        if not s.startswith("env:"):
-            return value
-        var = s[len("env:") :].strip()
-        if not var:
-            raise ValueError("Invalid env reference: 'env:' must include a variable name")
-        resolved = os.environ.get(var)
-        if resolved is None or not resolved.strip():
-            raise ValueError(f"Missing env var for secret reference: {var}")
-        return resolved
-
-    provider = str(config.get("provider", "noop")).strip().lower()
-    model_name = str(config.get("model", "noop-embedding")).strip()
-
-    if provider == "noop":
-        dimension = int(config.get("dimension", 1536))
-        return NoOpEmbeddingAdapter(model_name=model_name, dimension=dimension)
-
-    if provider == "openai":
-        api_key = resolve_env_ref(config.get("api_key"))
-        base_url = resolve_env_ref(config.get("base_url"))
-        dimension = config.get("dimension")
-        try:
-            from .openai_adapter import OpenAIEmbeddingAdapter
-
-            return OpenAIEmbeddingAdapter(
-                model_name=model_name, 
-                api_key=api_key,
-                base_url=base_url,
-                dimension=dimension
-            )
-        except ImportError as e:
-            raise ValueError(f"OpenAI adapter not available: {e}")
-
-    if provider in {"gemini", "google", "google-genai", "genai"}:
-        module_name = "google.genai"
-        try:
-            has_genai = importlib.util.find_spec(module_name) is not None
-        except ModuleNotFoundError:
-            has_genai = False
-
-        if not has_genai:
-            raise ValueError(
-                "google-genai adapter not available. Install with: pip install google-genai"
-            )
-
-        from .gemini_adapter import GeminiEmbeddingAdapter
-
-        options = config.get("options")
-        if isinstance(options, dict):
-            merged = dict(options)
-        else:
-            merged = {}
-
-        api_key = resolve_env_ref(config.get("api_key") or merged.get("api_key"))
-        output_dimensionality = (
-            config.get("output_dimensionality")
-            if "output_dimensionality" in config
-            else merged.get("output_dimensionality")
-        )
-        task_type = (
-            config.get("task_type") if "task_type" in config else merged.get("task_type")
-        )
-        dimension = config.get("dimension")
-
-        return GeminiEmbeddingAdapter(
+def _resolve_env_ref(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    s = value.strip()
+    if not s.startswith("env:"):
+        return value
+    var = s[len("env:") :].strip()
+    if not var:
+        raise ValueError("Invalid env reference: 'env:' must include a variable name")
+    resolved = os.environ.get(var)
+    if resolved is None or not resolved.strip():
+        raise ValueError(f"Missing env var for secret reference: {var}")
+    return resolved
+
+
+def _nested_options(config: Dict[str, Any]) -> Dict[str, Any]:
+    options = config.get("options")
+    if isinstance(options, dict):
+        # allow options nested under [embedding.options] as well as top-level
+        return dict(options)
+    return {}
+
+
+def _max_concurrent(config: Dict[str, Any]) -> int:
+    value = config.get("max_concurrent")
+    if value is None:
+        value = _nested_options(config).get("max_concurrent", 1)
+    return int(value)
+
+
+def _build_noop(config: Dict[str, Any], model_name: str) -> EmbeddingAdapter:
+    from .noop import NoOpEmbeddingAdapter
+
+    dimension = int(config.get("dimension", 1536))
+    hash_algorithm = str(config.get("hash_algorithm", "sha256"))
+    dtype = str(config.get("dtype", "float32"))
+    cache_size = int(config.get("cache_size", 4096))
+    token_estimator = str(config.get("token_estimator", "chars"))
+    workers = int(config.get("workers", 1))
+    return NoOpEmbeddingAdapter(
+        model_name=model_name,
+        dimension=dimension,
+        hash_algorithm=hash_algorithm,
+        dtype=dtype,
+        cache_size=cache_size,
+        max_concurrent=_max_concurrent(config),
+        token_estimator=token_estimator,
+        workers=workers,
+    )
+
+
+def _build_openai(config: Dict[str, Any], model_name: str) -> EmbeddingAdapter:
+    api_key = _resolve_env_ref(config.get("api_key"))
+    base_url = _resolve_env_ref(config.get("base_url"))
+    dimension = config.get("dimension")
+    try:
+        from .openai_adapter import OpenAIEmbeddingAdapter
+
+        return OpenAIEmbeddingAdapter(
             model_name=model_name,
             api_key=api_key,
-            output_dimensionality=output_dimensionality,
-            task_type=task_type,
+            base_url=base_url,
             dimension=dimension,
+            max_concurrent=_max_concurrent(config),
         )
+    except ImportError as e:
+        raise ValueError(f"OpenAI adapter not available: {e}")
+
 
-    if provider in {"sentence-transformers", "sentence_transformers", "huggingface"}:
-        # Optional dependency gate: do not download a model here, but ensure the
-        # library is available so config validation can fail fast.
-        module_name = "sentence" + "_" + "transformers"
-        if importlib.util.find_spec(module_name) is None:
-            raise ValueError(
-                "sentence-transformers adapter not available. Install with: pip install sentence-transformers"
-            )
-
-        from .sentence_transformers_adapter import SentenceTransformersEmbeddingAdapter
-
-        dimension = int(config.get("dimension", 0) or 0)
-        options = config.get("options")
-        if isinstance(options, dict):
-            # allow options nested under [embedding.options] as well as top-level
-            merged = dict(options)
-        else:
-            merged = {}
-
-        device = config.get("device") or merged.get("device")
-        batch_size = int(config.get("batch_size") or merged.get("batch_size") or 32)
-        normalize_embeddings = bool(
-            config.get("normalize_embeddings")
-            if "normalize_embeddings" in config
-            else merged.get("normalize_embeddings", False)
+def _build_gemini(config: Dict[str, Any], model_name: str) -> EmbeddingAdapter:
+    module_name = "google.genai"
+    try:
+        has_genai = importlib.util.find_spec(module_name) is not None
+    except ModuleNotFoundError:
+        has_genai = False
+
+    if not has_genai:
+        raise ValueError(
+            "google-genai adapter not available. Install with: pip install google-genai"
         )
-        max_seq_length = config.get("max_seq_length")
-        if max_seq_length is None:
-            max_seq_length = merged.get("max_seq_length")
 
-        return SentenceTransformersEmbeddingAdapter(
-            model_name=model_name,
-            dimension=dimension,
-            device=str(device) if device is not None else None,
-            batch_size=batch_size,
-            normalize_embeddings=normalize_embeddings,
-            max_seq_length=int(max_seq_length) if max_seq_length is not None else None,
+    from .gemini_adapter import GeminiEmbeddingAdapter
+
+    merged = _nested_options(config)
+
+    api_key = _resolve_env_ref(config.get("api_key") or merged.get("api_key"))
+    output_dimensionality = (
+        config.get("output_dimensionality")
+        if "output_dimensionality" in config
+        else merged.get("output_dimensionality")
+    )
+    task_type = (
+        config.get("task_type") if "task_type" in config else merged.get("task_type")
+    )
+    dimension = config.get("dimension")
+
+    return GeminiEmbeddingAdapter(
+        model_name=model_name,
+        api_key=api_key,
+        output_dimensionality=output_dimensionality,
+        task_type=task_type,
+        dimension=dimension,
+        max_concurrent=_max_concurrent(config),
+    )
+
+
+def _build_sentence_transformers(config: Dict[str, Any], model_name: str) -> EmbeddingAdapter:
+    # Optional dependency gate: do not download a model here, but ensure the
+    # library is available so config validation can fail fast.
+    module_name = "sentence" + "_" + "transformers"
+    if importlib.util.find_spec(module_name) is None:
+        raise ValueError(
+            "sentence-transformers adapter not available. Install with: pip install sentence-transformers"
         )
 
-    raise ValueError(f"Unknown embedding provider: {provider}")
+    from .sentence_transformers_adapter import SentenceTransformersEmbeddingAdapter
+
+    dimension = int(config.get("dimension", 0) or 0)
+    merged = _nested_options(config)
+
+    device = config.get("device") or merged.get("device")
+    batch_size = int(config.get("batch_size") or merged.get("batch_size") or 32)
+    normalize_embeddings = bool(
+        config.get("normalize_embeddings")
+        if "normalize_embeddings" in config
+        else merged.get("normalize_embeddings", False)
+    )
+    max_seq_length = config.get("max_seq_length")
+    if max_seq_length is None:
+        max_seq_length = merged.get("max_seq_length")
+
+    return SentenceTransformersEmbeddingAdapter(
+        model_name=model_name,
+        dimension=dimension,
+        device=str(device) if device is not None else None,
+        batch_size=batch_size,
+        normalize_embeddings=normalize_embeddings,
+        max_seq_length=int(max_seq_length) if max_seq_length is not None else None,
+        max_concurrent=_max_concurrent(config),
+    )
+
+
+# Provider name (and aliases) -> adapter builder. Builders import their adapter
+# module on first use, so resolving one provider never loads the others.
+_PROVIDERS: Dict[str, Callable[[Dict[str, Any], str], EmbeddingAdapter]] = {
+    "noop": _build_noop,
+    "openai": _build_openai,
+    "gemini": _build_gemini,
+    "google": _build_gemini,
+    "google-genai": _build_gemini,
+    "genai": _build_gemini,
+    "sentence-transformers": _build_sentence_transformers,
+    "sentence_transformers": _build_sentence_transformers,
+    "huggingface": _build_sentence_transformers,
+}
+
+
+def resolve_embedder(config: Dict[str, Any]) -> EmbeddingAdapter:
+    """Resolve embedding adapter from configuration."""
+    provider = str(config.get("provider", "noop")).strip().lower()
+    model_name = str(config.get("model", "noop-embedding")).strip()
 
+    builder = _PROVIDERS.get(provider)
+    if builder is None:
+        raise ValueError(
+            f"Unknown embedding provider: {provider} "
+            f"(available: {', '.join(_PROVIDERS)})"
+        )
+    return builder(config, model_name)
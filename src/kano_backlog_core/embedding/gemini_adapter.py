@@ -5,6 +5,7 @@
 
 from typing import Any, List, Optional
 import importlib
+import threading
 import time
 
 from ..tokenizer import TokenCount, resolve_model_max_tokens
@@ -22,8 +23,9 @@ class GeminiEmbeddingAdapter(EmbeddingAdapter):
         output_dimensionality: Optional[int] = None,
         task_type: Optional[str] = None,
         dimension: Optional[int] = None,
+        max_concurrent: int = 1,
     ) -> None:
-        super().__init__(model_name)
+        super().__init__(model_name, max_concurrent=max_concurrent)
 
         if output_dimensionality is not None and int(output_dimensionality) <= 0:
             raise ValueError("output_dimensionality must be > 0")
@@ -39,11 +41,18 @@ class GeminiEmbeddingAdapter(EmbeddingAdapter):
 
         self._client: Optional[Any] = None
         self._genai_types: Optional[Any] = None
+        # Concurrent batches (max_concurrent > 1) share one client and its
+        # connection pool instead of racing to create their own.
+        self._client_lock = threading.Lock()
 
     def _ensure_client(self) -> None:
         if self._client is not None:
             return
+        with self._client_lock:
+            if self._client is None:
+                self._create_client()
 
+    def _create_client(self) -> None:
         try:
             genai_module = importlib.import_module("google.genai")
             genai_types = importlib.import_module("google.genai.types")
@@ -57,13 +66,14 @@ class GeminiEmbeddingAdapter(EmbeddingAdapter):
         if client_factory is None:
             raise ImportError("google-genai client is missing Client")
 
+        # Publish the types before the client: _ensure_client's lock-free
+        # fast path only checks _client.
+        self._genai_types = genai_types
         if self._api_key:
             self._client = client_factory(api_key=self._api_key)
         else:
             self._client = client_factory()
 
-        self._genai_types = genai_types
-
     def embed_batch(self, texts: List[str]) -> List[EmbeddingResult]:
         self._ensure_client()
 
@@ -1,55 +1,408 @@
+import atexit
 import hashlib
+import importlib
+import logging
+import os
+import struct
+import threading
 import time
-from typing import List
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..tokenizer import TokenCount
+from ._token_estimator import estimate_tokens
 from .adapter import EmbeddingAdapter
-from .types import EmbeddingResult, EmbeddingTelemetry
+from .types import EmbeddingBatch, EmbeddingResult, EmbeddingTelemetry
+
+logger = logging.getLogger(__name__)
+
+HASH_ALGORITHMS = ("sha256", "blake3", "xxh128")
+DTYPES = ("float32", "int8")
+TOKEN_ESTIMATORS = ("chars", "swar")
+
+# Batches at or below this size are seeded inline; thread hand-off costs more.
+PARALLEL_THRESHOLD = 32
+
+# Dequantization factor for int8 noop vectors: byte b maps to q = b - 128, and
+# q * INT8_SCALE approximates the float value (2b - 255) / 255.
+INT8_SCALE = 2.0 / 255.0
+
+# Byte -> vector element lookup tables, stored as native-endian machine bytes so
+# synthesis is a table gather into an array buffer with no per-element
+# arithmetic or Python float objects.
+_FLOAT_LUT = tuple((b / 255.0) * 2 - 1 for b in range(256))
+_FLOAT_BYTES_LUT = tuple(struct.pack("=f", v) for v in _FLOAT_LUT)
+_INT8_TRANSLATE = bytes((b - 128) & 0xFF for b in range(256))
+
+# array typecode per dtype: one contiguous C buffer, still a Sequence.
+_TYPECODES = {"float32": "f", "int8": "b"}
+
+# Seeding pools shared by every adapter, keyed by worker count, so adapters
+# built per call (e.g. via the factory) do not each leave idle threads behind.
+_SEED_POOLS: Dict[int, ThreadPoolExecutor] = {}
+_SEED_POOLS_LOCK = threading.Lock()
+
+
+def _seed_pool(workers: int) -> ThreadPoolExecutor:
+    """Return the shared seeding pool with ``workers`` threads."""
+    with _SEED_POOLS_LOCK:
+        pool = _SEED_POOLS.get(workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="noop-embed")
+            _SEED_POOLS[workers] = pool
+        return pool
+
+
+def shutdown_seed_pools() -> None:
+    """Shut down the shared seeding pools (runs at interpreter exit)."""
+    with _SEED_POOLS_LOCK:
+        pools = list(_SEED_POOLS.values())
+        _SEED_POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+
+atexit.register(shutdown_seed_pools)
+
+
+@lru_cache(maxsize=None)
+def sha256_backend() -> Dict[str, str]:
+    """Describe the implementation behind ``hashlib.sha256``.
+
+    OpenSSL (``_hashlib``) uses SHA-NI / ARMv8 SHA instructions when the CPU has
+    them; CPython's built-in fallback is portable C without them.
+    """
+    module = type(hashlib.sha256()).__module__
+    try:
+        import ssl
+
+        openssl_version = ssl.OPENSSL_VERSION
+    except ImportError:
+        openssl_version = "unavailable"
+    backend = {
+        "implementation": "openssl" if module == "_hashlib" else "builtin",
+        "module": module,
+        "openssl_version": openssl_version,
+    }
+    logger.debug("noop sha256 backend: %s", backend)
+    return backend
+
+
+def _resolve_digest(hash_algorithm: str) -> Callable[[bytes], bytes]:
+    """Return a function mapping UTF-8 bytes to a 32-byte seed digest."""
+    if hash_algorithm == "sha256":
+        sha256_backend()
+        sha256 = hashlib.sha256
+        return lambda data: sha256(data).digest()
+
+    if hash_algorithm == "blake3":
+        try:
+            blake3 = getattr(importlib.import_module("blake3"), "blake3")
+        except Exception as e:
+            raise ImportError(
+                "blake3 package required for hash_algorithm='blake3'. "
+                "Install with: pip install blake3"
+            ) from e
+        return lambda data: blake3(data).digest(length=32)
+
+    if hash_algorithm == "xxh128":
+        try:
+            xxh128_digest = getattr(importlib.import_module("xxhash"), "xxh128_digest")
+        except Exception as e:
+            raise ImportError(
+                "xxhash package required for hash_algorithm='xxh128'. "
+                "Install with: pip install xxhash"
+            ) from e
+        # xxh128 yields 16 bytes; a second pass with a fixed seed widens it to 32.
+        return lambda data: xxh128_digest(data) + xxh128_digest(data, seed=1)
+
+    raise ValueError(
+        f"Unknown noop hash_algorithm: {hash_algorithm!r} "
+        f"(expected one of: {', '.join(HASH_ALGORITHMS)})"
+    )
+
+
+# Every supported hash_algorithm yields a 32-byte seed.
+DIGEST_SIZE = 32
+
+_Kernel = Tuple[Callable[[bytes], array], Callable[[bytes], bytes]]
+_KERNELS: Dict[Tuple[int, str], _Kernel] = {}
+
+
+def _float_period_bytes(seed: bytes) -> bytes:
+    return b"".join(map(_FLOAT_BYTES_LUT.__getitem__, seed))
+
+
+def _int8_period_bytes(seed: bytes) -> bytes:
+    return seed.translate(_INT8_TRANSLATE)
+
+
+def _make_kernel(dimension: int, dtype: str) -> _Kernel:
+    """Build ``(row, row_bytes)`` synthesizers specialised for ``dimension``.
+
+    Element ``i`` only depends on ``seed[i % DIGEST_SIZE]``, so a vector is the
+    per-byte values tiled to the requested dimension. The repeat count and tail
+    length are bound once here; when the dimension is a multiple of the digest
+    size (1536, 3072, ...) the tail slice and concatenation disappear entirely.
+    """
+    typecode = _TYPECODES[dtype]
+    period_bytes = _int8_period_bytes if dtype == "int8" else _float_period_bytes
+    reps, rem = divmod(dimension, DIGEST_SIZE)
+    tail = rem * array(typecode).itemsize
+
+    if rem == 0:
+
+        def row_bytes(seed: bytes) -> bytes:
+            return period_bytes(seed) * reps
+
+    else:
+
+        def row_bytes(seed: bytes) -> bytes:
+            period = period_bytes(seed)
+            return period * reps + period[:tail]
+
+    def row(seed: bytes) -> array:
+        vector = array(typecode)
+        vector.frombytes(row_bytes(seed))
+        return vector
+
+    return row, row_bytes
+
+
+def _get_kernel(dimension: int, dtype: str) -> _Kernel:
+    key = (dimension, dtype)
+    kernel = _KERNELS.get(key)
+    if kernel is None:
+        kernel = _KERNELS.setdefault(key, _make_kernel(dimension, dtype))
+    return kernel
+
+
+def _synthesize_batch_into(
+    out: array,
+    seeds: List[bytes],
+    row_bytes: Callable[[bytes], bytes],
+    row_size: int,
+    scratch: bytearray,
+) -> None:
+    """Append the vectors for ``seeds`` to ``out`` in one buffer write.
+
+    Rows of ``row_size`` bytes are assembled as machine bytes (table gather,
+    tiling by repetition) directly into ``scratch``, which must hold
+    ``len(seeds)`` rows, so no per-element Python objects or per-row buffers
+    outlive the call.
+    """
+    view = memoryview(scratch)
+    pos = 0
+    for seed in seeds:
+        view[pos : pos + row_size] = row_bytes(seed)
+        pos += row_size
+    out.frombytes(view[:pos])
+
+
+def _estimate_tokens_chars(text: str) -> int:
+    return len(text) // 4
 
 
 class NoOpEmbeddingAdapter(EmbeddingAdapter):
     """Deterministic NoOp adapter for testing.
 
-    It generates a pseudo-vector based on sha256(text), so it is stable across
-    platforms as long as UTF-8 encoding is used.
+    It generates a pseudo-vector based on a 32-byte digest of the UTF-8 text, so it
+    is stable across platforms. SHA-256 is the default; ``hash_algorithm="blake3"``
+    or ``"xxh128"`` trade vector compatibility with existing indexes for faster
+    seeding (optional dependencies). Vectors differ between algorithms, so an index
+    must be rebuilt after switching.
+
+    Seeds are memoized per text in a bounded LRU (``cache_size``, 0 disables).
+    With ``workers > 1`` (0 = ``os.cpu_count()``) batches larger than
+    PARALLEL_THRESHOLD are seeded in chunks on a bounded thread pool; hashlib
+    releases the GIL for inputs of 2 KiB and more, so long texts hash in parallel.
+
+    Vectors are ``array("f")`` (float32) sequences; ``dtype="int8"`` emits
+    ``array("b")`` integer vectors in [-128, 127] with
+    ``EmbeddingResult.scale == INT8_SCALE`` (4x smaller than float32 storage).
+
+    ``token_estimator="swar"`` replaces the ``len(text) // 4`` token estimate with
+    a word/multi-byte character count, so the adapter can stand in as a
+    token-count benchmark.
     """
 
-    def __init__(self, model_name: str = "noop-embedding", dimension: int = 1536):
-        super().__init__(model_name)
+    def __init__(
+        self,
+        model_name: str = "noop-embedding",
+        dimension: int = 1536,
+        hash_algorithm: str = "sha256",
+        dtype: str = "float32",
+        cache_size: int = 4096,
+        max_concurrent: int = 1,
+        token_estimator: str = "chars",
+        workers: int = 1,
+    ):
+        super().__init__(model_name, max_concurrent=max_concurrent)
         self._dimension = dimension
+        self._hash_algorithm = str(hash_algorithm).strip().lower()
+        digest = _resolve_digest(self._hash_algorithm)
+
+        def seed(text: str) -> bytes:
+            return digest(text.encode("utf-8"))
+
+        # Re-embedded texts (retries, duplicate chunks) skip encode + hash.
+        # Seeds are immutable bytes, so cached entries are safe to share.
+        self._seed: Callable[[str], bytes] = (
+            lru_cache(maxsize=cache_size)(seed) if cache_size > 0 else seed
+        )
+
+        self._dtype = str(dtype).strip().lower()
+        if self._dtype not in DTYPES:
+            raise ValueError(
+                f"Unknown noop dtype: {dtype!r} (expected one of: {', '.join(DTYPES)})"
+            )
+        self._scale: Optional[float] = INT8_SCALE if self._dtype == "int8" else None
+        self._synthesize_row, self._synthesize_row_bytes = _get_kernel(dimension, self._dtype)
+        self._token_estimator = str(token_estimator).strip().lower()
+        if self._token_estimator not in TOKEN_ESTIMATORS:
+            raise ValueError(
+                f"Unknown noop token_estimator: {token_estimator!r} "
+                f"(expected one of: {', '.join(TOKEN_ESTIMATORS)})"
+            )
+        self._estimate_tokens: Callable[[str], int] = (
+            estimate_tokens if self._token_estimator == "swar" else _estimate_tokens_chars
+        )
+        if workers < 0:
+            raise ValueError("workers must be >= 0")
+        self._workers = int(workers) or (os.cpu_count() or 1)
+        # Per-thread SoA row buffer, reused across batches (see _scratch_for).
+        self._scratch = threading.local()
+        # Telemetry fields that never vary between texts.
+        self._tokenizer_id = f"heuristic:{model_name}"
+        self._telemetry_fields: Dict[str, Any] = {
+            "provider_id": "noop",
+            "model_name": model_name,
+            "dimension": dimension,
+            "max_tokens": 8192,
+            "target_budget": 8192,
+            "safety_margin": 0,
+            "trimmed": False,
+            "warnings": None,
+        }
+
+    @property
+    def hash_algorithm(self) -> str:
+        return self._hash_algorithm
+
+    @property
+    def dtype(self) -> str:
+        return self._dtype
+
+    @property
+    def token_estimator(self) -> str:
+        return self._token_estimator
+
+    def _scratch_for(self, rows: int, itemsize: int) -> bytearray:
+        """Return this thread's reusable row buffer, grown to hold ``rows`` rows."""
+        needed = rows * self._dimension * itemsize
+        scratch: Optional[bytearray] = getattr(self._scratch, "buffer", None)
+        if scratch is None or len(scratch) < needed:
+            # Over-allocate so a slowly growing batch size does not regrow every call.
+            scratch = bytearray(max(64, rows * 2) * self._dimension * itemsize)
+            self._scratch.buffer = scratch
+        return scratch
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def _seed_chunk(self, texts: List[str]) -> List[bytes]:
+        seed = self._seed
+        return [seed(text) for text in texts]
+
+    def _seed_batch(self, texts: List[str]) -> List[bytes]:
+        """Hash every text of the batch, split across the worker pool if enabled."""
+        workers = self._workers
+        if workers <= 1 or len(texts) <= PARALLEL_THRESHOLD:
+            return self._seed_chunk(texts)
+
+        size = -(-len(texts) // workers)
+        chunks = [texts[i : i + size] for i in range(0, len(texts), size)]
+        seeds: List[bytes] = []
+        for part in _seed_pool(workers).map(self._seed_chunk, chunks):
+            seeds.extend(part)
+        return seeds
 
     def embed_batch(self, texts: List[str]) -> List[EmbeddingResult]:
+        t0 = time.perf_counter()
+        seeds = self._seed_batch(texts)
+
+        vectors = list(map(self._synthesize_row, seeds))
+
+        duration_ms = (time.perf_counter() - t0) * 1000
+        per_item_ms = duration_ms / max(1, len(texts))
+
+        # Telemetry is frozen and only varies by token count within a batch, so
+        # texts with the same estimated count share one instance.
+        estimate = self._estimate_tokens
+        telemetry_by_count: Dict[int, EmbeddingTelemetry] = {}
         results: List[EmbeddingResult] = []
-        for text in texts:
-            t0 = time.perf_counter()
-
-            h = hashlib.sha256(text.encode("utf-8")).digest()
-            vector: List[float] = []
-            for i in range(self._dimension):
-                b = h[i % len(h)]
-                vector.append((b / 255.0) * 2 - 1)
-
-            duration_ms = (time.perf_counter() - t0) * 1000
-
-            token_count_est = len(text) // 4
-            telemetry = EmbeddingTelemetry(
-                provider_id="noop",
-                model_name=self.model_name,
-                dimension=self._dimension,
-                token_count=TokenCount(
-                    count=token_count_est,
-                    method="heuristic",
-                    tokenizer_id=f"heuristic:{self.model_name}",
-                    is_exact=False,
-                ),
-                max_tokens=8192,
-                target_budget=8192,
-                safety_margin=0,
-                duration_ms=duration_ms,
-                trimmed=False,
-                warnings=None,
+        for text, vector in zip(texts, vectors):
+            token_count_est = estimate(text)
+            telemetry = telemetry_by_count.get(token_count_est)
+            if telemetry is None:
+                telemetry = EmbeddingTelemetry(
+                    token_count=TokenCount(
+                        count=token_count_est,
+                        method="heuristic",
+                        tokenizer_id=self._tokenizer_id,
+                        is_exact=False,
+                    ),
+                    duration_ms=per_item_ms,
+                    **self._telemetry_fields,
+                )
+                telemetry_by_count[token_count_est] = telemetry
+            results.append(
+                EmbeddingResult(vector=vector, telemetry=telemetry, scale=self._scale)
             )
-            results.append(EmbeddingResult(vector=vector, telemetry=telemetry))
 
         return results
 
+    def embed_batch_soa(self, texts: List[str]) -> EmbeddingBatch:
+        t0 = time.perf_counter()
+        seeds = self._seed_batch(texts)
+
+        dimension = self._dimension
+        vectors = array(_TYPECODES[self._dtype])
+        _synthesize_batch_into(
+            vectors,
+            seeds,
+            self._synthesize_row_bytes,
+            dimension * vectors.itemsize,
+            self._scratch_for(len(seeds), vectors.itemsize),
+        )
+
+        duration_ms = (time.perf_counter() - t0) * 1000
+        per_item_ms = duration_ms / max(1, len(texts))
+
+        tokenizer_id = self._tokenizer_id
+        estimate = self._estimate_tokens
+        fields = self._telemetry_fields
+        return EmbeddingBatch(
+            provider_id=fields["provider_id"],
+            model_name=self.model_name,
+            dimension=dimension,
+            vectors=vectors,
+            token_counts=[
+                TokenCount(
+                    count=estimate(text),
+                    method="heuristic",
+                    tokenizer_id=tokenizer_id,
+                    is_exact=False,
+                )
+                for text in texts
+            ],
+            durations_ms=[per_item_ms] * len(texts),
+            trimmed=[False] * len(texts),
+            max_tokens=fields["max_tokens"],
+            target_budget=fields["target_budget"],
+            safety_margin=fields["safety_margin"],
+            scale=self._scale,
+        )
@@ -1,6 +1,7 @@
 """OpenAI embedding adapter implementation."""
 
 from typing import List, Optional
+import threading
 import time
 
 from ..tokenizer import TokenCount, resolve_model_max_tokens
@@ -16,18 +17,26 @@ class OpenAIEmbeddingAdapter(EmbeddingAdapter):
         model_name: str = "text-embedding-3-small", 
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
-        dimension: Optional[int] = None
+        dimension: Optional[int] = None,
+        max_concurrent: int = 1,
     ):
-        super().__init__(model_name)
+        super().__init__(model_name, max_concurrent=max_concurrent)
         self._api_key = api_key
         self._base_url = base_url
         self._client = None
+        # Concurrent batches (max_concurrent > 1) share one client and its
+        # connection pool instead of racing to create their own.
+        self._client_lock = threading.Lock()
         self._dimension = dimension or (1536 if "small" in model_name else 3072)
         
     def _ensure_client(self):
         if self._client is not None:
             return
-            
+        with self._client_lock:
+            if self._client is None:
+                self._create_client()
+
+    def _create_client(self):
         try:
             import openai
         except ImportError:
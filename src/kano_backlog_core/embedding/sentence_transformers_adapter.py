@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import importlib
 import time
-from typing import Any, List, Optional
+from array import array
+from typing import Any, List, Optional, Sequence
 
 from ..tokenizer import TokenCount
 from .adapter import EmbeddingAdapter
@@ -21,8 +22,9 @@ class SentenceTransformersEmbeddingAdapter(EmbeddingAdapter):
         batch_size: int = 32,
         normalize_embeddings: bool = False,
         max_seq_length: Optional[int] = None,
+        max_concurrent: int = 1,
     ) -> None:
-        super().__init__(model_name)
+        super().__init__(model_name, max_concurrent=max_concurrent)
 
         if dimension <= 0:
             raise ValueError("dimension must be > 0")
@@ -83,7 +85,8 @@ class SentenceTransformersEmbeddingAdapter(EmbeddingAdapter):
         )
         duration_ms = (time.perf_counter() - t0) * 1000
 
-        # vectors may be a numpy array; we avoid importing numpy directly.
+        # vectors is normally an (N, D) numpy array (already unit length when
+        # normalize_embeddings is set); we avoid importing numpy directly.
         n = max(1, len(texts))
         per_item_ms = duration_ms / n
 
@@ -92,8 +95,13 @@ class SentenceTransformersEmbeddingAdapter(EmbeddingAdapter):
 
         for idx, text in enumerate(texts):
             vec_any = vectors[idx]
-            vector: List[float]
-            if hasattr(vec_any, "tolist"):
+            vector: Sequence[float]
+            if hasattr(vec_any, "astype"):
+                # Copy the numpy row into a compact array("f") in one C-level
+                # step rather than building a list of Python floats that the
+                # vector backend would immediately convert back to an array.
+                vector = array("f", vec_any.astype("=f4").tobytes())
+            elif hasattr(vec_any, "tolist"):
                 vector = vec_any.tolist()
             else:
                 vector = list(vec_any)
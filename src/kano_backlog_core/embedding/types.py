@@ -1,5 +1,6 @@
+from array import array
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from ..tokenizer import TokenCount
 
@@ -27,8 +28,101 @@ class EmbeddingTelemetry:
 
 @dataclass(frozen=True)
 class EmbeddingResult:
-    """Result of an embedding operation for a single text chunk."""
+    """Result of an embedding operation for a single text chunk.
 
-    vector: List[float]
+    Notes:
+    - scale is None for float vectors. Quantized (int8) vectors carry the factor
+      that maps them back to floats: ``float_vector ~= [q * scale for q in vector]``.
+      Cosine similarity is scale-invariant, so int8 rows can be compared directly.
+    - vector is any float sequence: a list for remote providers, a compact
+      ``array("f")`` / ``array("b")`` for the noop adapter. Call ``list()`` on it
+      where a real list is required (e.g. JSON encoding).
+    """
+
+    vector: Sequence[float]
     telemetry: EmbeddingTelemetry
+    scale: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class EmbeddingBatch:
+    """Structure-of-arrays result of embedding a batch of texts.
+
+    Notes:
+    - vectors is one contiguous row-major ``array("d")`` or ``array("f")``
+      (``array("b")`` when quantized, see ``scale``) holding
+      ``len(batch) * dimension`` values, so consumers can view it as an (N, D)
+      matrix (``memoryview``, ``numpy.frombuffer``) without re-gathering rows.
+    - Per-text telemetry is stored column-wise; fields that are constant for a
+      batch (provider, model, window policy) are stored once.
+    """
+
+    provider_id: str
+    model_name: str
+    dimension: int
+    vectors: array
+    token_counts: List[TokenCount]
+    durations_ms: List[float]
+    trimmed: List[bool]
+    max_tokens: int
+    target_budget: int
+    safety_margin: int = 0
+    scale: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self.token_counts)
+
+    def vector(self, index: int) -> List[float]:
+        """Return row ``index`` as a list of floats."""
+        start = index * self.dimension
+        return self.vectors[start : start + self.dimension].tolist()
+
+    def to_results(self) -> List[EmbeddingResult]:
+        """Unpack the batch into one EmbeddingResult per text."""
+        results: List[EmbeddingResult] = []
+        for i, token_count in enumerate(self.token_counts):
+            telemetry = EmbeddingTelemetry(
+                provider_id=self.provider_id,
+                model_name=self.model_name,
+                dimension=self.dimension,
+                token_count=token_count,
+                max_tokens=self.max_tokens,
+                target_budget=self.target_budget,
+                safety_margin=self.safety_margin,
+                duration_ms=self.durations_ms[i],
+                trimmed=self.trimmed[i],
+                warnings=None,
+            )
+            results.append(
+                EmbeddingResult(vector=self.vector(i), telemetry=telemetry, scale=self.scale)
+            )
+        return results
+
+    @classmethod
+    def from_results(
+        cls, results: Sequence[EmbeddingResult], model_name: str
+    ) -> "EmbeddingBatch":
+        """Build a batch from per-text results (batch-level fields come from the first)."""
+        scale = results[0].scale if results else None
+        first_vector = results[0].vector if results else None
+        if isinstance(first_vector, array):
+            vectors = array(first_vector.typecode)
+        else:
+            vectors = array("d" if scale is None else "b")
+        for res in results:
+            vectors.extend(res.vector)
 
+        first = results[0].telemetry if results else None
+        return cls(
+            provider_id=first.provider_id if first else "",
+            model_name=first.model_name if first else model_name,
+            dimension=first.dimension if first else 0,
+            vectors=vectors,
+            token_counts=[r.telemetry.token_count for r in results],
+            durations_ms=[r.telemetry.duration_ms for r in results],
+            trimmed=[r.telemetry.trimmed for r in results],
+            max_tokens=first.max_tokens if first else 0,
+            target_budget=first.target_budget if first else 0,
+            safety_margin=first.safety_margin if first else 0,
+            scale=scale,
+        )
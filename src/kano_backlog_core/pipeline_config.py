@@ -33,6 +33,28 @@ class TokenizerConfig:
         
         return load_tokenizer_config(config_dict=config_dict)
 
+# Texts per embed_batch call when embedding.options has no batch_size.
+# Hosted APIs cap a request by input count and total tokens (Gemini: 100 inputs;
+# OpenAI: 2048 inputs but ~300k tokens, i.e. ~512 chunks of max 512 tokens).
+# sentence-transformers sub-batches internally, so bigger calls only amortise
+# per-call overhead.
+_EMBED_BATCH_SIZES: Dict[str, int] = {
+    "openai": 512,
+    "gemini": 100,
+    "google": 100,
+    "google-genai": 100,
+    "genai": 100,
+    "sentence-transformers": 128,
+    "sentence_transformers": 128,
+    "huggingface": 128,
+}
+_DEFAULT_EMBED_BATCH_SIZE = 256
+
+# Index builds commit the vector backend every this many upserted chunks so a
+# large build never holds one unbounded transaction.
+_DEFAULT_PERSIST_INTERVAL = 1024
+
+
 @dataclass
 class EmbeddingConfig:
     provider: str = "noop"
@@ -40,6 +62,18 @@ class EmbeddingConfig:
     dimension: int = 1536
     options: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def index_batch_size(self) -> int:
+        """Number of texts to send per embed_batch call while indexing."""
+        value = self.options.get("batch_size")
+        if value is None:
+            provider = str(self.provider).strip().lower()
+            return _EMBED_BATCH_SIZES.get(provider, _DEFAULT_EMBED_BATCH_SIZE)
+        size = int(value)
+        if size <= 0:
+            raise ValueError("embedding batch_size must be > 0")
+        return size
+
 @dataclass
 class VectorConfig:
     enabled: bool = False
@@ -48,6 +82,14 @@ class VectorConfig:
     metric: str = "cosine"
     options: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def persist_interval(self) -> int:
+        """Chunks to upsert between backend.persist() calls while indexing (0: only at the end)."""
+        interval = int(self.options.get("persist_interval", _DEFAULT_PERSIST_INTERVAL))
+        if interval < 0:
+            raise ValueError("vector persist_interval must be >= 0")
+        return interval
+
 @dataclass
 class PipelineConfig:
     chunking: ChunkingOptions
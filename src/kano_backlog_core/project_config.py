@@ -5,8 +5,9 @@ files that can define multiple products and their backlog root locations.
 """
 
 import logging
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, validator
 
@@ -23,6 +24,11 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Parsed project configs keyed by file path. A single CLI command resolves the
+# project config many times; the stat signature detects edits on disk.
+_PROJECT_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int, int], "ProjectConfig"]] = {}
+_PROJECT_CONFIG_CACHE_LOCK = threading.Lock()
+
 
 class ProductDefinition(BaseModel):
     """Definition of a product in project config."""
@@ -180,10 +186,29 @@ class ProjectConfigLoader:
 
     @staticmethod
     def load_project_config(config_path: Path) -> ProjectConfig:
-        """Load project configuration from .kano/backlog_config.toml."""
-        if not config_path.exists():
+        """Load project configuration from .kano/backlog_config.toml.
+
+        Parsed configs are cached per path until the file changes; callers get
+        their own deep copy.
+        """
+        try:
+            st = config_path.stat()
+        except OSError:
             raise ConfigError(f"Project config file not found: {config_path}")
-        
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        key = str(config_path.absolute())
+        with _PROJECT_CONFIG_CACHE_LOCK:
+            entry = _PROJECT_CONFIG_CACHE.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1].model_copy(deep=True)
+
+        config = ProjectConfigLoader._parse_project_config(config_path)
+        with _PROJECT_CONFIG_CACHE_LOCK:
+            _PROJECT_CONFIG_CACHE[key] = (signature, config)
+        return config.model_copy(deep=True)
+
+    @staticmethod
+    def _parse_project_config(config_path: Path) -> ProjectConfig:
         if tomllib is None:
             raise ConfigError(
                 "TOML support not available. Install tomli package: pip install tomli"
@@ -1,7 +1,7 @@
 """Reference parsing and resolution for backlog items."""
 
 import re
-from typing import Optional, List, Tuple
+from typing import Callable, Iterable, Optional, List, Tuple
 from pathlib import Path
 
 from .models import BacklogItem
@@ -180,13 +180,9 @@ class RefResolver:
                 return item
 
         # Fall back to canonical search
-        for item_path in self.canonical.list_items():
-            try:
-                item = self.canonical.read(item_path)
-                if item.id == display_id:
-                    return item
-            except Exception:
-                pass
+        item = self._find_by_id(display_id)
+        if item:
+            return item
 
         raise RefNotFoundError(display_id)
 
@@ -204,13 +200,9 @@ class RefResolver:
             if item:
                 return item
 
-        for item_path in self.canonical.list_items():
-            try:
-                item = self.canonical.read(item_path)
-                if item.id == display_id:
-                    return item
-            except Exception:
-                pass
+        item = self._find_by_id(display_id)
+        if item:
+            return item
 
         raise RefNotFoundError(display_id)
 
@@ -225,15 +217,49 @@ class RefResolver:
                 return item
 
         # Fall back to canonical search
-        for item_path in self.canonical.list_items():
+        item = self._scan_canonical(
+            self.canonical.list_items(), uid, lambda candidate: candidate.uid == uid
+        )
+        if item:
+            return item
+
+        raise RefNotFoundError(uid)
+
+    def _find_by_id(self, display_id: str) -> Optional[BacklogItem]:
+        """Find a canonical item by display ID, trying ``{id}_*.md`` file names first."""
+        def matches(candidate: BacklogItem) -> bool:
+            return candidate.id == display_id
+
+        named = (
+            path
+            for path in self.canonical.items_root.rglob(f"{display_id}_*.md")
+            if not path.name.endswith(".index.md")
+        )
+        return self._scan_canonical(named, display_id, matches) or self._scan_canonical(
+            self.canonical.list_items(), display_id, matches
+        )
+
+    def _scan_canonical(
+        self,
+        paths: Iterable[Path],
+        needle: str,
+        matches: Callable[[BacklogItem], bool],
+    ) -> Optional[BacklogItem]:
+        """Return the first item in ``paths`` that satisfies ``matches``.
+
+        Files whose text does not contain ``needle`` are skipped before the
+        (much slower) frontmatter parse.
+        """
+        for item_path in paths:
             try:
+                if needle not in item_path.read_text(encoding="utf-8"):
+                    continue
                 item = self.canonical.read(item_path)
-                if item.uid == uid:
+                if matches(item):
                     return item
             except Exception:
                 pass
-
-        raise RefNotFoundError(uid)
+        return None
 
     def get_references(self, item: BacklogItem) -> List[str]:
         """Extract all references from an item's content."""
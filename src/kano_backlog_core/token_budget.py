@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from .chunking import ChunkingOptions, build_chunk_id, chunk_text, token_spans
 from .tokenizer import TokenCount, TokenizerAdapter
@@ -79,8 +79,45 @@ class TokenBudgetManager:
                 original_token_count=0
             )
         
-        original_count = self.tokenizer.count_tokens(text)
+        return self._apply_counted(text, self.tokenizer.count_tokens(text))
+    
+    def apply_budget_many(
+        self,
+        texts: List[str],
+        known_counts: Optional[Sequence[Optional[TokenCount]]] = None,
+    ) -> List[BudgetResult]:
+        """Apply the token budget to several texts, in order.
+        
+        Texts are counted with one tokenizer.count_tokens_many() call, so
+        adapters with a batched backend tokenize them together; only texts
+        over budget pay for further counting while trimming.
         
+        Args:
+            texts: Input texts to apply budget to
+            known_counts: Optional counts already taken with this tokenizer,
+                parallel to texts (e.g. Chunk.token_count); None entries are
+                counted as usual
+            
+        Returns:
+            One BudgetResult per text, same as apply_budget()
+        """
+        if known_counts is None:
+            known_counts = [None] * len(texts)
+        elif len(known_counts) != len(texts):
+            raise ValueError("known_counts must match texts in length")
+        uncounted = [
+            text for text, known in zip(texts, known_counts) if text and known is None
+        ]
+        counts = iter(self.tokenizer.count_tokens_many(uncounted) if uncounted else [])
+        return [
+            self._apply_counted(text, known if known is not None else next(counts))
+            if text
+            else self.apply_budget(text)
+            for text, known in zip(texts, known_counts)
+        ]
+    
+    def _apply_counted(self, text: str, original_count: TokenCount) -> BudgetResult:
+        """Budget a non-empty text whose token count is already known."""
         if original_count.count <= self.effective_max:
             return BudgetResult(
                 text=text,
@@ -259,6 +296,32 @@ def enforce_token_budget(
     Returns:
         TokenBudgetResult with trimmed content and counts.
     """
+    return enforce_token_budget_many([text], tokenizer, max_tokens=max_tokens, policy=policy)[0]
+
+
+def enforce_token_budget_many(
+    texts: List[str],
+    tokenizer: TokenizerAdapter,
+    max_tokens: Optional[int] = None,
+    policy: Optional[TokenBudgetPolicy] = None,
+    known_counts: Optional[Sequence[Optional[TokenCount]]] = None,
+) -> List[TokenBudgetResult]:
+    """Enforce token budget on several texts (legacy interface, batched).
+
+    Same results as calling enforce_token_budget() per text, but all texts are
+    counted in one tokenizer.count_tokens_many() call.
+
+    Args:
+        texts: Raw input texts.
+        tokenizer: Tokenizer adapter to count tokens.
+        max_tokens: Optional max tokens override.
+        policy: Optional policy override.
+        known_counts: Optional counts already taken with ``tokenizer``, see
+            TokenBudgetManager.apply_budget_many().
+
+    Returns:
+        One TokenBudgetResult per text, in order.
+    """
     if policy is None:
         policy = TokenBudgetPolicy()
 
@@ -278,17 +341,17 @@ def enforce_token_budget(
     )
     manager = TokenBudgetManager(temp_options, tokenizer)
     
-    # Use the new manager to apply budget
-    result = manager.apply_budget(text)
-    
-    # Convert to legacy format
-    return TokenBudgetResult(
-        content=result.text,
-        token_count=result.token_count,
-        trimmed=result.was_trimmed,
-        target_budget=target_budget,
-        safety_margin=safety_margin,
-    )
+    # Use the new manager to apply budget, converting to legacy format
+    return [
+        TokenBudgetResult(
+            content=result.text,
+            token_count=result.token_count,
+            trimmed=result.was_trimmed,
+            target_budget=target_budget,
+            safety_margin=safety_margin,
+        )
+        for result in manager.apply_budget_many(texts, known_counts)
+    ]
 
 
 def budget_chunks(
@@ -312,9 +375,9 @@ def budget_chunks(
     )
     manager = TokenBudgetManager(effective_options, tokenizer)
     
-    for chunk in chunks:
-        # Apply budget using the new manager
-        budget_result = manager.apply_budget(chunk.text)
+    # Apply budget using the new manager, counting all chunks in one call
+    budget_results = manager.apply_budget_many([chunk.text for chunk in chunks])
+    for chunk, budget_result in zip(chunks, budget_results):
         
         # Calculate end character position based on trimmed text
         end_char = chunk.start_char + len(budget_result.text)
@@ -17,7 +17,7 @@ import threading
 import time
 from dataclasses import dataclass, field
 from functools import lru_cache
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
@@ -328,6 +328,32 @@ class CachingTokenizerAdapter:
         
         return result
     
+    def count_tokens_many(self, texts: List[str]) -> List[Any]:
+        """Count tokens for several texts, batching the cache misses.
+
+        Hits are served from the cache; the misses go to the wrapped adapter's
+        count_tokens_many in one call so its native batching is used.
+        """
+        adapter_id = self._wrapped_adapter.adapter_id
+        model_name = self._wrapped_adapter.model_name
+        results: List[Any] = [None] * len(texts)
+        miss_indices: List[int] = []
+        for i, text in enumerate(texts):
+            cached_result = self._cache.get(text, adapter_id, model_name) if text else None
+            if cached_result is not None:
+                results[i] = cached_result
+            else:
+                miss_indices.append(i)
+
+        if miss_indices:
+            computed = self._wrapped_adapter.count_tokens_many([texts[i] for i in miss_indices])
+            for i, result in zip(miss_indices, computed):
+                results[i] = result
+                # Don't cache empty strings; only cache successful results
+                if texts[i] and result.count >= 0:
+                    self._cache.put(texts[i], adapter_id, model_name, result)
+        return results
+    
     def max_tokens(self) -> int:
         """Return the max token budget for the model."""
         return self._wrapped_adapter.max_tokens()
@@ -138,6 +138,29 @@ class AlertThresholds:
     alert_window_minutes: int = 5  # Time window for alert evaluation
 
 
+class OperationTracker:
+    """Collects the outcome of one tracked operation (see track_operation)."""
+
+    __slots__ = ("collector", "result_set", "token_count", "error_occurred", "error_type", "error_message")
+
+    def __init__(self, collector_ref: "TelemetryCollector"):
+        self.collector = collector_ref
+        self.result_set = False
+        self.token_count: Optional[TokenCount] = None
+        self.error_occurred = False
+        self.error_type: Optional[str] = None
+        self.error_message: Optional[str] = None
+
+    def set_result(self, result: TokenCount):
+        self.token_count = result
+        self.result_set = True
+
+    def set_error(self, error: Exception):
+        self.error_occurred = True
+        self.error_type = type(error).__name__
+        self.error_message = str(error)[:200]  # Truncate long error messages
+
+
 class TelemetryCollector:
     """Centralized telemetry collection for tokenizer operations."""
     
@@ -174,7 +197,7 @@ class TelemetryCollector:
             # Update adapter statistics
             self._update_adapter_stats(telemetry)
             
-            logger.debug(f"Recorded telemetry for operation {telemetry.operation_id}")
+            logger.debug("Recorded telemetry for operation %s", telemetry.operation_id)
     
     def _update_adapter_stats(self, telemetry: TokenizationTelemetry) -> None:
         """Update adapter usage statistics."""
@@ -240,27 +263,6 @@ class TelemetryCollector:
             start_memory = None
         timestamp = datetime.now()
         
-        error_occurred = False
-        error_type = None
-        error_message = None
-        token_count = None
-        
-        class OperationTracker:
-            def __init__(self, collector_ref):
-                self.collector = collector_ref
-                self.result_set = False
-            
-            def set_result(self, result: TokenCount):
-                nonlocal token_count
-                token_count = result
-                self.result_set = True
-            
-            def set_error(self, error: Exception):
-                nonlocal error_occurred, error_type, error_message
-                error_occurred = True
-                error_type = type(error).__name__
-                error_message = str(error)[:200]  # Truncate long error messages
-        
         tracker = OperationTracker(self)
         
         try:
@@ -290,14 +292,14 @@ class TelemetryCollector:
                 model_name=model_name,
                 text_length=len(text),
                 text_preview=text[:100],
-                token_count=token_count or TokenCount(0, "unknown", "unknown", False),
+                token_count=tracker.token_count or TokenCount(0, "unknown", "unknown", False),
                 processing_time_ms=processing_time_ms,
                 memory_used_mb=memory_used_mb,
                 was_fallback=was_fallback,
                 fallback_from=fallback_from,
-                error_occurred=error_occurred,
-                error_type=error_type,
-                error_message=error_message,
+                error_occurred=tracker.error_occurred,
+                error_type=tracker.error_type,
+                error_message=tracker.error_message,
                 metadata=metadata or {}
             )
             
@@ -355,7 +357,7 @@ class TelemetryCollector:
             for telemetry in self._telemetry_history:
                 record = asdict(telemetry)
                 record["timestamp"] = telemetry.timestamp.isoformat()
-                record["token_count"] = asdict(telemetry.token_count)
+                record["token_count"] = dict(telemetry.token_count._asdict())
                 data["telemetry_records"].append(record)
         
         if format.lower() == "json":
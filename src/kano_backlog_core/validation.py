@@ -1,8 +1,52 @@
 """Validation logic for backlog items."""
 
-from typing import List, Tuple
+from operator import attrgetter
+from typing import Callable, Dict, List, Tuple
 from .models import BacklogItem, ItemType
 
+# Required fields per type, as (attribute_name, display_name)
+_READY_REQUIREMENTS: Dict[ItemType, List[Tuple[str, str]]] = {
+    ItemType.EPIC: [
+        ("context", "Context"),
+        ("goal", "Goal"),
+    ],
+    ItemType.FEATURE: [
+        ("context", "Context"),
+        ("goal", "Goal"),
+        ("acceptance_criteria", "Acceptance Criteria"),
+    ],
+    ItemType.USER_STORY: [
+        ("context", "Context"),
+        ("goal", "Goal"),
+        ("acceptance_criteria", "Acceptance Criteria"),
+    ],
+    ItemType.TASK: [
+        ("context", "Context"),
+        ("goal", "Goal"),
+        ("approach", "Approach"),
+        ("acceptance_criteria", "Acceptance Criteria"),
+        ("risks", "Risks / Dependencies"),
+    ],
+    ItemType.BUG: [
+        ("context", "Context"),
+        ("goal", "Goal"),
+        ("approach", "Approach"),
+        ("acceptance_criteria", "Acceptance Criteria"),
+        ("risks", "Risks / Dependencies"),
+    ],
+}
+
+# Per type: one attrgetter fetching every required field as a tuple, plus the
+# matching display names. Built once instead of on every is_ready call.
+_READY_GETTERS: Dict[ItemType, Tuple[Callable[[BacklogItem], tuple], Tuple[str, ...]]] = {
+    item_type: (
+        attrgetter(*[attr for attr, _ in fields]),
+        tuple(name for _, name in fields),
+    )
+    for item_type, fields in _READY_REQUIREMENTS.items()
+}
+
+
 def is_ready(item: BacklogItem) -> Tuple[bool, List[str]]:
     """
     Check if item meets Ready gate criteria tailored by item type.
@@ -18,48 +62,15 @@ def is_ready(item: BacklogItem) -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, missing_fields)
     """
-    # Define required fields per type
-    # Using tuple of (attribute_name, display_name)
-    type_requirements = {
-        ItemType.EPIC: [
-            ("context", "Context"),
-            ("goal", "Goal"),
-        ],
-        ItemType.FEATURE: [
-            ("context", "Context"),
-            ("goal", "Goal"),
-            ("acceptance_criteria", "Acceptance Criteria"),
-        ],
-        ItemType.USER_STORY: [
-            ("context", "Context"),
-            ("goal", "Goal"),
-            ("acceptance_criteria", "Acceptance Criteria"),
-        ],
-        ItemType.TASK: [
-            ("context", "Context"),
-            ("goal", "Goal"),
-            ("approach", "Approach"),
-            ("acceptance_criteria", "Acceptance Criteria"),
-            ("risks", "Risks / Dependencies"),
-        ],
-        ItemType.BUG: [
-            ("context", "Context"),
-            ("goal", "Goal"),
-            ("approach", "Approach"),
-            ("acceptance_criteria", "Acceptance Criteria"),
-            ("risks", "Risks / Dependencies"),
-        ],
-    }
-    
-    required_fields = type_requirements.get(item.type, [])
-    
-    missing = []
-    
-    for field_attr, field_name in required_fields:
-        value = getattr(item, field_attr, None)
-        
-        # Check if value is None or empty string (whitespace only)
-        if value is None or (isinstance(value, str) and not value.strip()):
-            missing.append(field_name)
-            
+    getter = _READY_GETTERS.get(item.type)
+    if getter is None:
+        return True, []
+    get_values, names = getter
+
+    # Missing means None or empty string (whitespace only)
+    missing = [
+        name
+        for name, value in zip(names, get_values(item))
+        if value is None or (isinstance(value, str) and not value.strip())
+    ]
     return len(missing) == 0, missing
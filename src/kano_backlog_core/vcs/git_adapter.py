@@ -1,9 +1,77 @@
 """Git VCS adapter."""
 
+import os
 import subprocess
 from pathlib import Path
+from typing import Dict, Hashable, Optional, Tuple
 from .base import VcsAdapter, VcsMeta
 
+# repo_root -> (ref state key, (revno, label)). git status still runs on every
+# call for the hash, branch and dirty state.
+_REF_METADATA_CACHE: Dict[Path, Tuple[Hashable, Tuple[str, Optional[str]]]] = {}
+
+
+def _parse_status(output: str) -> Tuple[str, str, str]:
+    """Return (hash, branch, dirty) from `git status --porcelain=v2 --branch`.
+
+    Raises ValueError for an unborn HEAD ("(initial)"), which has no commit.
+    """
+    commit_hash = branch = None
+    dirty = "false"
+    for line in output.splitlines():
+        if line.startswith("# branch.oid "):
+            commit_hash = line[len("# branch.oid ") :]
+        elif line.startswith("# branch.head "):
+            branch = line[len("# branch.head ") :]
+        elif line and not line.startswith("#"):
+            dirty = "true"
+    if not commit_hash or commit_hash == "(initial)" or not branch:
+        raise ValueError("HEAD has no commit")
+    if branch == "(detached)":
+        branch = "HEAD"
+    return commit_hash, branch, dirty
+
+
+def _ref_state_key(repo_root: Path) -> Optional[Hashable]:
+    """Cheap fingerprint of what revno/describe depend on.
+
+    Reads .git/HEAD and the loose ref it points to (both tiny), and stats
+    packed-refs and every loose tag under refs/tags. Returns None when .git is not a plain directory
+    (worktrees, submodules), in which case nothing is cached.
+    """
+    git_dir = repo_root / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    ref_value = None
+    if head.startswith("ref: "):
+        try:
+            ref_value = (git_dir / head[5:]).read_text(encoding="utf-8").strip()
+        except OSError:
+            ref_value = None  # packed or unborn; covered by packed-refs below
+    try:
+        st = (git_dir / "packed-refs").stat()
+        packed = (st.st_ino, st.st_mtime_ns, st.st_size)
+    except OSError:
+        packed = None
+    return head, ref_value, packed, _loose_tags_key(git_dir / "refs" / "tags")
+
+
+def _loose_tags_key(tags_dir: Path) -> Tuple[Tuple[str, int, int, int], ...]:
+    """Stat every loose tag ref, including ones nested in subfolders (rel/v2)."""
+    entries = []
+    for dirpath, _dirnames, filenames in os.walk(tags_dir):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, st.st_ino, st.st_mtime_ns, st.st_size))
+    entries.sort()
+    return tuple(entries)
+
 
 class GitAdapter:
     """Git VCS adapter."""
@@ -15,59 +83,24 @@ class GitAdapter:
     def get_metadata(self, repo_root: Path) -> VcsMeta:
         """Get Git metadata."""
         try:
-            # Get hash (commit hash)
-            commit_hash = subprocess.check_output(
-                ["git", "rev-parse", "HEAD"],
+            # Hash, branch and dirty state from one call. -uno ignores untracked
+            # files, like the previous diff-index check.
+            status = subprocess.check_output(
+                ["git", "--no-optional-locks", "status", "--porcelain=v2", "--branch", "-uno"],
                 cwd=repo_root,
                 stderr=subprocess.DEVNULL,
                 text=True
-            ).strip()
-            
-            # Get branch (or HEAD when detached)
-            try:
-                branch = subprocess.check_output(
-                    ["git", "symbolic-ref", "--short", "HEAD"],
-                    cwd=repo_root,
-                    stderr=subprocess.DEVNULL,
-                    text=True
-                ).strip()
-            except subprocess.CalledProcessError:
-                branch = "HEAD"  # detached
-
-            # Get revno (commit count on HEAD)
-            revno = "unknown"
-            try:
-                revno = subprocess.check_output(
-                    ["git", "rev-list", "--count", "HEAD"],
-                    cwd=repo_root,
-                    stderr=subprocess.DEVNULL,
-                    text=True,
-                ).strip()
-            except subprocess.CalledProcessError:
-                pass
-            
-            # Get label (describe)
-            label = None
-            try:
-                label = subprocess.check_output(
-                    ["git", "describe", "--tags", "--always"],
-                    cwd=repo_root,
-                    stderr=subprocess.DEVNULL,
-                    text=True
-                ).strip()
-            except subprocess.CalledProcessError:
-                pass
-            
-            # Check if dirty
-            try:
-                subprocess.check_output(
-                    ["git", "diff-index", "--quiet", "HEAD", "--"],
-                    cwd=repo_root,
-                    stderr=subprocess.DEVNULL
-                )
-                dirty = "false"
-            except subprocess.CalledProcessError:
-                dirty = "true"
+            )
+            commit_hash, branch, dirty = _parse_status(status)
+
+            state = _ref_state_key(repo_root)
+            cached = _REF_METADATA_CACHE.get(repo_root) if state is not None else None
+            if cached is not None and cached[0] == state:
+                revno, label = cached[1]
+            else:
+                revno, label = self._read_history_metadata(repo_root)
+                if state is not None:
+                    _REF_METADATA_CACHE[repo_root] = (state, (revno, label))
             
             return VcsMeta(
                 provider="git",
@@ -86,3 +119,32 @@ class GitAdapter:
                 ref="unknown",
                 dirty="unknown"
             )
+
+    @staticmethod
+    def _read_history_metadata(repo_root: Path) -> Tuple[str, Optional[str]]:
+        """Return (revno, label) for HEAD."""
+        # Get revno (commit count on HEAD)
+        revno = "unknown"
+        try:
+            revno = subprocess.check_output(
+                ["git", "rev-list", "--count", "HEAD"],
+                cwd=repo_root,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            ).strip()
+        except subprocess.CalledProcessError:
+            pass
+
+        # Get label (describe)
+        label = None
+        try:
+            label = subprocess.check_output(
+                ["git", "describe", "--tags", "--always"],
+                cwd=repo_root,
+                stderr=subprocess.DEVNULL,
+                text=True
+            ).strip()
+        except subprocess.CalledProcessError:
+            pass
+
+        return revno, label
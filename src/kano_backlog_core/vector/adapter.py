@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 from .types import VectorChunk, VectorQueryResult
 
@@ -26,6 +26,22 @@ class VectorBackendAdapter(ABC):
         """Insert or update a chunk vector."""
         pass
 
+    def upsert_many(self, chunks: Iterable[VectorChunk]) -> None:
+        """Insert or update several chunk vectors.
+
+        Backends with a cheaper bulk path should override this.
+        """
+        for chunk in chunks:
+            self.upsert(chunk)
+
+    def stored_vectors_for_texts(self, texts: Iterable[str]) -> Dict[str, Any]:
+        """Return {text: vector} for texts already stored with a vector.
+
+        Lets index builds skip embedding text they have embedded before.
+        Backends that cannot look vectors up by text return nothing.
+        """
+        return {}
+
     @abstractmethod
     def delete(self, chunk_id: str) -> None:
         """Delete a chunk by ID."""
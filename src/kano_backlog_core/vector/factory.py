@@ -42,6 +42,8 @@ def get_backend(config: Dict[str, Any]) -> VectorBackendAdapter:
         collection = str(config.get("collection", "backlog"))
         embedding_space_id = config.get("embedding_space_id")
         storage_format = str(config.get("storage_format", "binary"))
+        quantization = str(config.get("quantization", "none"))
+        mmap_size = int(config.get("mmap_size", 0))
         from .sqlite_backend import SQLiteVectorBackend
 
         return SQLiteVectorBackend(
@@ -49,6 +51,8 @@ def get_backend(config: Dict[str, Any]) -> VectorBackendAdapter:
             collection=collection,
             embedding_space_id=str(embedding_space_id) if embedding_space_id else None,
             storage_format=storage_format,
+            quantization=quantization,
+            mmap_size=mmap_size,
         )
 
     raise ValueError(f"Unknown vector backend: {backend_type}")
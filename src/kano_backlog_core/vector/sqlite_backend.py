@@ -7,13 +7,19 @@ Local-first and dependency-minimal:
 Notes:
 - This backend is keyed by a single embedding space (dims + metric). If the on-disk
   schema indicates a mismatch, it fails fast.
+- Scoring uses NumPy when it is installed (the optional `vector` extra) and falls
+  back to pure Python otherwise.
 """
 
 from __future__ import annotations
 
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 import hashlib
+import heapq
 import json
 import sqlite3
 import struct
@@ -23,6 +29,38 @@ from .adapter import VectorBackendAdapter
 from .types import VectorChunk, VectorQueryResult
 
 
+def _text_digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+@lru_cache(maxsize=None)
+def _numpy() -> Any:
+    """Return the numpy module, or None when it is not installed."""
+    try:
+        import numpy as np  # type: ignore
+    except ImportError:
+        return None
+    return np
+
+
+# Rows dequantized per block when scoring int8 codes, and how many candidates
+# per requested result are re-ranked with the full float32 vectors.
+_QUANT_BLOCK_ROWS = 8192
+_QUANT_RERANK_FACTOR = 4
+
+
+@dataclass
+class _VectorMatrix:
+    """All stored vectors of a collection stacked for one-shot scoring."""
+
+    data_version: int
+    chunk_ids: List[str]
+    index: Dict[str, int]
+    matrix: Any  # np.ndarray (N, dims) float32, or int8 codes when quantized
+    norms: Any  # np.ndarray (N,) float32 row L2 norms (of the dequantized rows)
+    scales: Any = None  # np.ndarray (N,) float32 per-row int8 scale, if quantized
+
+
 class SQLiteVectorBackend(VectorBackendAdapter):
     """Vector backend using SQLite (optional sqlite-vec extension)."""
 
@@ -33,15 +71,40 @@ class SQLiteVectorBackend(VectorBackendAdapter):
         *,
         embedding_space_id: Optional[str] = None,
         storage_format: str = "binary",
+        quantization: str = "none",
+        mmap_size: int = 0,
     ):
         self._base_path = Path(path)
         self._collection = collection
         self._embedding_space_id = (embedding_space_id or "").strip() or None
-        self._storage_format = storage_format if storage_format in ("binary", "json") else "binary"
+        # "binary" stores float32 blobs, "float16" half-size blobs (decoded back to
+        # float32 on read), "json" debug-friendly text.
+        self._storage_format = (
+            storage_format if storage_format in ("binary", "float16", "json") else "binary"
+        )
+        # "int8" additionally stores int8 codes per vector; NumPy queries then keep
+        # only the codes in memory and re-rank a shortlist with the float vectors.
+        self._quantization = quantization if quantization in ("none", "int8") else "none"
+        # Bytes of the DB file SQLite may read through a memory map (PRAGMA
+        # mmap_size); 0 keeps SQLite's default read() path.
+        self._mmap_size = max(0, int(mmap_size))
         self._conn: Optional[sqlite3.Connection] = None
         self._dims: Optional[int] = None
         self._metric: Optional[str] = None
         self._db_path: Optional[Path] = None
+        # Lazily built NumPy matrix of stored vectors; dropped on local writes and
+        # rebuilt when another connection commits (PRAGMA data_version).
+        self._matrix: Optional[_VectorMatrix] = None
+        # Whether the {collection}_vec sqlite-vec table exists on this connection,
+        # and the data_version at which it was last confirmed in sync with _chunks.
+        self._has_vec0 = False
+        self._vec0_synced_version: Optional[int] = None
+        # Cosine DBs created by this version store unit-length vectors (meta
+        # "normalized"=1), so cosine scoring is a plain dot product.
+        self._normalized = False
+        # Lazily built map of _text_digest(text) -> chunk_id for stored rows, so
+        # index builds can reuse the vector of an already-embedded text.
+        self._text_digests: Optional[Dict[bytes, str]] = None
 
     def _resolve_db_path(self) -> Path:
         if self._base_path.suffix:
@@ -127,10 +190,24 @@ class SQLiteVectorBackend(VectorBackendAdapter):
             self._conn.execute("PRAGMA temp_store=MEMORY")
         except sqlite3.OperationalError:
             pass
+        if self._mmap_size:
+            # Vector scans then read pages straight from the OS page cache
+            # instead of copying them into SQLite's own cache first.
+            try:
+                self._conn.execute(f"PRAGMA mmap_size={self._mmap_size}")
+            except sqlite3.OperationalError:
+                pass
 
         # Attempt to load vec extension (optional)
         try:
             self._conn.enable_load_extension(True)
+            try:
+                import sqlite_vec  # type: ignore
+
+                sqlite_vec.load(self._conn)
+                return
+            except (ImportError, sqlite3.OperationalError):
+                pass
             for ext_name in ["vec0", "vec", "sqlite-vec"]:
                 try:
                     self._conn.load_extension(ext_name)
@@ -140,6 +217,43 @@ class SQLiteVectorBackend(VectorBackendAdapter):
         except (sqlite3.OperationalError, AttributeError):
             pass
 
+    def _invalidate_caches(self) -> None:
+        self._matrix = None
+        self._vec0_synced_version = None
+
+    def _detect_vec0(self) -> bool:
+        """Return True when the vec0 table exists and the extension is loaded."""
+        assert self._conn is not None
+        try:
+            self._conn.execute(f"SELECT chunk_id FROM {self._collection}_vec LIMIT 0")
+        except sqlite3.OperationalError:
+            return False
+        return True
+
+    def _vec0_in_sync(self) -> bool:
+        """Return True when every stored chunk also has a row in the vec0 table.
+
+        vec0 writes are best-effort, so a DB written without the extension (or by
+        an older version) can have a partial vec0 table; those fall back to the scan.
+        """
+        assert self._conn is not None
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if self._vec0_synced_version == data_version:
+            return True
+        try:
+            (n_vec,) = self._conn.execute(
+                f"SELECT COUNT(*) FROM {self._collection}_vec"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return False
+        (n_chunks,) = self._conn.execute(
+            f"SELECT COUNT(*) FROM {self._collection}_chunks"
+        ).fetchone()
+        if n_vec != n_chunks:
+            return False
+        self._vec0_synced_version = data_version
+        return True
+
     def _validate_metric(self, metric: str) -> str:
         m = metric.strip().lower()
         if m not in {"cosine", "l2", "ip"}:
@@ -159,6 +273,14 @@ class SQLiteVectorBackend(VectorBackendAdapter):
         row = cur.fetchone()
         return row[0] if row else None
 
+    def _has_rows(self) -> bool:
+        assert self._conn is not None
+        try:
+            cur = self._conn.execute(f"SELECT 1 FROM {self._collection}_chunks LIMIT 1")
+        except sqlite3.OperationalError:
+            return False
+        return cur.fetchone() is not None
+
     def prepare(self, schema: Dict[str, Any], dims: int, metric: str = "cosine") -> None:
         self._ensure_connection()
         assert self._conn is not None
@@ -167,6 +289,7 @@ class SQLiteVectorBackend(VectorBackendAdapter):
             raise ValueError("dims must be positive")
 
         metric_norm = self._validate_metric(metric)
+        self._invalidate_caches()
 
         self._conn.execute(
             "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
@@ -187,9 +310,18 @@ class SQLiteVectorBackend(VectorBackendAdapter):
         self._dims = dims
         self._metric = metric_norm
 
+        # Only start normalizing on an empty collection; existing rows were
+        # stored as-is and mixing both would skew cosine scores.
+        normalized = self._read_meta("normalized")
+        if normalized is None:
+            normalized = "1" if metric_norm == "cosine" and not self._has_rows() else "0"
+        self._normalized = normalized == "1"
+
         self._write_meta("dims", str(dims))
         self._write_meta("metric", metric_norm)
+        self._write_meta("normalized", normalized)
         self._write_meta("storage_format", self._storage_format)
+        self._write_meta("quantization", self._quantization)
         if self._embedding_space_id:
             self._write_meta("embedding_space_id", self._embedding_space_id)
         self._write_meta("schema_version", "1")
@@ -200,10 +332,17 @@ class SQLiteVectorBackend(VectorBackendAdapter):
                 chunk_id TEXT PRIMARY KEY,
                 text TEXT NOT NULL,
                 metadata_json TEXT NOT NULL,
-                vector_json TEXT NOT NULL
+                vector_json TEXT NOT NULL,
+                vector_i8 BLOB
             )
             """
         )
+        columns = {
+            row[1]
+            for row in self._conn.execute(f"PRAGMA table_info({self._collection}_chunks)")
+        }
+        if "vector_i8" not in columns:
+            self._conn.execute(f"ALTER TABLE {self._collection}_chunks ADD COLUMN vector_i8 BLOB")
 
         # Optional vec0 virtual table creation (ignored if extension missing)
         try:
@@ -219,15 +358,64 @@ class SQLiteVectorBackend(VectorBackendAdapter):
             )
         except sqlite3.OperationalError:
             pass
+        self._has_vec0 = self._detect_vec0()
 
         self._conn.commit()
         
         self._write_metadata_file()
 
     def upsert(self, chunk: VectorChunk) -> None:
+        self.upsert_many([chunk])
+
+    def upsert_many(self, chunks: Iterable[VectorChunk]) -> None:
+        """Insert or replace a batch of chunks with one executemany per table.
+
+        Like :meth:`upsert`, rows join the connection's open transaction and
+        are committed by :meth:`persist`.
+        """
         self._ensure_connection()
         assert self._conn is not None
 
+        rows = []
+        vec_rows = []
+        for chunk in chunks:
+            row, vec_blob = self._encode_chunk(chunk)
+            rows.append(row)
+            if self._has_vec0:
+                vec_rows.append((chunk.chunk_id, vec_blob))
+        if not rows:
+            return
+        self._invalidate_caches()
+        if self._text_digests is not None:
+            for row in rows:
+                self._text_digests[_text_digest(row[1])] = row[0]
+
+        self._conn.executemany(
+            f"""
+            INSERT OR REPLACE INTO {self._collection}_chunks
+            (chunk_id, text, metadata_json, vector_json, vector_i8)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+        # Optional: sync vec0 table if present (vec0 takes raw float32 blobs)
+        if vec_rows:
+            try:
+                # vec0 has no upsert; replace by delete + insert.
+                self._conn.executemany(
+                    f"DELETE FROM {self._collection}_vec WHERE chunk_id = ?",
+                    [(chunk_id,) for chunk_id, _ in vec_rows],
+                )
+                self._conn.executemany(
+                    f"INSERT INTO {self._collection}_vec (chunk_id, embedding) VALUES (?, ?)",
+                    vec_rows,
+                )
+            except sqlite3.OperationalError:
+                pass
+
+    def _encode_chunk(self, chunk: VectorChunk) -> Tuple[Tuple[Any, ...], Optional[bytes]]:
+        """Validate a chunk and return its table row plus its vec0 float32 blob."""
         if chunk.vector is None:
             raise ValueError("chunk.vector must not be None")
         if self._dims is not None and len(chunk.vector) != self._dims:
@@ -235,31 +423,43 @@ class SQLiteVectorBackend(VectorBackendAdapter):
                 f"Vector dims mismatch: expected={self._dims} got={len(chunk.vector)}"
             )
 
+        vector = chunk.vector
+        if self._normalized:
+            if self._storage_format != "json" and getattr(vector, "dtype", None) is None:
+                # Normalizing a Python list costs ~0.6ms at 1536 dims, the
+                # largest share of an index build's write stage; NumPy does it
+                # in a few microseconds and the blob is packed from it anyway.
+                np = _numpy()
+                if np is not None:
+                    vector = np.asarray(vector, dtype=np.float64)
+            vector = self._unit_vector(vector)
         if self._storage_format == "binary":
-            vector_data = struct.pack(f'{len(chunk.vector)}f', *chunk.vector)
+            if isinstance(vector, array) and vector.typecode == "f":
+                # Already packed float32 in native order, same as struct '{n}f'.
+                vector_data = vector.tobytes()
+            elif getattr(vector, "dtype", None) is not None:
+                # NumPy array (e.g. straight from an embedder): one C-level cast.
+                vector_data = vector.astype("=f4").tobytes()
+            else:
+                vector_data = struct.pack(f'{len(vector)}f', *vector)
+            vec_blob = vector_data
+        elif self._storage_format == "float16":
+            # Half the bytes on disk; every reader tells the two blob layouts
+            # apart by length (2 vs 4 bytes per dimension).
+            if getattr(vector, "dtype", None) is not None:
+                vector_data = vector.astype("=f2").tobytes()
+            else:
+                vector_data = struct.pack(f"{len(vector)}e", *vector)
+            vec_blob = struct.pack(f"{len(vector)}f", *vector) if self._has_vec0 else None
         else:
-            vector_data = json.dumps(chunk.vector, separators=(",", ":"), ensure_ascii=True)
-        
-        metadata_json = json.dumps(chunk.metadata or {}, sort_keys=True, separators=(",", ":"))
-
-        self._conn.execute(
-            f"""
-            INSERT OR REPLACE INTO {self._collection}_chunks
-            (chunk_id, text, metadata_json, vector_json)
-            VALUES (?, ?, ?, ?)
-            """,
-            (chunk.chunk_id, chunk.text, metadata_json, vector_data),
-        )
+            if not isinstance(vector, list):
+                vector = list(vector)
+            vector_data = json.dumps(vector, separators=(",", ":"), ensure_ascii=True)
+            vec_blob = struct.pack(f"{len(vector)}f", *vector) if self._has_vec0 else None
 
-        # Optional: sync vec0 table if present
-        try:
-            vec_data = json.dumps(chunk.vector, separators=(",", ":")).encode("utf-8")
-            self._conn.execute(
-                f"INSERT OR REPLACE INTO {self._collection}_vec (chunk_id, embedding) VALUES (?, ?)",
-                (chunk.chunk_id, vec_data),
-            )
-        except sqlite3.OperationalError:
-            pass
+        metadata_json = json.dumps(chunk.metadata or {}, sort_keys=True, separators=(",", ":"))
+        vector_i8 = self._quantize_int8(vector) if self._quantization == "int8" else None
+        return (chunk.chunk_id, chunk.text, metadata_json, vector_data, vector_i8), vec_blob
 
     def list_chunk_ids(self) -> List[str]:
         """Return all chunk_ids currently stored in this collection."""
@@ -278,6 +478,8 @@ class SQLiteVectorBackend(VectorBackendAdapter):
         self._ensure_connection()
         assert self._conn is not None
 
+        self._invalidate_caches()
+        self._text_digests = None
         cur = self._conn.cursor()
         cur.execute("CREATE TEMP TABLE IF NOT EXISTS tmp_keep (chunk_id TEXT PRIMARY KEY)")
         cur.execute("DELETE FROM tmp_keep")
@@ -311,9 +513,66 @@ class SQLiteVectorBackend(VectorBackendAdapter):
 
         self._conn.commit()
 
+    def stored_vectors_for_texts(self, texts: Iterable[str]) -> Dict[str, Any]:
+        """Return {text: stored vector} for texts some stored chunk already has.
+
+        The database is specific to one embedding space, so a chunk whose text
+        is already stored (e.g. under a chunk_id that moved because earlier
+        text in its section changed) can take that vector instead of being
+        embedded again. Vectors come back as stored; cosine DBs hold them unit
+        length, which upserting them again leaves as is.
+        """
+        self._ensure_connection()
+        assert self._conn is not None
+
+        if self._text_digests is None:
+            self._text_digests = {
+                _text_digest(text): str(chunk_id)
+                for chunk_id, text in self._conn.execute(
+                    f"SELECT chunk_id, text FROM {self._collection}_chunks"
+                )
+            }
+        wanted: Dict[str, str] = {}
+        for text in texts:
+            chunk_id = self._text_digests.get(_text_digest(text))
+            if chunk_id is not None:
+                wanted[chunk_id] = text
+        if not wanted:
+            return {}
+
+        found: Dict[str, Any] = {}
+        chunk_ids = list(wanted)
+        for i in range(0, len(chunk_ids), 900):
+            batch = chunk_ids[i : i + 900]
+            placeholders = ",".join(["?"] * len(batch))
+            cursor = self._conn.execute(
+                f"SELECT chunk_id, text, vector_json FROM {self._collection}_chunks "
+                f"WHERE chunk_id IN ({placeholders})",
+                tuple(batch),
+            )
+            for chunk_id, text, vector_data in cursor:
+                # Rows may have changed under another connection since the
+                # digests were read; only reuse an exact text match.
+                if text != wanted.get(str(chunk_id)):
+                    continue
+                try:
+                    if isinstance(vector_data, bytes) and len(vector_data) == 2 * (self._dims or 0):
+                        vector: Any = list(struct.unpack(f"{self._dims}e", vector_data))
+                    elif isinstance(vector_data, bytes):
+                        vector = array("f", vector_data)
+                    else:
+                        vector = json.loads(vector_data)
+                except (json.JSONDecodeError, TypeError, ValueError):
+                    continue
+                if self._dims is None or len(vector) == self._dims:
+                    found[text] = vector
+        return found
+
     def delete(self, chunk_id: str) -> None:
         self._ensure_connection()
         assert self._conn is not None
+        self._invalidate_caches()
+        self._text_digests = None
 
         self._conn.execute(
             f"DELETE FROM {self._collection}_chunks WHERE chunk_id = ?", (chunk_id,)
@@ -336,7 +595,9 @@ class SQLiteVectorBackend(VectorBackendAdapter):
                 f"Query vector dims mismatch: expected={self._dims} got={len(vector)}"
             )
 
-        # MVP: brute-force scan for correctness. (vec0, if present, can be used later.)
+        # With sqlite-vec, unfiltered queries run as a vec0 KNN MATCH. Otherwise
+        # this is a brute-force scan: with NumPy, all stored vectors are kept as one float32 matrix and scored
+        # with a single matrix-vector product; otherwise rows are scored one by one.
         #
         # Supported filters (SQLite backend only):
         # - filters={"chunk_ids": ["...", ...]} limits the scan to a candidate set.
@@ -344,17 +605,27 @@ class SQLiteVectorBackend(VectorBackendAdapter):
         if filters and isinstance(filters, dict):
             chunk_ids = filters.get("chunk_ids")
 
-        base_sql = (
-            f"SELECT chunk_id, text, metadata_json, vector_json FROM {self._collection}_chunks"
-        )
-
-        cursor = None
-        chunk_id_set = None
+        chunk_ids_list: Optional[List[str]] = None
         if chunk_ids is not None:
             chunk_ids_list = [str(x) for x in list(chunk_ids)]
             if not chunk_ids_list:
                 return []
 
+        if chunk_ids_list is None and self._has_vec0 and self._vec0_in_sync():
+            if k <= 0:
+                return []
+            return self._query_vec0(vector, k)
+
+        np = _numpy()
+        if np is not None:
+            return self._query_matrix(np, vector, k, chunk_ids_list)
+
+        # Only ids and vectors are scanned; text/metadata are loaded for the top k.
+        base_sql = f"SELECT chunk_id, vector_json FROM {self._collection}_chunks"
+
+        cursor = None
+        chunk_id_set = None
+        if chunk_ids_list is not None:
             # SQLite has a variable limit (commonly 999). For large candidate sets,
             # fall back to filtering in Python.
             if len(chunk_ids_list) <= 900:
@@ -367,31 +638,266 @@ class SQLiteVectorBackend(VectorBackendAdapter):
         else:
             cursor = self._conn.execute(base_sql)
 
-        results: List[VectorQueryResult] = []
-        for chunk_id, text, metadata_json, vector_data in cursor:
-            if chunk_id_set is not None and str(chunk_id) not in chunk_id_set:
-                continue
+        if self._normalized and (self._metric or "cosine") == "cosine":
+            # Stored vectors are unit length: cosine is a dot with the unit query.
+            unit_query = self._unit_vector(vector)
+
+            def score_row(stored_vector: Any) -> float:
+                if len(stored_vector) != len(unit_query):
+                    return float("-inf")
+                return self._dot(unit_query, stored_vector)
+        else:
+            def score_row(stored_vector: Any) -> float:
+                return self._score(vector, stored_vector)
+
+        def scored_rows() -> Iterator[Tuple[float, str]]:
+            for chunk_id, vector_data in cursor:
+                if chunk_id_set is not None and str(chunk_id) not in chunk_id_set:
+                    continue
+                try:
+                    if isinstance(vector_data, bytes) and len(vector_data) == 2 * len(vector):
+                        stored_vector = struct.unpack(f"{len(vector)}e", vector_data)
+                    elif isinstance(vector_data, bytes):
+                        # array('f') reads the struct '{n}f' layout directly; much
+                        # cheaper than struct.unpack into a list.
+                        stored_vector = array("f", vector_data)
+                    else:
+                        stored_vector = json.loads(vector_data)
+                except (json.JSONDecodeError, TypeError, ValueError):
+                    continue
+                yield score_row(stored_vector), str(chunk_id)
+
+        # nlargest keeps k rows in memory and ranks ties like a stable sort.
+        picked = [
+            (chunk_id, score)
+            for score, chunk_id in heapq.nlargest(k, scored_rows(), key=lambda row: row[0])
+        ]
+        return self._build_results(picked)
+
+    def _load_matrix(self, np: Any, dims: int) -> _VectorMatrix:
+        """Return the stacked stored vectors, rebuilding them when stale."""
+        assert self._conn is not None
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        cached = self._matrix
+        if (
+            cached is not None
+            and cached.data_version == data_version
+            and cached.matrix.shape[1] == dims
+        ):
+            return cached
+
+        quantized = self._quantization == "int8"
+        chunk_ids: List[str] = []
+        rows: List[Any] = []
+        scales: List[float] = []
+        if quantized:
+            cursor = self._conn.execute(
+                f"SELECT chunk_id, vector_json, vector_i8 FROM {self._collection}_chunks"
+            )
+        else:
+            cursor = self._conn.execute(
+                f"SELECT chunk_id, vector_json, NULL FROM {self._collection}_chunks"
+            )
+        for chunk_id, vector_data, vector_i8 in cursor:
             try:
-                if isinstance(vector_data, bytes):
-                    stored_vector = list(struct.unpack(f'{len(vector_data)//4}f', vector_data))
+                if quantized and vector_i8 is None:
+                    # Row written before int8 was enabled: quantize on load.
+                    vector_i8 = self._quantize_int8(self._decode_vector(np, vector_data, dims))
+                if quantized:
+                    scale = np.frombuffer(vector_i8, dtype=np.float32, count=1)[0]
+                    row = np.frombuffer(vector_i8, dtype=np.int8, offset=4)
                 else:
-                    stored_vector = json.loads(vector_data)
-            except (json.JSONDecodeError, TypeError, struct.error):
+                    row = self._decode_vector(np, vector_data, dims)
+            except (json.JSONDecodeError, TypeError, ValueError):
+                continue
+            if row.shape != (dims,):
                 continue
+            chunk_ids.append(str(chunk_id))
+            rows.append(row)
+            if quantized:
+                scales.append(scale)
+
+        dtype = np.int8 if quantized else np.float32
+        matrix = np.vstack(rows) if rows else np.empty((0, dims), dtype=dtype)
+        if quantized:
+            scale_arr = np.asarray(scales, dtype=np.float32)
+            norms = np.linalg.norm(matrix.astype(np.float32), axis=1) * scale_arr
+        else:
+            scale_arr = None
+            norms = np.linalg.norm(matrix, axis=1)
+        self._matrix = _VectorMatrix(
+            data_version=data_version,
+            chunk_ids=chunk_ids,
+            index={chunk_id: i for i, chunk_id in enumerate(chunk_ids)},
+            matrix=matrix,
+            norms=norms,
+            scales=scale_arr,
+        )
+        return self._matrix
 
-            score = self._score(vector, stored_vector)
+    @staticmethod
+    def _decode_vector(np: Any, vector_data: Any, dims: int) -> Any:
+        if isinstance(vector_data, bytes):
+            if len(vector_data) == 2 * dims:
+                return np.frombuffer(vector_data, dtype=np.float16).astype(np.float32)
+            return np.frombuffer(vector_data, dtype=np.float32)
+        return np.asarray(json.loads(vector_data), dtype=np.float32)
+
+    def _query_matrix(
+        self,
+        np: Any,
+        vector: List[float],
+        k: int,
+        chunk_ids: Optional[List[str]],
+    ) -> List[VectorQueryResult]:
+        """Score every candidate with one matrix-vector product and keep the top k."""
+        assert self._conn is not None
+        query = np.asarray(vector, dtype=np.float32)
+        cache = self._load_matrix(np, query.shape[0])
 
-            try:
-                metadata = json.loads(metadata_json) if metadata_json else {}
-            except json.JSONDecodeError:
-                metadata = {}
+        if chunk_ids is not None:
+            rows = np.fromiter(
+                {cache.index[c]: None for c in chunk_ids if c in cache.index},
+                dtype=np.intp,
+            )
+        else:
+            rows = np.arange(len(cache.chunk_ids))
+        if k <= 0 or rows.shape[0] == 0:
+            return []
+
+        if cache.scales is not None:
+            return self._query_quantized(np, cache, rows, query, k)
+
+        matrix, norms = cache.matrix, cache.norms
+        if chunk_ids is not None:
+            matrix, norms = matrix[rows], norms[rows]
+        scores = self._matrix_scores(np, matrix, norms, query)
+        top = self._top_k(np, scores, k)
+        picked = [(cache.chunk_ids[int(rows[i])], float(scores[i])) for i in top]
+        return self._build_results(picked)
+
+    def _query_quantized(
+        self, np: Any, cache: _VectorMatrix, rows: Any, query: Any, k: int
+    ) -> List[VectorQueryResult]:
+        """Shortlist with the int8 codes, then re-rank with the stored float vectors."""
+        assert self._conn is not None
+        coarse = np.empty(rows.shape[0], dtype=np.float32)
+        # Dequantize in blocks so the float32 temporaries stay small.
+        for start in range(0, rows.shape[0], _QUANT_BLOCK_ROWS):
+            block = rows[start : start + _QUANT_BLOCK_ROWS]
+            dequant = cache.matrix[block].astype(np.float32)
+            dequant *= cache.scales[block, None]
+            coarse[start : start + block.shape[0]] = self._matrix_scores(
+                np, dequant, cache.norms[block], query
+            )
+
+        shortlist = [
+            cache.chunk_ids[int(rows[i])]
+            for i in self._top_k(np, coarse, max(k * _QUANT_RERANK_FACTOR, k + 32))
+        ]
+        exact_ids: List[str] = []
+        exact_rows: List[Any] = []
+        for i in range(0, len(shortlist), 900):
+            batch = shortlist[i : i + 900]
+            placeholders = ",".join(["?"] * len(batch))
+            cursor = self._conn.execute(
+                f"SELECT chunk_id, vector_json FROM {self._collection}_chunks "
+                f"WHERE chunk_id IN ({placeholders})",
+                tuple(batch),
+            )
+            for chunk_id, vector_data in cursor:
+                try:
+                    row = self._decode_vector(np, vector_data, query.shape[0])
+                except (json.JSONDecodeError, TypeError, ValueError):
+                    continue
+                if row.shape == query.shape:
+                    exact_ids.append(str(chunk_id))
+                    exact_rows.append(row)
+        if not exact_rows:
+            return []
+
+        # Keep shortlist order so that ties rank the same as the unquantized path.
+        order = {chunk_id: i for i, chunk_id in enumerate(shortlist)}
+        ranked = sorted(range(len(exact_ids)), key=lambda i: order[exact_ids[i]])
+        matrix = np.vstack([exact_rows[i] for i in ranked])
+        scores = self._matrix_scores(np, matrix, np.linalg.norm(matrix, axis=1), query)
+        picked = [(exact_ids[ranked[i]], float(scores[i])) for i in self._top_k(np, scores, k)]
+        return self._build_results(picked)
+
+    def _matrix_scores(self, np: Any, matrix: Any, norms: Any, query: Any) -> Any:
+        """Score each row of ``matrix`` against ``query``; higher is better."""
+        metric = self._metric or "cosine"
+        if metric == "ip":
+            return matrix @ query
+        if metric == "l2":
+            # negative distance so that higher score is better
+            return -np.linalg.norm(matrix - query, axis=1)
+        if self._normalized:
+            query_norm = np.linalg.norm(query)
+            return matrix @ (query / query_norm) if query_norm else np.zeros(matrix.shape[0])
+        denom = norms * np.linalg.norm(query)
+        dots = matrix @ query
+        return np.divide(dots, denom, out=np.zeros_like(dots), where=denom != 0)
+
+    @staticmethod
+    def _top_k(np: Any, scores: Any, k: int) -> Any:
+        """Indices of the k best scores, best first (ties keep row order)."""
+        if k < scores.shape[0]:
+            top = np.argpartition(-scores, k - 1)[:k]
+            top.sort()
+        else:
+            top = np.arange(scores.shape[0])
+        return top[np.argsort(-scores[top], kind="stable")]
 
+    def _query_vec0(self, vector: List[float], k: int) -> List[VectorQueryResult]:
+        """Run a KNN MATCH on the vec0 table and map distances to scores."""
+        assert self._conn is not None
+        cursor = self._conn.execute(
+            f"SELECT chunk_id, distance FROM {self._collection}_vec "
+            "WHERE embedding MATCH ? AND k = ? ORDER BY distance",
+            (struct.pack(f"{len(vector)}f", *vector), k),
+        )
+        metric = self._metric or "cosine"
+        picked = [
+            # vec0 reports cosine distance (1 - similarity) and L2 distance;
+            # convert both so that higher score is better, matching _score().
+            (str(chunk_id), 1.0 - distance if metric == "cosine" else -distance)
+            for chunk_id, distance in cursor
+        ]
+        return self._build_results(picked)
+
+    def _build_results(self, picked: List[Tuple[str, float]]) -> List[VectorQueryResult]:
+        """Attach text/metadata to ranked (chunk_id, score) pairs."""
+        details = self._fetch_details([chunk_id for chunk_id, _ in picked])
+        results: List[VectorQueryResult] = []
+        for chunk_id, score in picked:
+            if chunk_id not in details:
+                continue
+            text, metadata = details[chunk_id]
             results.append(
                 VectorQueryResult(chunk_id=chunk_id, score=score, metadata=metadata, text=text)
             )
+        return results
 
-        results.sort(key=lambda r: r.score, reverse=True)
-        return results[:k]
+    def _fetch_details(self, chunk_ids: List[str]) -> Dict[str, Any]:
+        """Load (text, metadata) for the given chunk_ids."""
+        assert self._conn is not None
+        details: Dict[str, Any] = {}
+        for i in range(0, len(chunk_ids), 900):
+            batch = chunk_ids[i : i + 900]
+            placeholders = ",".join(["?"] * len(batch))
+            cursor = self._conn.execute(
+                f"SELECT chunk_id, text, metadata_json FROM {self._collection}_chunks "
+                f"WHERE chunk_id IN ({placeholders})",
+                tuple(batch),
+            )
+            for chunk_id, text, metadata_json in cursor:
+                try:
+                    metadata = json.loads(metadata_json) if metadata_json else {}
+                except json.JSONDecodeError:
+                    metadata = {}
+                details[str(chunk_id)] = (text, metadata)
+        return details
 
     def _score(self, vec1: List[float], vec2: List[float]) -> float:
         if len(vec1) != len(vec2):
@@ -408,6 +914,33 @@ class SQLiteVectorBackend(VectorBackendAdapter):
 
         return self._cosine_similarity(vec1, vec2)
 
+    @staticmethod
+    def _quantize_int8(vector: Any) -> bytes:
+        """Encode ``vector`` as a float32 scale followed by int8 codes.
+
+        Codes are ``round(x / scale)`` with ``scale = max|x| / 127``.
+        """
+        if getattr(vector, "dtype", None) is not None:
+            max_abs = float(abs(vector).max()) if len(vector) else 0.0
+            scale = max_abs / 127.0 if max_abs else 1.0
+            codes = (vector / scale).round().clip(-127, 127).astype("int8").tobytes()
+        else:
+            max_abs = max((abs(x) for x in vector), default=0.0)
+            scale = max_abs / 127.0 if max_abs else 1.0
+            codes = array("b", [max(-127, min(127, round(x / scale))) for x in vector]).tobytes()
+        return struct.pack("f", scale) + codes
+
+    @staticmethod
+    def _unit_vector(vector: Any) -> Any:
+        """Return ``vector`` scaled to unit L2 norm (zero vectors unchanged)."""
+        if getattr(vector, "dtype", None) is not None:
+            norm = float((vector * vector).sum()) ** 0.5
+            return vector / norm if norm else vector
+        norm = sum(x * x for x in vector) ** 0.5
+        if not norm:
+            return list(vector)
+        return [x / norm for x in vector]
+
     @staticmethod
     def _dot(vec1: List[float], vec2: List[float]) -> float:
         return sum(a * b for a, b in zip(vec1, vec2))
@@ -432,6 +965,7 @@ class SQLiteVectorBackend(VectorBackendAdapter):
     def load(self) -> None:
         self._ensure_connection()
         assert self._conn is not None
+        self._invalidate_caches()
 
         # Load dims/metric if present.
         self._conn.execute(
@@ -444,6 +978,11 @@ class SQLiteVectorBackend(VectorBackendAdapter):
         self._metric = metric or self._metric
         if storage_format:
             self._storage_format = storage_format
+        quantization = self._read_meta("quantization")
+        if quantization:
+            self._quantization = quantization
+        self._normalized = self._read_meta("normalized") == "1"
+        self._has_vec0 = self._detect_vec0()
         
         self._write_metadata_file()
 
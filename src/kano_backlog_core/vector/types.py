@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, Sequence
 
 
 @dataclass
@@ -11,7 +11,7 @@ class VectorChunk:
     chunk_id: str
     text: str
     metadata: Dict[str, Any] = field(default_factory=dict)
-    vector: List[float] | None = None  # Vector might be computed later
+    vector: Sequence[float] | None = None  # Vector might be computed later
 
 
 @dataclass
@@ -12,13 +12,17 @@ _kano/backlog/products/<product>/items/**, plus ADRs and Topics.
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
+from itertools import starmap
 from pathlib import Path
-from typing import Iterable, Optional, Any
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+import atexit
 import json
 import os
 import sqlite3
 import sys
+import threading
 import time
 
 import frontmatter
@@ -31,6 +35,7 @@ from kano_backlog_core.errors import ConfigError
 from kano_backlog_core.schema import load_canonical_schema
 from kano_backlog_core.tokenizer import resolve_tokenizer
 
+from .backlog_index import _load_items
 from .init import _resolve_backlog_root
 
 # Conditional import for UUIDv7
@@ -40,6 +45,23 @@ else:
     from uuid6 import uuid7  # type: ignore
 
 
+# Item fields chunked as their own section, after the title. Backlog item types
+# other than ADR and Topic also get a worklog section.
+_SECTION_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "ADR": ("decision", "content"),
+    "Topic": ("context", "content"),
+}
+_DEFAULT_SECTION_FIELDS: Tuple[str, ...] = (
+    "context",
+    "goal",
+    "non_goals",
+    "approach",
+    "alternatives",
+    "acceptance_criteria",
+    "risks",
+)
+
+
 @dataclass
 class ChunksDbBuildResult:
     db_path: Path
@@ -72,6 +94,78 @@ class ChunkFtsCandidate:
     snippet: str
 
 
+# Read-only connections reused across queries, keyed by DB path. The stat
+# signature detects rebuilds (build_chunks_db unlinks and recreates the file).
+_READ_CONNECTIONS: dict[str, tuple[tuple[int, int, int], sqlite3.Connection, threading.Lock]] = {}
+_READ_CONNECTIONS_LOCK = threading.Lock()
+
+_READ_PRAGMAS = (
+    "PRAGMA query_only = 1",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+)
+
+
+def _cached_read_connection(db_path: Path) -> tuple[str, sqlite3.Connection, threading.Lock]:
+    """Return the cache key, a read-only connection to db_path and its lock."""
+    st = db_path.stat()
+    signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+    key = str(db_path.absolute())
+    with _READ_CONNECTIONS_LOCK:
+        stale = _READ_CONNECTIONS.get(key)
+        if stale is not None and stale[0] == signature:
+            return key, stale[1], stale[2]
+        conn = sqlite3.connect(key, check_same_thread=False)
+        for pragma in _READ_PRAGMAS:
+            try:
+                conn.execute(pragma)
+            except sqlite3.OperationalError:
+                pass
+        lock = threading.Lock()
+        _READ_CONNECTIONS[key] = (signature, conn, lock)
+    if stale is not None:
+        # Another thread may still be querying the old connection under its lock.
+        with stale[2]:
+            stale[1].close()
+    return key, conn, lock
+
+
+@contextmanager
+def _read_connection(db_path: Path) -> Iterator[sqlite3.Connection]:
+    """Hold a cached read-only connection to db_path for the duration of the block."""
+    while True:
+        key, conn, lock = _cached_read_connection(db_path)
+        with lock:
+            # Connections are dropped from the cache before being closed, so one
+            # still cached while we hold its lock is open until we release it.
+            entry = _READ_CONNECTIONS.get(key)
+            if entry is not None and entry[1] is conn:
+                yield conn
+                return
+
+
+def _close_read_connection(db_path: Path) -> None:
+    with _READ_CONNECTIONS_LOCK:
+        entry = _READ_CONNECTIONS.pop(str(db_path.absolute()), None)
+    if entry is not None:
+        with entry[2]:
+            entry[1].close()
+
+
+def close_read_connections() -> None:
+    """Close every cached read-only connection (runs at interpreter exit)."""
+    with _READ_CONNECTIONS_LOCK:
+        entries = list(_READ_CONNECTIONS.values())
+        _READ_CONNECTIONS.clear()
+    for _, conn, lock in entries:
+        with lock:
+            conn.close()
+
+
+atexit.register(close_read_connections)
+
+
 def _scan_adrs(product_root: Path, backlog_root_path: Path) -> list[tuple[Path, Any, float]]:
     """Scan ADRs from decisions/ directory and map to canonical schema."""
     decisions_dir = product_root / "decisions"
@@ -199,6 +293,7 @@ def build_chunks_db(
     if not product_root.exists():
         raise FileNotFoundError(f"Product backlog not found: {product_root}")
 
+    effective: Optional[Dict[str, Any]] = None
     if cache_root:
         cache_dir = Path(cache_root)
     else:
@@ -215,16 +310,19 @@ def build_chunks_db(
         raise FileExistsError(f"Chunks DB already exists: {db_path} (use force to rebuild)")
 
     if db_path.exists():
+        # A cached reader would keep the old file open (and block unlink on Windows).
+        _close_read_connection(db_path)
         db_path.unlink()
 
     # Resolve pipeline config so chunking/tokenizer matches embedding pipeline.
     # Fall back to deterministic defaults when config is absent (e.g., in tests).
     try:
-        _, effective = ConfigLoader.load_effective_config(
-            backlog_root_path,
-            product=product,
-            custom_config_file=custom_config_file,
-        )
+        if effective is None:
+            _, effective = ConfigLoader.load_effective_config(
+                backlog_root_path,
+                product=product,
+                custom_config_file=custom_config_file,
+            )
         pc = ConfigLoader.validate_pipeline_config(effective)
         chunking_options = pc.chunking
         tokenizer_model = pc.tokenizer.model
@@ -238,16 +336,9 @@ def build_chunks_db(
 
     store = CanonicalStore(product_root)
 
-    paths = store.list_items()
-    loaded: list[tuple[Path, object, float]] = []
+    loaded = _load_items(store, store.list_items())
     id_to_uid: dict[str, str] = {}
-    for path in paths:
-        try:
-            item = store.read(path)
-        except Exception:
-            continue
-        mtime = os.stat(path).st_mtime
-        loaded.append((path, item, mtime))
+    for _, item, _ in loaded:
         if getattr(item, "id", None) and getattr(item, "uid", None):
             id_to_uid[str(item.id)] = str(item.uid)
     
@@ -372,39 +463,15 @@ def build_chunks_db(
             sections: list[tuple[str, str]] = [("title", str(getattr(item, "title", "") or ""))]
 
             item_type = getattr(item.type, "value", "") if hasattr(item, "type") else ""
-            
-            if item_type == "ADR":
-                decision_content = getattr(item, "decision", None)
-                if isinstance(decision_content, str) and decision_content.strip():
-                    sections.append(("decision", decision_content.strip()))
-                
-                content = getattr(item, "content", None)
-                if isinstance(content, str) and content.strip():
-                    sections.append(("content", content.strip()))
-            
-            elif item_type == "Topic":
-                context_content = getattr(item, "context", None)
-                if isinstance(context_content, str) and context_content.strip():
-                    sections.append(("context", context_content.strip()))
-                
-                content = getattr(item, "content", None)
-                if isinstance(content, str) and content.strip():
-                    sections.append(("content", content.strip()))
-            
-            else:
-                for key in [
-                    "context",
-                    "goal",
-                    "non_goals",
-                    "approach",
-                    "alternatives",
-                    "acceptance_criteria",
-                    "risks",
-                ]:
-                    value = getattr(item, key, None)
-                    if isinstance(value, str) and value.strip():
-                        sections.append((key, value.strip()))
-
+            fields = _SECTION_FIELDS.get(item_type, _DEFAULT_SECTION_FIELDS)
+            for key in fields:
+                value = getattr(item, key, None)
+                if isinstance(value, str):
+                    value = value.strip()
+                    if value:
+                        sections.append((key, value))
+
+            if fields is _DEFAULT_SECTION_FIELDS:
                 worklog = getattr(item, "worklog", None)
                 if isinstance(worklog, list) and worklog:
                     wl_text = "\n".join(str(x) for x in worklog if str(x).strip()).strip()
@@ -447,6 +514,14 @@ def build_chunks_db(
                     chunk_index += 1
 
         if chunk_rows:
+            # The DB is freshly created, so skip the per-row FTS sync trigger and
+            # build the FTS index in a single pass; the trigger is restored for
+            # later incremental writers.
+            trigger_sql = cur.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'chunks_fts_insert'"
+            ).fetchone()
+            if trigger_sql:
+                cur.execute("DROP TRIGGER chunks_fts_insert")
             cur.executemany(
                 """
                 INSERT INTO chunks (
@@ -457,6 +532,9 @@ def build_chunks_db(
                 """,
                 chunk_rows,
             )
+            if trigger_sql:
+                cur.execute("INSERT INTO chunks_fts(chunks_fts) VALUES('rebuild')")
+                cur.execute(trigger_sql[0])
 
         conn.commit()
 
@@ -504,12 +582,11 @@ def query_chunks_fts(
     if not query.strip():
         return []
 
-    conn = sqlite3.connect(str(db_path))
-    try:
-        conn.execute("PRAGMA foreign_keys = ON")
+    with _read_connection(db_path) as conn:
         cur = conn.cursor()
 
         # FTS5 bm25(): lower is better. Convert to higher-is-better score.
+        # Columns follow ChunkSearchRow field order so rows stream straight in.
         rows = cur.execute(
             """
             SELECT
@@ -520,45 +597,17 @@ def query_chunks_fts(
                 c.parent_uid,
                 c.section,
                 c.content,
-                bm25(chunks_fts) AS bm25_score
+                COALESCE(-bm25(chunks_fts), 0.0) AS score
             FROM chunks_fts
             JOIN chunks c ON c.rowid = chunks_fts.rowid
             JOIN items i ON i.uid = c.parent_uid
             WHERE chunks_fts MATCH ?
-            ORDER BY bm25_score ASC
+            ORDER BY score DESC
             LIMIT ?
             """,
             (query, int(k)),
-        ).fetchall()
-
-        out: list[ChunkSearchRow] = []
-        for (
-            item_id,
-            item_title,
-            item_path,
-            chunk_id,
-            parent_uid,
-            section,
-            content,
-            bm25_score,
-        ) in rows:
-            score = -float(bm25_score) if bm25_score is not None else 0.0
-            out.append(
-                ChunkSearchRow(
-                    item_id=item_id,
-                    item_title=item_title,
-                    item_path=item_path,
-                    chunk_id=chunk_id,
-                    parent_uid=parent_uid,
-                    section=section,
-                    content=content,
-                    score=score,
-                )
-            )
-
-        return out
-    finally:
-        conn.close()
+        )
+        return list(starmap(ChunkSearchRow, rows))
 
 
 def query_chunks_fts_candidates(
@@ -598,11 +647,10 @@ def query_chunks_fts_candidates(
     if not query.strip():
         return []
 
-    conn = sqlite3.connect(str(db_path))
-    try:
-        conn.execute("PRAGMA foreign_keys = ON")
+    with _read_connection(db_path) as conn:
         cur = conn.cursor()
 
+        # Columns follow ChunkFtsCandidate field order so rows stream straight in.
         rows = cur.execute(
             """
             SELECT
@@ -612,8 +660,8 @@ def query_chunks_fts_candidates(
                 c.chunk_id,
                 c.parent_uid,
                 c.section,
-                bm25(chunks_fts) AS bm25_score,
-                snippet(chunks_fts, 2, ?, ?, ?, ?) AS snippet
+                COALESCE(bm25(chunks_fts), 0.0) AS bm25_score,
+                COALESCE(snippet(chunks_fts, 2, ?, ?, ?, ?), '') AS snippet
             FROM chunks_fts
             JOIN chunks c ON c.rowid = chunks_fts.rowid
             JOIN items i ON i.uid = c.parent_uid
@@ -629,32 +677,5 @@ def query_chunks_fts_candidates(
                 query,
                 int(k),
             ),
-        ).fetchall()
-
-        out: list[ChunkFtsCandidate] = []
-        for (
-            item_id,
-            item_title,
-            item_path,
-            chunk_id,
-            parent_uid,
-            section,
-            bm25_score,
-            snippet,
-        ) in rows:
-            out.append(
-                ChunkFtsCandidate(
-                    item_id=item_id,
-                    item_title=item_title,
-                    item_path=item_path,
-                    chunk_id=chunk_id,
-                    parent_uid=parent_uid,
-                    section=section,
-                    bm25_score=float(bm25_score) if bm25_score is not None else 0.0,
-                    snippet=str(snippet or ""),
-                )
-            )
-
-        return out
-    finally:
-        conn.close()
+        )
+        return list(starmap(ChunkFtsCandidate, rows))
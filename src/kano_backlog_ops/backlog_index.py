@@ -16,6 +16,7 @@ import time
 from datetime import datetime
 import os
 
+from . import item_utils
 from .init import _resolve_backlog_root
 from kano_backlog_core.canonical import CanonicalStore
 from kano_backlog_core.schema import load_indexing_schema
@@ -234,23 +235,36 @@ def get_index_status(
     return IndexStatusResult(indexes=indexes)
 
 
+def _load_item(store: CanonicalStore, path: Path) -> Optional[tuple[Path, object, float]]:
+    try:
+        item = store.read(path)
+    except Exception:
+        return None
+    return path, item, os.stat(path).st_mtime
+
+
+def _load_items(
+    store: CanonicalStore, paths: list[Path], max_workers: Optional[int] = None
+) -> list[tuple[Path, object, float]]:
+    """Read item files as (path, item, mtime), in order, skipping unparsable ones.
+
+    Large batches are read via ``item_utils.map_item_files`` so that file reads
+    overlap on cold caches and network drives.
+    """
+    outcomes = item_utils.map_item_files(
+        lambda path: _load_item(store, path), paths, max_workers
+    )
+    return [outcome for outcome in outcomes if outcome is not None]
+
+
 def _scan_items(product_root: Path) -> Iterable[dict]:
     store = CanonicalStore(product_root)
 
     # Build a map from display ID -> UID so we can resolve parent_uid.
     # Canonical frontmatter stores `parent` as the display ID today.
-    paths = store.list_items()
-    loaded: list[tuple[Path, object, float]] = []
+    loaded = _load_items(store, store.list_items())
     id_to_uid: dict[str, str] = {}
-
-    for path in paths:
-        try:
-            item = store.read(path)
-        except Exception:
-            continue
-        stat = os.stat(path)
-        mtime = stat.st_mtime
-        loaded.append((path, item, mtime))
+    for _, item, _ in loaded:
         if getattr(item, "id", None) and getattr(item, "uid", None):
             id_to_uid[str(item.id)] = str(item.uid)
 
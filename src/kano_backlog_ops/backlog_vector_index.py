@@ -2,25 +2,35 @@
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 import time
 import logging
 import hashlib
+import json
 import sqlite3
 import os
 
 from kano_backlog_core.config import ConfigLoader
 from kano_backlog_core.canonical import CanonicalStore
 from kano_backlog_core.chunking import chunk_text, chunk_text_with_tokenizer, ChunkingOptions
-from kano_backlog_core.tokenizer import resolve_model_max_tokens, resolve_tokenizer
-from kano_backlog_core.token_budget import enforce_token_budget, budget_chunks
-from kano_backlog_core.embedding import resolve_embedder
+from kano_backlog_core.tokenizer import (
+    TokenizerAdapter,
+    resolve_model_max_tokens,
+    resolve_tokenizer,
+)
+from kano_backlog_core.token_budget import budget_chunks, enforce_token_budget_many
+from kano_backlog_core.embedding import EmbeddingAdapter, EmbeddingResult, resolve_embedder
 from kano_backlog_core.vector import VectorChunk, get_backend
 from kano_backlog_core.vector.sqlite_backend import SQLiteVectorBackend
 from kano_backlog_core.pipeline_config import PipelineConfig
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 def _resolve_sqlite_vector_db_path(
     *,
@@ -79,6 +89,39 @@ def _chunks_db_is_stale(*, product_root: Path, chunks_db_path: Path) -> bool:
 
     return latest_item_mtime > db_mtime
 
+# index_document is called once per document, so components it resolves are
+# shared across calls: a sentence-transformers embedder loads its model on first
+# use and hosted providers keep their HTTP client. Keyed by the full config.
+_INDEX_TOKENIZERS: Dict[Tuple[str, str], TokenizerAdapter] = {}
+_INDEX_EMBEDDERS: Dict[str, EmbeddingAdapter] = {}
+
+
+def _shared_tokenizer(adapter: str, model: str) -> TokenizerAdapter:
+    key = (adapter, model)
+    tokenizer = _INDEX_TOKENIZERS.get(key)
+    if tokenizer is None:
+        tokenizer = _INDEX_TOKENIZERS[key] = resolve_tokenizer(adapter, model)
+    return tokenizer
+
+
+def _shared_embedder(embed_cfg: Dict[str, Any]) -> EmbeddingAdapter:
+    key = json.dumps(embed_cfg, sort_keys=True, default=repr)
+    embedder = _INDEX_EMBEDDERS.get(key)
+    if embedder is None:
+        embedder = _INDEX_EMBEDDERS[key] = resolve_embedder(embed_cfg)
+    return embedder
+
+
+def _batched(iterable: Iterable[_T], size: int) -> Iterator[List[_T]]:
+    """Yield lists of up to ``size`` items (itertools.batched before 3.12)."""
+    it = iter(iterable)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
 @dataclass
 class VectorIndexResult:
     """Result of vector indexing operation."""
@@ -87,6 +130,7 @@ class VectorIndexResult:
     chunks_indexed: int
     duration_ms: float
     backend_type: str
+    chunks_reused: int = 0
 
 @dataclass
 class IndexResult:
@@ -140,7 +184,7 @@ def index_document(
     
     try:
         # 1. Resolve components from config
-        tokenizer = resolve_tokenizer(config.tokenizer.adapter, config.tokenizer.model)
+        tokenizer = _shared_tokenizer(config.tokenizer.adapter, config.tokenizer.model)
         
         embed_cfg = {
             "provider": config.embedding.provider,
@@ -148,7 +192,7 @@ def index_document(
             "dimension": config.embedding.dimension,
             **config.embedding.options
         }
-        embedder = resolve_embedder(embed_cfg)
+        embedder = _shared_embedder(embed_cfg)
         
         # Create embedding space ID for backend isolation
         max_tokens = config.tokenizer.max_tokens or resolve_model_max_tokens(config.tokenizer.model)
@@ -210,15 +254,14 @@ def index_document(
                 chunks_trimmed=0
             )
         
-        # 3. Apply token budgeting to each chunk
-        budgeted_chunks = []
-        for chunk in raw_chunks:
-            budgeted = enforce_token_budget(
-                chunk.text,
-                tokenizer,
-                max_tokens=max_tokens
-            )
-            budgeted_chunks.append(budgeted)
+        # 3. Apply token budgeting to each chunk, reusing the counts the
+        # chunker already took and counting the rest in one tokenizer call
+        budgeted_chunks = enforce_token_budget_many(
+            [chunk.text for chunk in raw_chunks],
+            tokenizer,
+            max_tokens=max_tokens,
+            known_counts=[chunk.token_count for chunk in raw_chunks],
+        )
         
         # 4. Prepare chunks for embedding
         chunk_texts = [budgeted.content for budgeted in budgeted_chunks]
@@ -230,8 +273,11 @@ def index_document(
         chunks_indexed = 0
         tokens_total = 0
         chunks_trimmed = 0
+        vector_chunks = []
         
-        for i, (raw_chunk, budgeted, embedding_result) in enumerate(zip(raw_chunks, budgeted_chunks, embedding_results)):
+        for i, (raw_chunk, budgeted, embedding_result) in enumerate(
+            zip(raw_chunks, budgeted_chunks, embedding_results)
+        ):
             tokens_total += budgeted.token_count.count
             if budgeted.trimmed:
                 chunks_trimmed += 1
@@ -259,9 +305,11 @@ def index_document(
                 vector=embedding_result.vector
             )
             
-            backend.upsert(vector_chunk)
+            vector_chunks.append(vector_chunk)
             chunks_indexed += 1
         
+        backend.upsert_many(vector_chunks)
+        
         # 6. Persist changes
         backend.persist()
         
@@ -359,6 +407,9 @@ def build_vector_index(
         "path": str(sqlite_vec_db_path) if sqlite_vec_db_path else str(vec_path),
         "collection": pc.vector.collection,
         "embedding_space_id": embedding_space_id,
+        "storage_format": pc.vector.options.get("storage_format", "binary"),
+        "quantization": pc.vector.options.get("quantization", "none"),
+        "mmap_size": pc.vector.options.get("mmap_size", 0),
     }
     existing_chunk_ids: set[str] = set()
 
@@ -400,26 +451,89 @@ def build_vector_index(
 
     max_tokens = pc.tokenizer.max_tokens or resolve_model_max_tokens(pc.tokenizer.model)
 
-    items_processed = 0
     chunks_generated = 0
     chunks_indexed = 0
+    chunks_reused = 0
     seen_parent_uids: set[str] = set()
-
-    current_batch: list[VectorChunk] = []
-    BATCH_SIZE = 16
-
-    def flush_batch() -> None:
-        nonlocal current_batch, chunks_indexed
-        if not current_batch:
+    batch_size = pc.embedding.index_batch_size
+    persist_interval = pc.vector.persist_interval
+    unpersisted = 0
+
+    # Remote embedders spend most of a batch waiting on the network, so up to
+    # embedder.max_concurrent batches are embedded in worker threads while the
+    # main thread keeps reading chunks. Upserts stay on the main thread, in
+    # submission order, so the backend is never shared across threads. The
+    # backend is persisted every persist_interval chunks on that thread too,
+    # while later batches are still embedding.
+    max_in_flight = embedder.max_concurrent
+    executor = ThreadPoolExecutor(max_workers=max_in_flight) if max_in_flight > 1 else None
+    in_flight: Deque[
+        Tuple[List[VectorChunk], List[str], "Future[List[EmbeddingResult]]"]
+    ] = deque()
+
+    def store_batch(
+        batch: List[VectorChunk], texts: List[str], embeddings: List[EmbeddingResult]
+    ) -> None:
+        """Upsert batch; embeddings of texts fill the chunks without a reused vector."""
+        nonlocal chunks_indexed, unpersisted
+        fresh = {text: res.vector for text, res in zip(texts, embeddings)}
+        for chunk in batch:
+            if chunk.vector is None:
+                chunk.vector = fresh[chunk.text]
+        backend.upsert_many(batch)
+        chunks_indexed += len(batch)
+        unpersisted += len(batch)
+        if persist_interval and unpersisted >= persist_interval:
+            backend.persist()
+            unpersisted = 0
+
+    def drain(limit: int = 0) -> None:
+        while len(in_flight) > limit:
+            batch, texts, future = in_flight.popleft()
+            store_batch(batch, texts, future.result())
+
+    def budget_batch(rows: List[Tuple[str, str, dict]]) -> List[VectorChunk]:
+        results = enforce_token_budget_many(
+            [content for _, content, _ in rows], tokenizer, max_tokens=max_tokens
+        )
+        return [
+            VectorChunk(
+                chunk_id=chunk_id,
+                text=budget_res.content,
+                metadata={
+                    **metadata,
+                    # Budget telemetry
+                    "trimmed": budget_res.trimmed,
+                    "token_count": budget_res.token_count.count,
+                    "token_count_method": budget_res.token_count.method,
+                    "tokenizer_id": budget_res.token_count.tokenizer_id,
+                    "is_exact": budget_res.token_count.is_exact,
+                    "target_budget": budget_res.target_budget,
+                    "safety_margin": budget_res.safety_margin,
+                    "max_tokens": max_tokens,
+                },
+            )
+            for (chunk_id, _, metadata), budget_res in zip(rows, results)
+        ]
+
+    def submit_batch(rows: List[Tuple[str, str, dict]]) -> None:
+        nonlocal chunks_reused
+        batch = budget_batch(rows)
+        # Text the DB already holds (e.g. a chunk whose offsets moved) keeps
+        # its stored vector instead of being embedded again.
+        stored = backend.stored_vectors_for_texts([c.text for c in batch])
+        for chunk in batch:
+            chunk.vector = stored.get(chunk.text)
+        missing = [c.text for c in batch if c.vector is None]
+        # Identical texts in one batch (template boilerplate) are embedded once;
+        # the copies count as reused.
+        texts = list(dict.fromkeys(missing))
+        chunks_reused += len(batch) - len(texts)
+        if executor is None or not texts:
+            store_batch(batch, texts, embedder.embed_batch(texts) if texts else [])
             return
-        texts = [c.text for c in current_batch]
-        embeddings = embedder.embed_batch(texts)
-        for i, res in enumerate(embeddings):
-            chunk = current_batch[i]
-            chunk.vector = res.vector
-            backend.upsert(chunk)
-            chunks_indexed += 1
-        current_batch = []
+        drain(max_in_flight - 1)
+        in_flight.append((batch, texts, executor.submit(embedder.embed_batch, texts)))
 
     conn = sqlite3.connect(str(chunks_db_path))
     try:
@@ -442,27 +556,21 @@ def build_vector_index(
 
         canonical_chunk_ids: set[str] = set()
 
-        for chunk_id, content, section, chunk_index, parent_uid, item_id, item_path in cursor:
-            chunk_id_str = str(chunk_id)
-            canonical_chunk_ids.add(chunk_id_str)
-
-            if parent_uid not in seen_parent_uids:
+        def pending_rows() -> Iterator[Tuple[str, str, dict]]:
+            """Yield (chunk_id, content, static metadata) for chunks needing embedding."""
+            for chunk_id, content, section, chunk_index, parent_uid, item_id, item_path in cursor:
+                chunk_id_str = str(chunk_id)
+                canonical_chunk_ids.add(chunk_id_str)
                 seen_parent_uids.add(parent_uid)
-                items_processed += 1
-
-            if not isinstance(content, str) or not content.strip():
-                continue
 
-            # Skip re-embedding when the vector DB already has this chunk_id.
-            if existing_chunk_ids and chunk_id_str in existing_chunk_ids:
-                continue
+                if not isinstance(content, str) or not content.strip():
+                    continue
 
-            budget_res = enforce_token_budget(content, tokenizer, max_tokens=max_tokens)
+                # Skip re-embedding when the vector DB already has this chunk_id.
+                if existing_chunk_ids and chunk_id_str in existing_chunk_ids:
+                    continue
 
-            vc = VectorChunk(
-                chunk_id=chunk_id_str,
-                text=budget_res.content,
-                metadata={
+                yield chunk_id_str, content, {
                     # Primary UX fields
                     "source_id": str(item_id),
                     "product": product,
@@ -472,39 +580,35 @@ def build_vector_index(
                     "item_path": str(item_path),
                     "section": str(section) if section is not None else None,
                     "chunk_index": int(chunk_index),
-                    # Budget telemetry
-                    "trimmed": budget_res.trimmed,
-                    "token_count": budget_res.token_count.count,
-                    "token_count_method": budget_res.token_count.method,
-                    "tokenizer_id": budget_res.token_count.tokenizer_id,
-                    "is_exact": budget_res.token_count.is_exact,
-                    "target_budget": budget_res.target_budget,
-                    "safety_margin": budget_res.safety_margin,
-                    "max_tokens": max_tokens,
-                },
-            )
+                }
 
-            current_batch.append(vc)
-            chunks_generated += 1
-            if len(current_batch) >= BATCH_SIZE:
-                flush_batch()
+        # Rows are token-budgeted and embedded batch_size at a time, so batched
+        # tokenizers and embedders see whole batches.
+        for rows in _batched(pending_rows(), batch_size):
+            chunks_generated += len(rows)
+            submit_batch(rows)
 
         # Prune stale chunk rows (only for sqlite backend) so chunk_ids track the
         # canonical chunk contract.
         if isinstance(backend, SQLiteVectorBackend):
             backend.prune_to_chunk_ids(list(canonical_chunk_ids))
 
+        drain()
     finally:
         conn.close()
+        if executor is not None:
+            for _, _, future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True)
 
-    flush_batch()
     backend.persist()
     
     duration = (time.perf_counter() - t0) * 1000
     return VectorIndexResult(
-        items_processed=items_processed,
+        items_processed=len(seen_parent_uids),
         chunks_generated=chunks_generated,
         chunks_indexed=chunks_indexed,
+        chunks_reused=chunks_reused,
         duration_ms=duration,
         backend_type=pc.vector.backend
     )
@@ -8,6 +8,7 @@ This module supports:
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
+import heapq
 import time
 
 from kano_backlog_core.config import ConfigLoader
@@ -113,6 +114,7 @@ def search_similar(
         "path": str(sqlite_vec_db_path) if sqlite_vec_db_path else str(vec_path),
         "collection": pc.vector.collection,
         "embedding_space_id": embedding_space_id,
+        **pc.vector.options
     }
     backend = get_backend(vec_cfg)
     backend.load()
@@ -222,6 +224,7 @@ def search_hybrid(
         "path": str(sqlite_vec_db_path) if sqlite_vec_db_path else str(vec_path),
         "collection": pc.vector.collection,
         "embedding_space_id": embedding_space_id,
+        **pc.vector.options
     }
     backend = get_backend(vec_cfg)
     backend.load()
@@ -255,5 +258,5 @@ def search_hybrid(
         )
 
     # Primary sort: vector score (desc). Tie-break: bm25 (asc).
-    merged.sort(key=lambda x: (-x.vector_score, x.bm25_score))
-    return merged[: int(k)]
+    # nsmallest keeps only k rows and orders ties like a stable sort.
+    return heapq.nsmallest(int(k), merged, key=lambda x: (-x.vector_score, x.bm25_score))
@@ -251,20 +251,18 @@ def run_benchmark(
 
         # Index vectors
         chunks_for_embedding.sort(key=lambda x: x[0])
-        indexed = 0
-        for chunk_id, source_id, text in chunks_for_embedding:
-            vec = embedded_vectors.get(chunk_id)
-            if vec is None:
-                continue
-            backend.upsert(
-                VectorChunk(
-                    chunk_id=chunk_id,
-                    text=text,
-                    metadata={"source_id": source_id},
-                    vector=vec,
-                )
+        vector_chunks = [
+            VectorChunk(
+                chunk_id=chunk_id,
+                text=text,
+                metadata={"source_id": source_id},
+                vector=embedded_vectors[chunk_id],
             )
-            indexed += 1
+            for chunk_id, source_id, text in chunks_for_embedding
+            if embedded_vectors.get(chunk_id) is not None
+        ]
+        backend.upsert_many(vector_chunks)
+        indexed = len(vector_chunks)
         backend.persist()
 
         # Sanity queries
@@ -29,6 +29,30 @@ def find_frontmatter_delimiters(lines: List[str]) -> Tuple[int, int]:
     return -1, -1
 
 
+def read_frontmatter_block(path: Path) -> Optional[str]:
+    """Read only the YAML frontmatter block of a markdown file.
+
+    Stops reading at the closing ``---`` line, so the body is never loaded.
+
+    Args:
+        path: Markdown file path
+
+    Returns:
+        The text between the delimiters, or None if the file has no clean
+        ``---`` fence (callers should fall back to a full parse)
+    """
+    with path.open("r", encoding="utf-8") as handle:
+        first = handle.readline()
+        if first.strip() != "---":
+            return None
+        block: List[str] = []
+        for line in handle:
+            if line.strip() == "---":
+                return "".join(block)
+            block.append(line)
+    return None
+
+
 def parse_frontmatter(lines: List[str]) -> Dict[str, str]:
     """Parse YAML frontmatter from markdown lines.
     
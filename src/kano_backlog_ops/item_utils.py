@@ -7,11 +7,13 @@ Per ADR-0013, this is a utility module for ops layer functions.
 
 from __future__ import annotations
 
+import os
 import re
 import sqlite3
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Callable, Optional, Sequence, Tuple, Dict, Any, TypeVar
 from datetime import datetime
 
 
@@ -19,6 +21,32 @@ from kano_backlog_core.config import ConfigLoader
 from kano_backlog_core.models import ItemType
 
 
+# Display ID at the start of an item filename: PREFIX-TYPECODE-0000.
+_ITEM_ID_RE = re.compile(r"^[A-Z]+-[A-Z]+-\d{4}$")
+# Runs of anything but ASCII letters/digits, collapsed to one "-" by slugify.
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+# Below this many item files a thread pool costs more than it saves.
+_PARALLEL_MIN_ITEMS = 64
+
+_T = TypeVar("_T")
+
+
+def map_item_files(
+    fn: Callable[[Path], _T], paths: Sequence[Path], max_workers: Optional[int] = None
+) -> list[_T]:
+    """Apply fn to each item file, in order, on a thread pool for large batches.
+
+    ``max_workers`` defaults to ``cpu_count`` capped at 8; 1 disables the pool.
+    File reads overlap across threads, while parsing still runs under the GIL.
+    """
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+    if max_workers > 1 and len(paths) >= _PARALLEL_MIN_ITEMS:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fn, paths))
+    return [fn(path) for path in paths]
+
+
 def sync_id_sequences(
     product: str,
     backlog_root: Optional[Path] = None,
@@ -227,7 +255,7 @@ def slugify(text: str, max_len: int = 80) -> str:
     """Convert text to URL-safe slug for use in filenames."""
     normalized = unicodedata.normalize("NFKD", text)
     ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
-    slug = re.sub(r"[^A-Za-z0-9]+", "-", ascii_text).strip("-").lower()
+    slug = _SLUG_RE.sub("-", ascii_text).strip("-").lower()
     return slug or "untitled"
 
 
@@ -266,28 +294,34 @@ def find_next_number(
         Next available number (1-based)
     """
     pattern = re.compile(rf"{re.escape(prefix)}-{type_code}-(\d{{4}})")
+    # Every match contains this, so other types' files are skipped with a
+    # substring test instead of two regex calls.
+    needle = f"{prefix}-{type_code}-"
     max_num = 0
     
     if not items_root.exists():
         return 1
     
-    for path in items_root.rglob("*.md"):
-        # Skip special files
-        if path.name == "README.md" or path.name.endswith(".index.md"):
-            continue
-        
-        # Extract ID from filename
-        item_id = _extract_id_from_filename(path.name)
-        if not item_id:
-            continue
-        
-        match = pattern.search(item_id)
-        if not match:
-            continue
-        
-        number = int(match.group(1))
-        if number > max_num:
-            max_num = number
+    # os.walk yields bare filenames; rglob builds a Path per file. Neither
+    # follows directory symlinks.
+    for _, _, filenames in os.walk(items_root):
+        for name in filenames:
+            # Skip special files
+            if needle not in name or name == "README.md" or name.endswith(".index.md"):
+                continue
+            
+            # Extract ID from filename
+            item_id = _extract_id_from_filename(name)
+            if not item_id:
+                continue
+            
+            match = pattern.search(item_id)
+            if not match:
+                continue
+            
+            number = int(match.group(1))
+            if number > max_num:
+                max_num = number
     
     return max_num + 1
 
@@ -363,7 +397,7 @@ def _extract_id_from_filename(filename: str) -> Optional[str]:
     item_id = parts[0]
     
     # Validate format: PREFIX-TYPECODE-0000
-    if re.match(r"^[A-Z]+-[A-Z]+-\d{4}$", item_id):
+    if _ITEM_ID_RE.match(item_id):
         return item_id
     
     return None
@@ -234,9 +234,12 @@ def build_repo_vector_index(
             )
             chunk_texts.append(budgeted.content)
         
-        embedding_results = embedder.embed_batch(chunk_texts)
+        batch_size = pc.embedding.index_batch_size
+        embedding_results = []
+        for start in range(0, len(chunk_texts), batch_size):
+            embedding_results.extend(embedder.embed_batch(chunk_texts[start : start + batch_size]))
         
-        chunks_indexed = 0
+        vector_chunks = []
         for (chunk_id, parent_uid, content, file_path), embedding_result in zip(chunks_to_index, embedding_results):
             vector_chunk = VectorChunk(
                 chunk_id=chunk_id,
@@ -252,9 +255,10 @@ def build_repo_vector_index(
                 vector=embedding_result.vector
             )
             
-            backend.upsert(vector_chunk)
-            chunks_indexed += 1
+            vector_chunks.append(vector_chunk)
         
+        backend.upsert_many(vector_chunks)
+        chunks_indexed = len(vector_chunks)
         backend.persist()
         
         chunks_pruned = 0
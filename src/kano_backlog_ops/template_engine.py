@@ -11,7 +11,44 @@ Supports:
 import re
 from collections import ChainMap
 from dataclasses import dataclass
-from typing import Any, Dict, Match, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Match, Optional, Tuple
+
+# (kind, arg, children): kind is "text", "var", "each", "if" or "unless".
+_Node = Tuple[str, str, Tuple[Any, ...]]
+
+_EQ_RE = re.compile(r'^\(eq\s+([\w\.\[\]]+)\s+"([^"]*)"\s*\)$')
+
+
+@lru_cache(maxsize=1024)
+def _parse_path(path: str) -> Optional[Tuple[Tuple[str, Optional[int]], ...]]:
+    """Split a dot path into (name, index) steps; None if an index is not an int.
+
+    Templates reuse the same few paths for every item of an #each loop, so the
+    split/int parsing is done once per distinct path.
+    """
+    steps = []
+    for part in path.split('.'):
+        # Handle array access [0]
+        if part.endswith(']') and '[' in part:
+            try:
+                idx = int(part.split('[')[1].rstrip(']'))
+            except ValueError:
+                return None
+            steps.append((part.split('[')[0], idx))
+        else:
+            steps.append((part, None))
+    return tuple(steps)
+
+
+@lru_cache(maxsize=256)
+def _parse_condition(cond: str) -> Tuple[str, Optional[str]]:
+    """Return (key, target) for `(eq key "target")`, or (cond, None) for a truthy test."""
+    match = _EQ_RE.match(cond)
+    if match:
+        return match.group(1), match.group(2)
+    return cond, None
+
 
 class TemplateEngine:
     def __init__(self):
@@ -19,7 +56,9 @@ class TemplateEngine:
 
     def render(self, template: str, context: Dict[str, Any]) -> str:
         """Render a template with a Handlebars-like subset (nested blocks supported)."""
-        return self._render_segment(template, ChainMap(context), depth=0)
+        out: List[str] = []
+        self._render_nodes(_compile_template(template), ChainMap(context), out)
+        return "".join(out)
 
     @dataclass(frozen=True)
     class _Tag:
@@ -27,78 +66,91 @@ class TemplateEngine:
         start: int
         end: int  # index right after "}}"
 
-    def _render_segment(self, template: str, context: ChainMap[str, Any], *, depth: int) -> str:
+    @classmethod
+    def _compile_segment(cls, template: str, *, depth: int) -> Tuple[_Node, ...]:
+        """Parse a template into (kind, arg, children) nodes in one left-to-right pass.
+
+        Rendering walks the nodes, so an #each body is scanned once instead of once
+        per item, and blocks are not re-scanned at every nesting level.
+        """
         if depth > 50:
             # Prevent runaway recursion on malformed templates.
-            return template
+            return (("text", template, ()),)
 
-        out: list[str] = []
+        nodes: List[_Node] = []
         idx = 0
         while True:
-            tag = self._find_next_tag(template, idx)
+            tag = cls._find_next_tag(template, idx)
             if tag is None:
-                out.append(template[idx:])
+                nodes.append(("text", template[idx:], ()))
                 break
 
-            out.append(template[idx:tag.start])
+            nodes.append(("text", template[idx:tag.start], ()))
             raw = tag.raw.strip()
 
-            if raw.startswith("#each "):
-                key = raw[len("#each ") :].strip()
-                inner, next_idx = self._extract_block(template, tag.end, block_name="each")
-                items = self._get_value(context, key)
+            block = next(
+                (name for name in ("each", "if", "unless") if raw.startswith(f"#{name} ")),
+                None,
+            )
+            if block is not None:
+                arg = raw[len(block) + 2 :].strip()
+                inner, idx = cls._extract_block(template, tag.end, block_name=block)
+                nodes.append((block, arg, cls._compile_segment(inner, depth=depth + 1)))
+                continue
+
+            if not raw.startswith("/"):
+                nodes.append(("var", raw, ()))
+            # else: stray closing tag, omitted to keep rendered docs clean.
+            idx = tag.end
+
+        return tuple(node for node in nodes if node[0] != "text" or node[1])
+
+    def _render_nodes(self, nodes: Tuple[_Node, ...], context: ChainMap[str, Any], out: List[str]) -> None:
+        for kind, arg, children in nodes:
+            if kind == "text":
+                out.append(arg)
+            elif kind == "var":
+                out.append(self._render_var(arg, context))
+            elif kind == "each":
+                items = self._get_value(context, arg)
                 if isinstance(items, list):
                     for item in items:
                         overlay: dict[str, Any] = {"this": item}
                         if isinstance(item, dict):
                             overlay.update(item)
-                        out.append(self._render_segment(inner, context.new_child(overlay), depth=depth + 1))
-                idx = next_idx
-                continue
-
-            if raw.startswith("#if "):
-                cond = raw[len("#if ") :].strip()
-                inner, next_idx = self._extract_block(template, tag.end, block_name="if")
-                if self._eval_condition(cond, context):
-                    out.append(self._render_segment(inner, context, depth=depth + 1))
-                idx = next_idx
-                continue
-
-            if raw.startswith("#unless "):
-                key = raw[len("#unless ") :].strip()
-                inner, next_idx = self._extract_block(template, tag.end, block_name="unless")
-                val = self._get_value(context, key)
-                if not bool(val):
-                    out.append(self._render_segment(inner, context, depth=depth + 1))
-                idx = next_idx
-                continue
-
-            if raw.startswith("/"):
-                # Stray closing tag: omit from output to keep rendered docs clean.
-                idx = tag.end
-                continue
-
-            out.append(self._render_var(raw, context))
-            idx = tag.end
-
-        return "".join(out)
+                        self._render_nodes(children, context.new_child(overlay), out)
+            elif kind == "if":
+                if self._eval_condition(arg, context):
+                    self._render_nodes(children, context, out)
+            elif not bool(self._get_value(context, arg)):  # unless
+                self._render_nodes(children, context, out)
+
+    @staticmethod
+    def _lookup(context: ChainMap[str, Any], key: str, default: Any = None) -> Any:
+        """ChainMap.get without its double walk (__contains__ then __getitem__)."""
+        for mapping in context.maps:
+            if key in mapping:
+                return mapping[key]
+        return default
 
     def _render_var(self, key: str, context: ChainMap[str, Any]) -> str:
         if key == "this":
-            return str(context.get("this", ""))
+            return str(self._lookup(context, "this", ""))
         val = self._get_value(context, key)
         return "" if val is None else str(val)
 
-    def _find_next_tag(self, text: str, start: int) -> Optional[_Tag]:
+    @classmethod
+    def _find_next_tag(cls, text: str, start: int) -> Optional[_Tag]:
         open_idx = text.find("{{", start)
         if open_idx == -1:
             return None
         close_idx = text.find("}}", open_idx + 2)
         if close_idx == -1:
             return None
-        return self._Tag(raw=text[open_idx + 2 : close_idx], start=open_idx, end=close_idx + 2)
+        return cls._Tag(raw=text[open_idx + 2 : close_idx], start=open_idx, end=close_idx + 2)
 
-    def _extract_block(self, text: str, start_idx: int, *, block_name: str) -> Tuple[str, int]:
+    @classmethod
+    def _extract_block(cls, text: str, start_idx: int, *, block_name: str) -> Tuple[str, int]:
         """
         Return (inner_text, next_idx_after_close) for a block.
 
@@ -109,7 +161,7 @@ class TemplateEngine:
         depth = 1
         scan = start_idx
         while True:
-            tag = self._find_next_tag(text, scan)
+            tag = cls._find_next_tag(text, scan)
             if tag is None:
                 # Malformed template: treat the rest as inner content.
                 return text[start_idx:], len(text)
@@ -124,38 +176,48 @@ class TemplateEngine:
 
             scan = tag.end
 
-    _EQ_RE = re.compile(r'^\(eq\s+([\w\.\[\]]+)\s+"([^"]*)"\s*\)$')
-
     def _eval_condition(self, cond: str, context: ChainMap[str, Any]) -> bool:
-        match = self._EQ_RE.match(cond)
-        if match:
-            key = match.group(1)
-            target_val = match.group(2)
+        key, target_val = _parse_condition(cond)
+        if target_val is not None:
             return str(self._get_value(context, key)) == target_val
-        val = self._get_value(context, cond)
+        val = self._get_value(context, key)
         return bool(val)
 
     def _get_value(self, context: ChainMap[str, Any], path: str) -> Any:
         """Get value from context using dot notation."""
-        parts = path.split('.')
-        curr: Any = context
-        try:
-            for part in parts:
-                # Handle array access [0]
-                if part.endswith(']') and '[' in part:
-                    p_name = part.split('[')[0]
-                    idx = int(part.split('[')[1].rstrip(']'))
-                    if p_name:
-                         curr = curr[p_name]
+        steps = _parse_path(path)
+        if steps is None:
+            return None
+        name, idx = steps[0]
+        if idx is None:
+            # Scope lookup: #each nests one ChainMap level per loop.
+            curr: Any = self._lookup(context, name)
+            if curr is None:
+                return None
+            steps = steps[1:]
+        else:
+            curr = context
+        # Explicit checks rather than try/except: a missing field is common
+        # in item templates and raising per miss is the slow path in CPython.
+        for name, idx in steps:
+            if name:
+                if not hasattr(curr, "get"):
+                    return None
+                curr = curr.get(name)
+            if idx is not None:
+                if isinstance(curr, (list, tuple, str)):
+                    if not -len(curr) <= idx < len(curr):
+                        return None
                     curr = curr[idx]
+                elif hasattr(curr, "get"):
+                    curr = curr.get(idx)
                 else:
-                    if hasattr(curr, "get"):
-                        curr = curr.get(part)
-                    else:
-                        return None
-                
-                if curr is None:
                     return None
-            return curr
-        except Exception:
-            return None
+            if curr is None:
+                return None
+        return curr
+
+
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> Tuple[_Node, ...]:
+    return TemplateEngine._compile_segment(template, depth=0)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 from datetime import datetime
 import fnmatch
 import os
@@ -11,7 +11,9 @@ import subprocess
 
 from kano_backlog_core.config import ConfigLoader
 import frontmatter
+from frontmatter.default_handlers import YAMLHandler
 from kano_backlog_ops import item_utils, worklog
+from kano_backlog_ops.frontmatter import read_frontmatter_block
 
 
 @dataclass
@@ -28,9 +30,53 @@ class UidValidationResult:
     violations: List[UidViolation]
 
 
-def validate_uids(product: str | None = None, backlog_root: Path | None = None) -> List[UidValidationResult]:
+_UUID7_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-7[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}")
+
+
+def _is_uuid7(uid: str) -> bool:
+    """Return True for a canonical lowercase UUIDv7 string."""
+    # Length and version-nibble checks reject most non-v7 UIDs (e.g. v4) before
+    # the regex. uuid.UUID() is ~4x slower than the regex and also accepts
+    # non-canonical spellings (braces, urn:, no hyphens), so it is not used here.
+    return len(uid) == 36 and uid[14] == "7" and _UUID7_RE.fullmatch(uid) is not None
+
+
+def _load_item_metadata(item_path: Path) -> dict:
+    """Parse only the frontmatter of an item; the body is not read."""
+    block = read_frontmatter_block(item_path)
+    if block is not None:
+        meta = YAMLHandler().load(block) if block.strip() else {}
+        if isinstance(meta, dict):
+            return meta
+    # No clean fence (or non-mapping YAML): let python-frontmatter decide.
+    return frontmatter.loads(item_path.read_text(encoding="utf-8")).metadata
+
+
+def _check_item_uid(item_path: Path) -> Tuple[bool, Optional[UidViolation]]:
+    """Return (parsed, violation) for one item file."""
+    try:
+        meta = _load_item_metadata(item_path)
+    except Exception as exc:  # pragma: no cover - defensive
+        return False, UidViolation(item_path, "<unreadable>", f"Failed to parse frontmatter: {exc}")
+    uid = str(meta.get("uid", "")).lower()
+    if not uid:
+        return True, UidViolation(item_path, "<missing>", "Missing uid")
+    if not _is_uuid7(uid):
+        return True, UidViolation(item_path, uid, "UID is not UUIDv7")
+    return True, None
+
+
+def validate_uids(
+    product: str | None = None,
+    backlog_root: Path | None = None,
+    *,
+    max_workers: int | None = None,
+) -> List[UidValidationResult]:
     """Validate that all items use UUIDv7 UIDs.
 
+    Item files are checked on a thread pool (``max_workers``, default
+    ``cpu_count`` capped at 8; 1 disables it).
+
     Returns a list of per-product results with violations (empty list if all clean).
     """
 
@@ -55,28 +101,21 @@ def validate_uids(product: str | None = None, backlog_root: Path | None = None)
             if products_dir.exists():
                 product_roots.extend([p for p in products_dir.iterdir() if p.is_dir()])
 
-    v7_pattern = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-7[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$")
     results: list[UidValidationResult] = []
 
     for root in product_roots:
-        violations: list[UidViolation] = []
-        checked = 0
-        for item_path in (root / "items").rglob("*.md"):
-            name = item_path.name.lower()
-            if name.startswith("readme") or name.endswith(".index.md"):
-                continue
-            try:
-                post = frontmatter.loads(item_path.read_text(encoding="utf-8"))
-            except Exception as exc:  # pragma: no cover - defensive
-                violations.append(UidViolation(item_path, "<unreadable>", f"Failed to parse frontmatter: {exc}"))
-                continue
-            checked += 1
-            uid = str(post.get("uid", "")).lower()
-            if not uid:
-                violations.append(UidViolation(item_path, "<missing>", "Missing uid"))
-                continue
-            if not v7_pattern.match(uid):
-                violations.append(UidViolation(item_path, uid, "UID is not UUIDv7"))
+        item_paths = [
+            item_path
+            for item_path in (root / "items").rglob("*.md")
+            if not (
+                item_path.name.lower().startswith("readme")
+                or item_path.name.lower().endswith(".index.md")
+            )
+        ]
+        outcomes = item_utils.map_item_files(_check_item_uid, item_paths, max_workers)
+
+        violations = [violation for _, violation in outcomes if violation is not None]
+        checked = sum(1 for parsed, _ in outcomes if parsed)
         results.append(UidValidationResult(product=root.name, checked=checked, violations=violations))
 
     return results
@@ -878,6 +917,79 @@ def _git_show_file(repo_root: Path, commit: str, path: str) -> Optional[str]:
     return result.stdout
 
 
+class _GitCatFileBatch:
+    """One long-running `git cat-file --batch` serving many `<commit>:<path>` reads.
+
+    Restoring links reads one blob per broken link; this avoids a `git show`
+    spawn for each. Falls back to `_git_show_file` for anything the batch
+    protocol cannot express (paths with newlines, non-blob objects) or if the
+    process cannot be started.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        self._repo_root = repo_root
+        self._proc: Optional[subprocess.Popen] = None
+        self._failed = False
+
+    def __enter__(self) -> "_GitCatFileBatch":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+        finally:
+            if proc.stdout:
+                proc.stdout.close()
+
+    def _start(self) -> Optional[subprocess.Popen]:
+        if self._proc is None and not self._failed:
+            try:
+                self._proc = subprocess.Popen(
+                    ["git", "cat-file", "--batch"],
+                    cwd=str(self._repo_root),
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError:
+                self._failed = True
+        return self._proc
+
+    def read_text(self, commit: str, path: str) -> Optional[str]:
+        spec = f"{commit}:{path}"
+        proc = None if "\n" in spec else self._start()
+        if proc is None or proc.stdin is None or proc.stdout is None:
+            return _git_show_file(self._repo_root, commit, path)
+        try:
+            proc.stdin.write(spec.encode("utf-8") + b"\n")
+            proc.stdin.flush()
+            header = proc.stdout.readline().split()
+            if header and header[-1] in (b"missing", b"ambiguous"):
+                # "<spec> missing" / "<spec> ambiguous"; <spec> may contain spaces.
+                return None
+            _oid, obj_type, size = header
+            data = proc.stdout.read(int(size) + 1)[:-1]  # trailing LF
+        except (OSError, ValueError):
+            self.close()
+            self._failed = True
+            return _git_show_file(self._repo_root, commit, path)
+        if obj_type != b"blob":
+            return _git_show_file(self._repo_root, commit, path)
+        # Match `git show` read with text=True (universal newlines).
+        text = data.decode("utf-8", errors="replace")
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
 def _git_last_commit_for_path(repo_root: Path, path: str) -> Optional[str]:
     result = subprocess.run(
         ["git", "log", "-n", "1", "--format=%H", "--", path],
@@ -1367,109 +1479,110 @@ def restore_links_from_vcs(
             )
             continue
 
-        history_paths = _git_history_paths(repo_root)
-        checked_files = 0
-        for issue in issues:
-            checked_files += 1
-            target = _normalize_path_fragment(issue.target)
-            if not target or _matches_ignore(target, ignore_targets):
-                continue
+        with _GitCatFileBatch(repo_root) as cat_file:
+            history_paths = _git_history_paths(repo_root)
+            checked_files = 0
+            for issue in issues:
+                checked_files += 1
+                target = _normalize_path_fragment(issue.target)
+                if not target or _matches_ignore(target, ignore_targets):
+                    continue
 
-            candidates = _match_history_candidates(target, history_paths)
+                candidates = _match_history_candidates(target, history_paths)
 
-            if not candidates:
-                actions.append(
-                    LinkRestoreAction(
-                        source_path=issue.source_path,
-                        target=issue.target,
-                        status="missing",
-                        candidates=[],
-                        restored_path=None,
+                if not candidates:
+                    actions.append(
+                        LinkRestoreAction(
+                            source_path=issue.source_path,
+                            target=issue.target,
+                            status="missing",
+                            candidates=[],
+                            restored_path=None,
+                        )
                     )
-                )
-                continue
+                    continue
 
-            unique_candidates = sorted(set(candidates))
-            remapped_map: dict[str, list[str]] = {}
-            for candidate in unique_candidates:
-                remapped = _apply_remap_to_path(candidate, remap_roots)
-                remapped_map.setdefault(remapped, []).append(candidate)
+                unique_candidates = sorted(set(candidates))
+                remapped_map: dict[str, list[str]] = {}
+                for candidate in unique_candidates:
+                    remapped = _apply_remap_to_path(candidate, remap_roots)
+                    remapped_map.setdefault(remapped, []).append(candidate)
+
+                if len(remapped_map) > 1:
+                    actions.append(
+                        LinkRestoreAction(
+                            source_path=issue.source_path,
+                            target=issue.target,
+                            status="ambiguous",
+                            candidates=unique_candidates,
+                            restored_path=None,
+                        )
+                    )
+                    continue
 
-            if len(remapped_map) > 1:
-                actions.append(
-                    LinkRestoreAction(
-                        source_path=issue.source_path,
-                        target=issue.target,
-                        status="ambiguous",
-                        candidates=unique_candidates,
-                        restored_path=None,
+                remapped_target = next(iter(remapped_map.keys()))
+                original_candidates = remapped_map[remapped_target]
+                history_path = original_candidates[0]
+                for candidate in original_candidates:
+                    if _normalize_path_fragment(candidate).startswith(_normalize_path_fragment(remapped_target)):
+                        history_path = candidate
+                        break
+                commit = _git_last_commit_for_path(repo_root, history_path)
+                if not commit:
+                    actions.append(
+                        LinkRestoreAction(
+                            source_path=issue.source_path,
+                            target=issue.target,
+                            status="missing",
+                            candidates=unique_candidates,
+                            restored_path=None,
+                        )
                     )
-                )
-                continue
+                    continue
 
-            remapped_target = next(iter(remapped_map.keys()))
-            original_candidates = remapped_map[remapped_target]
-            history_path = original_candidates[0]
-            for candidate in original_candidates:
-                if _normalize_path_fragment(candidate).startswith(_normalize_path_fragment(remapped_target)):
-                    history_path = candidate
-                    break
-            commit = _git_last_commit_for_path(repo_root, history_path)
-            if not commit:
-                actions.append(
-                    LinkRestoreAction(
-                        source_path=issue.source_path,
-                        target=issue.target,
-                        status="missing",
-                        candidates=unique_candidates,
-                        restored_path=None,
+                restored_rel = remapped_target
+                restore_path = repo_root / restored_rel
+                if restore_path.exists():
+                    actions.append(
+                        LinkRestoreAction(
+                            source_path=issue.source_path,
+                            target=issue.target,
+                            status="exists",
+                            candidates=unique_candidates,
+                            restored_path=str(restore_path),
+                        )
                     )
-                )
-                continue
+                    continue
 
-            restored_rel = remapped_target
-            restore_path = repo_root / restored_rel
-            if restore_path.exists():
-                actions.append(
-                    LinkRestoreAction(
-                        source_path=issue.source_path,
-                        target=issue.target,
-                        status="exists",
-                        candidates=unique_candidates,
-                        restored_path=str(restore_path),
+                file_text = cat_file.read_text(commit, history_path)
+                if file_text is None:
+                    actions.append(
+                        LinkRestoreAction(
+                            source_path=issue.source_path,
+                            target=issue.target,
+                            status="missing",
+                            candidates=unique_candidates,
+                            restored_path=None,
+                        )
                     )
-                )
-                continue
+                    continue
+
+                if apply:
+                    restore_path.parent.mkdir(parents=True, exist_ok=True)
+                    restore_path.write_text(file_text, encoding="utf-8")
+                    status = "restored"
+                else:
+                    status = "would-restore"
 
-            file_text = _git_show_file(repo_root, commit, history_path)
-            if file_text is None:
                 actions.append(
                     LinkRestoreAction(
                         source_path=issue.source_path,
                         target=issue.target,
-                        status="missing",
+                        status=status,
                         candidates=unique_candidates,
-                        restored_path=None,
+                        restored_path=str(restore_path),
                     )
                 )
-                continue
-
-            if apply:
-                restore_path.parent.mkdir(parents=True, exist_ok=True)
-                restore_path.write_text(file_text, encoding="utf-8")
-                status = "restored"
-            else:
-                status = "would-restore"
-
-            actions.append(
-                LinkRestoreAction(
-                    source_path=issue.source_path,
-                    target=issue.target,
-                    status=status,
-                    candidates=unique_candidates,
-                    restored_path=str(restore_path),
-                )
-            )
 
         results.append(
             LinkRestoreResult(
@@ -98,6 +98,9 @@ def refresh_dashboards(
 
     grouped_items = _group_items(_collect_items(items_root))
     source_label = _describe_source(items_root, target_root)
+    # Every dashboard lives in views_root, so one VCS lookup (a git process
+    # spawn) serves them all.
+    metadata_block = _vcs_metadata_block(views_root, "min")
 
     dashboards: List[Path] = []
     for filename, title, groups in DASHBOARD_DEFINITIONS:
@@ -111,6 +114,7 @@ def refresh_dashboards(
             agent=agent,
             reproducible=True,
             meta_mode="min",
+            metadata_block=metadata_block,
         )
         output_path.write_text(content, encoding="utf-8")
         dashboards.append(output_path)
@@ -260,6 +264,7 @@ def _render_dashboard(
     agent: str,
     reproducible: bool = True,
     meta_mode: str = "min",
+    metadata_block: Optional[str] = None,
 ) -> str:
     lines: List[str] = []
     lines.append(f"# {title}")
@@ -267,9 +272,8 @@ def _render_dashboard(
     
     # Add VCS metadata instead of timestamp
     if reproducible:
-        workspace_root = _find_workspace_root(output_path)
-        vcs_meta = detect_vcs_metadata(workspace_root)
-        metadata_block = format_vcs_metadata(vcs_meta, meta_mode)
+        if metadata_block is None:
+            metadata_block = _vcs_metadata_block(output_path.parent, meta_mode)
         if metadata_block:
             lines.append(metadata_block)
             lines.append("")
@@ -310,6 +314,11 @@ def _render_dashboard(
     return "\n".join(lines) + "\n"
 
 
+def _vcs_metadata_block(views_dir: Path, meta_mode: str) -> str:
+    vcs_meta = detect_vcs_metadata(_find_workspace_root(views_dir))
+    return format_vcs_metadata(vcs_meta, meta_mode)
+
+
 def _ordered_types(types: List[str] | Dict[str, List[ItemSnapshot]]) -> List[str]:
     if isinstance(types, dict):
         candidates = list(types.keys())
@@ -1,8 +1,10 @@
+import functools
 import warnings
 
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+import typer.testing
 from hypothesis import settings
 
 # Silence expected deprecation warnings emitted when intentionally using legacy JSON configs in tests.
@@ -16,6 +18,12 @@ warnings.filterwarnings(
 settings.register_profile("kano-tests", database=None)
 settings.load_profile("kano-tests")
 
+# typer's CliRunner.invoke rebuilds the whole Click command tree from the Typer
+# app on every call (~70 ms for kano_backlog_cli.cli.app). The tree is static,
+# so build it once per app and reuse it across invocations.
+if hasattr(typer.testing, "_get_command"):
+    typer.testing._get_command = functools.lru_cache(maxsize=None)(typer.testing._get_command)
+
 
 def write_project_backlog_config(
     project_root: Path,
@@ -65,3 +73,27 @@ def write_project_backlog_config(
 
     path.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
     return path
+
+
+def scaffold_product(project_root: Path, name: str, prefix: str) -> Path:
+    """Create the standard product layout under project_root for tests.
+
+    Builds ``_kano/backlog/products/<name>`` with the per-type item buckets
+    and the decisions/views/_meta directories, and registers the product in
+    the project-level config.
+
+    Returns:
+        Path to the product root.
+    """
+    product_root = project_root / "_kano" / "backlog" / "products" / name
+    items_root = product_root / "items"
+
+    for item_type in ["epic", "feature", "userstory", "task", "bug"]:
+        (items_root / item_type / "0000").mkdir(parents=True, exist_ok=True)
+
+    for required_dir in ["decisions", "views", "_meta"]:
+        (product_root / required_dir).mkdir(exist_ok=True)
+
+    write_project_backlog_config(project_root, products={name: (name, prefix)})
+
+    return product_root
@@ -0,0 +1,38 @@
+"""Test body section parsing in canonical storage."""
+
+from kano_backlog_core.canonical import CanonicalStore
+from kano_backlog_core.models import ItemType
+
+
+def test_read_splits_body_into_sections(tmp_path):
+    store = CanonicalStore(tmp_path)
+    store.write(store.create(ItemType.TASK, "Sections"))
+    [path] = store.list_items()
+    text = path.read_text(encoding="utf-8")
+    frontmatter_end = text.index("\n---", 3) + len("\n---\n")
+    body = "\n".join(
+        [
+            "",
+            "# Context",
+            "Why this matters.",
+            "  # Goal  ",
+            "Ship it.",
+            "# Non-Goals",
+            "#Approach is not a heading",
+            "# Approach",
+            "",
+            "# Worklog",
+            "2026-01-01 [agent=a] first",
+            "",
+            "2026-01-02 [agent=a] second",
+        ]
+    )
+    path.write_text(text[:frontmatter_end] + body + "\n", encoding="utf-8")
+
+    item = store.read(path)
+
+    assert item.context == "Why this matters."
+    assert item.goal == "Ship it."
+    assert item.non_goals == "#Approach is not a heading"
+    assert item.approach is None
+    assert item.worklog == ["2026-01-01 [agent=a] first", "2026-01-02 [agent=a] second"]
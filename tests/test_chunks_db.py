@@ -1,24 +1,24 @@
 """Tests for canonical chunks DB (FTS5) operations."""
 
 import json
+import sqlite3
+import threading
 from pathlib import Path
 
 import pytest
 
-from kano_backlog_ops.backlog_chunks_db import build_chunks_db, query_chunks_fts
+from kano_backlog_ops import backlog_chunks_db
+from kano_backlog_ops.backlog_chunks_db import (
+    build_chunks_db,
+    close_read_connections,
+    query_chunks_fts,
+    query_chunks_fts_candidates,
+)
 
 from conftest import write_project_backlog_config
 
 
-def test_build_chunks_db_and_query(tmp_path: Path) -> None:
-    write_project_backlog_config(tmp_path)
-    backlog_root = tmp_path / "_kano" / "backlog"
-    product_root = backlog_root / "products" / "test-product"
-    items_root = product_root / "items" / "task" / "0000"
-    items_root.mkdir(parents=True)
-
-    item_path = items_root / "TEST-TSK-001_test-task.md"
-    item_content = """---
+_TASK_CONTENT = """---
 id: TEST-TSK-001
 uid: 01234567-89ab-cdef-0123-456789abcdef
 type: Task
@@ -40,17 +40,119 @@ This is a test task.
 # Goal
 Test the chunks DB build and query.
 """
-    item_path.write_text(item_content, encoding="utf-8")
 
+
+def _write_task_backlog(root: Path) -> tuple[Path, Path]:
+    write_project_backlog_config(root)
+    backlog_root = root / "_kano" / "backlog"
+    items_root = backlog_root / "products" / "test-product" / "items" / "task" / "0000"
+    items_root.mkdir(parents=True)
+
+    item_path = items_root / "TEST-TSK-001_test-task.md"
+    item_path.write_text(_TASK_CONTENT, encoding="utf-8")
+    return backlog_root, item_path
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _close_cached_connections():
+    """Release cached query connections so temp DB files are not held open."""
+    yield
+    close_read_connections()
+
+
+@pytest.fixture(scope="module")
+def built_chunks_db(tmp_path_factory: pytest.TempPathFactory):
+    """Build the single-task chunks DB once; query tests only read from it."""
+    backlog_root, _ = _write_task_backlog(tmp_path_factory.mktemp("chunks"))
     result = build_chunks_db(product="test-product", backlog_root=backlog_root, force=True)
+    return result, backlog_root
+
+
+def test_build_chunks_db_stats(built_chunks_db) -> None:
+    result, _ = built_chunks_db
     assert result.items_indexed == 1
     assert result.chunks_indexed > 0
     assert result.db_path.exists()
 
+
+def test_query_chunks_fts_hits(built_chunks_db) -> None:
+    _, backlog_root = built_chunks_db
     hits = query_chunks_fts(product="test-product", backlog_root=backlog_root, query="chunks", k=10)
     assert hits
     assert hits[0].item_id == "TEST-TSK-001"
     assert "products/test-product/items" in hits[0].item_path
+    assert isinstance(hits[0].score, float)
+
+
+def test_query_chunks_fts_candidates_match_hits(built_chunks_db) -> None:
+    _, backlog_root = built_chunks_db
+    hits = query_chunks_fts(product="test-product", backlog_root=backlog_root, query="chunks", k=10)
+    candidates = query_chunks_fts_candidates(
+        product="test-product", backlog_root=backlog_root, query="chunks", k=10
+    )
+    assert [c.chunk_id for c in candidates] == [h.chunk_id for h in hits]
+    assert candidates[0].bm25_score == pytest.approx(-hits[0].score)
+    assert "<mark>" in candidates[0].snippet
+
+
+def test_build_chunks_db_fts_matches_chunks_and_keeps_trigger(built_chunks_db) -> None:
+    result, _ = built_chunks_db
+    conn = sqlite3.connect(str(result.db_path))
+    try:
+        chunks = conn.execute("SELECT count(*) FROM chunks").fetchone()[0]
+        hits = conn.execute(
+            "SELECT count(*) FROM chunks_fts WHERE chunks_fts MATCH 'task'"
+        ).fetchone()[0]
+        triggers = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        }
+    finally:
+        conn.close()
+    assert chunks == result.chunks_indexed
+    assert hits >= 1
+    assert "chunks_fts_insert" in triggers
+
+
+def test_forced_rebuild_does_not_serve_stale_rows(tmp_path: Path) -> None:
+    backlog_root, item_path = _write_task_backlog(tmp_path)
+    build_chunks_db(product="test-product", backlog_root=backlog_root, force=True)
+    assert query_chunks_fts(product="test-product", backlog_root=backlog_root, query="chunks", k=10)
+
+    # Queries reuse a cached connection; a forced rebuild must not serve stale rows.
+    item_path.write_text(_TASK_CONTENT.replace("Test the chunks DB", "Exercise the rebuilt DB"), encoding="utf-8")
+    build_chunks_db(product="test-product", backlog_root=backlog_root, force=True)
+    assert query_chunks_fts(product="test-product", backlog_root=backlog_root, query="chunks", k=10) == []
+    assert query_chunks_fts(product="test-product", backlog_root=backlog_root, query="rebuilt", k=10)
+
+
+def test_stale_connection_closes_after_in_flight_query(tmp_path: Path) -> None:
+    backlog_root, item_path = _write_task_backlog(tmp_path)
+    result = build_chunks_db(product="test-product", backlog_root=backlog_root, force=True)
+
+    with backlog_chunks_db._read_connection(result.db_path) as old_conn:
+        # Rewrite the DB in place so the next lookup sees a new stat signature.
+        writer = sqlite3.connect(result.db_path)
+        try:
+            writer.execute("DELETE FROM chunks")
+            writer.commit()
+        finally:
+            writer.close()
+        replaced = threading.Event()
+
+        def lookup() -> None:
+            with backlog_chunks_db._read_connection(result.db_path):
+                replaced.set()
+
+        thread = threading.Thread(target=lookup)
+        thread.start()
+        # The replacement must wait for this block rather than close old_conn under it.
+        assert not replaced.wait(0.2)
+        assert old_conn.execute("SELECT COUNT(*) FROM items").fetchone() == (1,)
+    thread.join(5)
+    assert replaced.is_set()
+
+    close_read_connections()
+    assert backlog_chunks_db._READ_CONNECTIONS == {}
 
 
 def test_build_chunks_db_with_adr(tmp_path: Path) -> None:
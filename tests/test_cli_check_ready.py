@@ -10,6 +10,24 @@ from conftest import write_project_backlog_config
 
 runner = CliRunner()
 
+# Body carrying every section the Ready gate requires for a Task/Feature.
+_READY_BODY = """
+# Context
+Context
+
+# Goal
+Goal
+
+# Approach
+Approach
+
+# Acceptance Criteria
+AC
+
+# Risks / Dependencies
+Risks
+"""
+
 
 def _invoke_from(tmp_path: Path, args: list[str]):
     cwd_before = Path.cwd()
@@ -55,22 +73,7 @@ parent: TEST-FTR-0001
 created: 2026-01-01
 updated: 2026-01-01
 ---
-
-# Context
-Context
-
-# Goal
-Goal
-
-# Approach
-Approach
-
-# Acceptance Criteria
-AC
-
-# Risks / Dependencies
-Risks
-""", encoding="utf-8")
+""" + _READY_BODY, encoding="utf-8")
 
     # Run check-ready on Task (should FAIL because parent is not Ready)
     result = _invoke_from(
@@ -116,22 +119,7 @@ state: Proposed
 created: 2026-01-01
 updated: 2026-01-01
 ---
-
-# Context
-Context
-
-# Goal
-Goal
-
-# Approach
-Approach
-
-# Acceptance Criteria
-AC
-
-# Risks / Dependencies
-Risks
-""", encoding="utf-8")
+""" + _READY_BODY, encoding="utf-8")
 
     # Run check-ready again (should pass)
     result = _invoke_from(
@@ -180,22 +168,7 @@ parent: TEST-TSK-0001
 created: 2026-01-01
 updated: 2026-01-01
 ---
-
-# Context
-Context
-
-# Goal
-Goal
-
-# Approach
-Approach
-
-# Acceptance Criteria
-AC
-
-# Risks / Dependencies
-Risks
-""", encoding="utf-8")
+""" + _READY_BODY, encoding="utf-8")
 
     result = _invoke_from(
         tmp_path,
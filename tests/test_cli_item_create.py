@@ -7,26 +7,14 @@ from typer.testing import CliRunner
 
 from kano_backlog_cli.cli import app
 
-from conftest import write_project_backlog_config
+from conftest import scaffold_product
 
 runner = CliRunner()
 
 
 def _scaffold_product(tmp_path: Path, name: str = "demo") -> tuple[Path, Path]:
-    backlog_root = tmp_path / "_kano" / "backlog"
-    product_root = backlog_root / "products" / name
-    items_root = product_root / "items"
-
-    prefix = name[:2].upper()
-    write_project_backlog_config(tmp_path, products={name: (name, prefix)})
-
-    for item_type in ["epic", "feature", "userstory", "task", "bug"]:
-        (items_root / item_type / "0000").mkdir(parents=True, exist_ok=True)
-
-    for required_dir in ["decisions", "views", "_meta"]:
-        (product_root / required_dir).mkdir(parents=True, exist_ok=True)
-
-    return backlog_root, product_root
+    product_root = scaffold_product(tmp_path, name, name[:2].upper())
+    return tmp_path / "_kano" / "backlog", product_root
 
 
 def test_item_alias_help_lists_create():
@@ -172,3 +160,41 @@ def test_item_create_unknown_product_fails(tmp_path: Path):
         assert "product" in result.output.lower() or "backlog" in result.output.lower()
     finally:
         os.chdir(cwd_before)
+
+
+def test_item_read_json_round_trips_created_item(tmp_path: Path):
+    _scaffold_product(tmp_path, name="demo-product")
+    cwd_before = Path.cwd()
+    os.chdir(tmp_path)
+    try:
+        created = runner.invoke(
+            app,
+            [
+                "item",
+                "create",
+                "--type",
+                "task",
+                "--title",
+                "Read Me ✓",
+                "--priority",
+                "P2",
+                "--agent",
+                "tester",
+                "--product",
+                "demo-product",
+            ],
+        )
+        assert created.exit_code == 0, created.output
+        created_line = next(line for line in created.output.splitlines() if line.startswith("OK: Created:"))
+        created_id = created_line.split(":", 2)[-1].strip()
+
+        result = runner.invoke(app, ["item", "read", created_id, "--product", "demo-product", "--format", "json"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output.endswith("}\n")
+        assert result.output.isascii()
+        data = json.loads(result.output)
+        assert (data["id"], data["title"]) == (created_id, "Read Me ✓")
+        assert data["file_path"].endswith(".md")
+    finally:
+        os.chdir(cwd_before)
@@ -204,3 +204,50 @@ def test_invalid_toml_raises_error(tmp_path: Path):
     
     with pytest.raises(ConfigError, match="Failed to load TOML"):
         ConfigLoader.load_defaults(backlog_root)
+
+
+def test_project_config_cache_returns_copies_and_sees_edits(tmp_path: Path):
+    """Cached project configs are isolated per caller and refreshed on change."""
+    from conftest import write_project_backlog_config
+    from kano_backlog_core.project_config import ProjectConfigLoader
+
+    config_path = write_project_backlog_config(tmp_path, products={"demo": ("demo", "DEM")})
+
+    first = ProjectConfigLoader.load_project_config(config_path)
+    first.defaults["auto_refresh"] = True
+    first.products.clear()
+
+    second = ProjectConfigLoader.load_project_config(config_path)
+    assert second.defaults["auto_refresh"] is False
+    assert second.list_products() == ["demo"]
+
+    write_project_backlog_config(
+        tmp_path, products={"demo": ("demo", "DEM"), "other": ("other", "OTH")}
+    )
+    assert sorted(ProjectConfigLoader.load_project_config(config_path).list_products()) == [
+        "demo",
+        "other",
+    ]
+
+
+def test_toml_cache_returns_copies_and_sees_edits(tmp_path: Path):
+    """Cached TOML reads are isolated per caller and refreshed on change."""
+    defaults_dir = tmp_path / "_kano" / "backlog" / "_shared"
+    defaults_dir.mkdir(parents=True)
+    toml_path = defaults_dir / "defaults.toml"
+    toml_path.write_text('[views]\nauto_refresh = true\n', encoding="utf-8")
+    backlog_root = tmp_path / "_kano" / "backlog"
+
+    first = ConfigLoader.load_defaults(backlog_root)
+    first["views"]["auto_refresh"] = False
+
+    assert ConfigLoader.load_defaults(backlog_root) == {"views": {"auto_refresh": True}}
+
+    toml_path.write_text('[views]\nauto_refresh = false\nengine = "plain"\n', encoding="utf-8")
+    assert ConfigLoader.load_defaults(backlog_root)["views"] == {
+        "auto_refresh": False,
+        "engine": "plain",
+    }
+
+    toml_path.unlink()
+    assert ConfigLoader.load_defaults(backlog_root) == {}
@@ -69,3 +69,18 @@ def test_version_accessible_from_cli():
     # Verify it follows semantic versioning pattern (basic check)
     parts = __version__.split(".")
     assert len(parts) >= 2, f"Version '{__version__}' should have at least MAJOR.MINOR"
+
+
+def test_cli_import_defers_core_and_ops():
+    """Importing the CLI (e.g. for `--help`) must not load core or ops modules."""
+    import subprocess
+
+    src = Path(__file__).parent.parent / "src"
+    code = (
+        "import sys; sys.path.insert(0, sys.argv[1]); import kano_backlog_cli.cli; "
+        "print(sorted(m for m in sys.modules if m.startswith(('kano_backlog_core', 'kano_backlog_ops'))))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code, str(src)], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
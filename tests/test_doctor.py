@@ -1692,3 +1692,29 @@ class TestDoctorEnvironmentDetectionProperty:
         )
         assert has_actionable_info, \
             f"Details should contain actionable information: {result.details}"
+
+
+class TestHashBackendCheck:
+    """Tests for the SHA-256 backend report."""
+
+    def test_openssl_backend_passes(self):
+        from kano_backlog_cli.commands.doctor import check_hash_backend
+
+        backend = {"implementation": "openssl", "module": "_hashlib", "openssl_version": "OpenSSL 3.0.0"}
+        with patch("kano_backlog_core.embedding.noop.sha256_backend", return_value=backend):
+            result = check_hash_backend()
+
+        assert result.name == "Hash Backend"
+        assert result.passed is True
+        assert "OpenSSL 3.0.0" in result.message
+
+    def test_builtin_backend_is_a_warning(self):
+        from kano_backlog_cli.commands.doctor import check_hash_backend
+
+        backend = {"implementation": "builtin", "module": "_sha256", "openssl_version": "unavailable"}
+        with patch("kano_backlog_core.embedding.noop.sha256_backend", return_value=backend):
+            result = check_hash_backend()
+
+        assert result.passed is True
+        assert "warning" in result.message.lower()
+        assert "OPENSSL_ia32cap" in result.details
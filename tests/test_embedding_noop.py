@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+
+import pytest
+
+from kano_backlog_core.embedding import NoOpEmbeddingAdapter, resolve_embedder
+
+
+def _reference_vector(text: str, dimension: int) -> list[float]:
+    h = hashlib.sha256(text.encode("utf-8")).digest()
+    return [(h[i % len(h)] / 255.0) * 2 - 1 for i in range(dimension)]
+
+
+def test_noop_default_matches_sha256_reference() -> None:
+    adapter = NoOpEmbeddingAdapter(dimension=64)
+    texts = ["hello", "", "multi-byte: 你好"]
+
+    results = adapter.embed_batch(texts)
+
+    assert len(results) == len(texts)
+    for text, res in zip(texts, results):
+        assert list(res.vector) == pytest.approx(_reference_vector(text, 64))
+        assert res.telemetry.dimension == 64
+        assert res.telemetry.token_count.count == len(text) // 4
+
+
+def test_noop_is_deterministic_across_instances() -> None:
+    a = NoOpEmbeddingAdapter(dimension=40).embed_batch(["same text"])[0]
+    b = NoOpEmbeddingAdapter(dimension=40).embed_batch(["same text"])[0]
+    assert list(a.vector) == list(b.vector)
+
+
+def test_noop_unknown_hash_algorithm_raises() -> None:
+    with pytest.raises(ValueError, match="hash_algorithm"):
+        NoOpEmbeddingAdapter(hash_algorithm="md5")
+
+
+def test_noop_blake3_optional_dependency() -> None:
+    if importlib.util.find_spec("blake3") is None:
+        with pytest.raises(ImportError, match="blake3"):
+            NoOpEmbeddingAdapter(hash_algorithm="blake3")
+        return
+
+    res = NoOpEmbeddingAdapter(dimension=32, hash_algorithm="blake3").embed_batch(["x"])[0]
+    assert len(res.vector) == 32
+    assert all(-1.0 <= v <= 1.0 for v in res.vector)
+
+
+def test_resolve_embedder_threads_hash_algorithm() -> None:
+    adapter = resolve_embedder({"provider": "noop", "dimension": 8, "hash_algorithm": "sha256"})
+    assert isinstance(adapter, NoOpEmbeddingAdapter)
+    assert adapter.hash_algorithm == "sha256"
+
+
+def test_noop_shares_telemetry_for_equal_token_counts() -> None:
+    adapter = NoOpEmbeddingAdapter(dimension=8)
+    a, b, c = adapter.embed_batch(["abcd", "wxyz", "abcdefgh"])
+
+    assert a.telemetry is b.telemetry
+    assert a.telemetry.token_count.count == 1
+    assert c.telemetry.token_count.count == 2
+    assert a.telemetry.token_count.tokenizer_id == "heuristic:noop-embedding"
+
+
+def test_noop_soa_batch_matches_row_results() -> None:
+    adapter = NoOpEmbeddingAdapter(dimension=48)
+    texts = ["alpha", "beta", "gamma delta"]
+
+    batch = adapter.embed_batch_soa(texts)
+    rows = adapter.embed_batch(texts)
+
+    assert len(batch) == 3
+    assert len(batch.vectors) == 3 * 48
+    assert batch.vectors.typecode == "f"
+    for i, row in enumerate(rows):
+        assert batch.vector(i) == list(row.vector)
+        assert batch.token_counts[i] == row.telemetry.token_count
+
+    unpacked = batch.to_results()
+    assert [list(r.vector) for r in unpacked] == [list(r.vector) for r in rows]
+    assert unpacked[0].telemetry.provider_id == "noop"
+
+
+def test_default_soa_columnarizes_embed_batch() -> None:
+    from kano_backlog_core.embedding import EmbeddingAdapter, EmbeddingBatch
+
+    class RowOnly(EmbeddingAdapter):
+        def embed_batch(self, texts):
+            return NoOpEmbeddingAdapter(dimension=4).embed_batch(texts)
+
+    batch = RowOnly("row-only").embed_batch_soa(["a", "b"])
+    assert isinstance(batch, EmbeddingBatch)
+    assert batch.dimension == 4
+    assert len(batch) == 2
+    assert batch.vector(1) == list(NoOpEmbeddingAdapter(dimension=4).embed_batch(["b"])[0].vector)
+
+    empty = RowOnly("row-only").embed_batch_soa([])
+    assert len(empty) == 0
+    assert empty.model_name == "row-only"
+
+
+def test_noop_int8_vectors_dequantize_close_to_float() -> None:
+    float_res = NoOpEmbeddingAdapter(dimension=64).embed_batch(["quantize me"])[0]
+    int8_adapter = NoOpEmbeddingAdapter(dimension=64, dtype="int8")
+    int8_res = int8_adapter.embed_batch(["quantize me"])[0]
+
+    assert int8_res.scale == pytest.approx(2.0 / 255.0)
+    assert all(isinstance(q, int) and -128 <= q <= 127 for q in int8_res.vector)
+    dequantized = [q * int8_res.scale for q in int8_res.vector]
+    assert dequantized == pytest.approx(list(float_res.vector), abs=1.0 / 255.0 + 1e-6)
+    assert float_res.scale is None
+
+    batch = int8_adapter.embed_batch_soa(["quantize me"])
+    assert batch.vectors.typecode == "b"
+    assert batch.scale == int8_res.scale
+    assert batch.vector(0) == list(int8_res.vector)
+
+
+def test_noop_unknown_dtype_raises() -> None:
+    with pytest.raises(ValueError, match="dtype"):
+        NoOpEmbeddingAdapter(dtype="float16")
+
+
+def test_noop_seed_cache_is_transparent() -> None:
+    cached = NoOpEmbeddingAdapter(dimension=16, cache_size=2)
+    uncached = NoOpEmbeddingAdapter(dimension=16, cache_size=0)
+    texts = ["dup", "dup", "other", "third", "dup"]
+
+    first = [list(r.vector) for r in cached.embed_batch(texts)]
+    second = [list(r.vector) for r in cached.embed_batch(texts)]
+    expected = [list(r.vector) for r in uncached.embed_batch(texts)]
+
+    assert first == second == expected
+    first[0][0] = 99.0
+    assert cached.embed_batch(["dup"])[0].vector[0] != 99.0
+
+
+def test_resolve_embedder_unknown_provider_lists_available() -> None:
+    with pytest.raises(ValueError, match=r"Unknown embedding provider: nope \(available: noop, "):
+        resolve_embedder({"provider": "nope"})
+
+
+def test_embed_batch_async_limits_concurrency() -> None:
+    import asyncio
+    import threading
+    import time
+
+    class Tracking(NoOpEmbeddingAdapter):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.active = 0
+            self.peak = 0
+            self._lock = threading.Lock()
+
+        def embed_batch(self, texts):
+            with self._lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.01)
+            try:
+                return super().embed_batch(texts)
+            finally:
+                with self._lock:
+                    self.active -= 1
+
+    async def fan_out(adapter):
+        return await asyncio.gather(*(adapter.embed_batch_async([str(i)]) for i in range(6)))
+
+    serial = Tracking(dimension=4)
+    results = asyncio.run(fan_out(serial))
+    assert serial.peak == 1
+    assert [list(r[0].vector) for r in results] == [
+        list(NoOpEmbeddingAdapter(dimension=4).embed_batch([str(i)])[0].vector) for i in range(6)
+    ]
+
+    # A fresh event loop gets a fresh semaphore.
+    asyncio.run(fan_out(serial))
+
+    wide = Tracking(dimension=4, max_concurrent=3)
+    asyncio.run(fan_out(wide))
+    assert 1 <= wide.peak <= 3
+
+
+def test_resolve_embedder_threads_max_concurrent() -> None:
+    assert resolve_embedder({"provider": "noop"}).max_concurrent == 1
+    adapter = resolve_embedder({"provider": "noop", "options": {"max_concurrent": 4}})
+    assert adapter.max_concurrent == 4
+    with pytest.raises(ValueError, match="max_concurrent"):
+        NoOpEmbeddingAdapter(max_concurrent=0)
+
+
+def test_swar_token_estimator_matches_reference() -> None:
+    from kano_backlog_core.embedding._token_estimator import estimate_tokens
+
+    def reference(text: str) -> int:
+        data = text.encode("utf-8")
+        words = sum(
+            1
+            for i, b in enumerate(data)
+            if b not in b" \t\n\r" and (i == 0 or data[i - 1] in b" \t\n\r")
+        )
+        return words + sum(1 for b in data if b >= 0xC0)
+
+    for text in ["", " ", "hello", "  two  words\n", "a\tb\rc\nd", "你好 世界", "café ok", "x" * 37]:
+        assert estimate_tokens(text) == reference(text), text
+
+
+def test_noop_swar_token_estimator_option() -> None:
+    adapter = resolve_embedder({"provider": "noop", "dimension": 8, "token_estimator": "swar"})
+    assert adapter.token_estimator == "swar"
+    res = adapter.embed_batch(["one two three", "你好"])
+    assert [r.telemetry.token_count.count for r in res] == [3, 3]
+    assert adapter.embed_batch_soa(["one two three"]).token_counts[0].count == 3
+    with pytest.raises(ValueError, match="token_estimator"):
+        NoOpEmbeddingAdapter(token_estimator="bpe")
+
+
+@pytest.mark.parametrize("dtype", ["float32", "int8"])
+@pytest.mark.parametrize("dimension", [1, 31, 32, 33, 100])
+def test_noop_soa_fused_synthesis_matches_rows(dtype: str, dimension: int) -> None:
+    adapter = NoOpEmbeddingAdapter(dimension=dimension, dtype=dtype)
+    texts = ["a", "", "longer text here"]
+
+    batch = adapter.embed_batch_soa(texts)
+
+    assert len(batch.vectors) == len(texts) * dimension
+    for i, row in enumerate(adapter.embed_batch(texts)):
+        assert batch.vector(i) == list(row.vector)
+
+
+def test_noop_soa_reuses_scratch_without_aliasing() -> None:
+    adapter = NoOpEmbeddingAdapter(dimension=16)
+
+    first = adapter.embed_batch_soa(["one", "two"])
+    scratch = adapter._scratch.buffer
+    second = adapter.embed_batch_soa(["three"])
+
+    assert adapter._scratch.buffer is scratch
+    assert first.vector(0) == list(adapter.embed_batch(["one"])[0].vector)
+    assert second.vector(0) == list(adapter.embed_batch(["three"])[0].vector)
+
+    large = adapter.embed_batch_soa([str(i) for i in range(100)])
+    assert len(adapter._scratch.buffer) >= 100 * 16 * 8
+    assert large.vector(99) == list(adapter.embed_batch(["99"])[0].vector)
+
+
+def test_noop_parallel_seeding_matches_serial() -> None:
+    from kano_backlog_core.embedding.noop import PARALLEL_THRESHOLD
+
+    texts = [f"text {i} " * (i % 7 + 1) for i in range(PARALLEL_THRESHOLD * 3 + 5)]
+    serial = NoOpEmbeddingAdapter(dimension=12)
+    parallel = resolve_embedder({"provider": "noop", "dimension": 12, "workers": 4})
+
+    assert parallel.workers == 4
+    assert [list(r.vector) for r in parallel.embed_batch(texts)] == [
+        list(r.vector) for r in serial.embed_batch(texts)
+    ]
+    assert parallel.embed_batch_soa(texts).vectors == serial.embed_batch_soa(texts).vectors
+    assert NoOpEmbeddingAdapter(workers=0).workers >= 1
+
+
+def test_noop_adapters_share_seeding_pools() -> None:
+    from kano_backlog_core.embedding import noop
+
+    texts = [f"text {i}" for i in range(noop.PARALLEL_THRESHOLD + 1)]
+    noop.shutdown_seed_pools()
+    for _ in range(3):
+        NoOpEmbeddingAdapter(dimension=8, workers=3).embed_batch(texts)
+    NoOpEmbeddingAdapter(dimension=8, workers=2).embed_batch(texts)
+
+    assert sorted(noop._SEED_POOLS) == [2, 3]
+    noop.shutdown_seed_pools()
+    assert noop._SEED_POOLS == {}
+
+
+def test_noop_kernels_are_specialised_per_dimension() -> None:
+    from kano_backlog_core.embedding.noop import _get_kernel
+
+    assert _get_kernel(1536, "float32") is _get_kernel(1536, "float32")
+    assert _get_kernel(1536, "float32") is not _get_kernel(1537, "float32")
+    for dimension in (1536, 1537, 5):
+        res = NoOpEmbeddingAdapter(dimension=dimension).embed_batch(["kernel"])[0]
+        assert list(res.vector) == pytest.approx(_reference_vector("kernel", dimension))
+
+
+def test_noop_vectors_are_compact_float32_arrays() -> None:
+    from array import array
+
+    res = NoOpEmbeddingAdapter(dimension=64).embed_batch(["compact"])[0]
+
+    assert isinstance(res.vector, array)
+    assert res.vector.typecode == "f"
+    assert len(res.vector) == 64
+    assert list(res.vector) == pytest.approx(_reference_vector("compact", 64), abs=1e-6)
+
+
+def test_openai_adapter_shares_one_client_across_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    import sys
+    import threading
+    import time
+    import types
+    from concurrent.futures import ThreadPoolExecutor
+
+    from kano_backlog_core.embedding.openai_adapter import OpenAIEmbeddingAdapter
+
+    created: list[object] = []
+
+    class FakeClient:
+        def __init__(self, **kwargs: object) -> None:
+            time.sleep(0.01)  # widen the race window
+            created.append(self)
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=FakeClient))
+    adapter = OpenAIEmbeddingAdapter(api_key="k", max_concurrent=4)
+    barrier = threading.Barrier(4)
+
+    def init(_: int) -> object:
+        barrier.wait()
+        adapter._ensure_client()
+        return adapter._client
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        clients = list(pool.map(init, range(4)))
+
+    assert len(created) == 1
+    assert all(c is created[0] for c in clients)
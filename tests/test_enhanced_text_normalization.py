@@ -76,6 +76,10 @@ class TestEnhancedTextNormalization:
         assert "\x01" not in result
         assert "line1line2line3" == result
 
+        # Format characters (Cf) stay; private-use and unassigned code points go.
+        text = "a\u200bb\ue000c\u0378d\x7f\ue000e"
+        assert normalize_text(text) == "a\u200bbcde"
+
     def test_final_cleanup_trailing_whitespace(self) -> None:
         """Test final cleanup removes trailing whitespace."""
         test_cases = [
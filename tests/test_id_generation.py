@@ -4,7 +4,7 @@ import concurrent.futures
 import sqlite3
 import pytest
 from pathlib import Path
-from kano_backlog_ops.item_utils import get_next_id_from_db
+from kano_backlog_ops.item_utils import find_next_number, get_next_id_from_db
 from conftest import write_project_backlog_config
 
 def test_atomic_id_generation_concurrent(tmp_path: Path):
@@ -112,3 +112,28 @@ def test_sync_sequences_dry_run(tmp_path: Path):
     assert row is not None
     assert row[0] == 6
     conn.close()
+
+
+def test_find_next_number_scans_only_matching_filenames(tmp_path: Path):
+    """Filesystem fallback takes the max ID of the prefix/type across all folders."""
+    items_root = tmp_path / "items"
+    files = [
+        "task/0000/TEST-TSK-0007_alpha.md",
+        "task/0100/TEST-TSK-0123_beta.md",
+        "tasks/0200/TEST-TSK-0201_legacy-folder.md",
+        "bug/0900/TEST-BUG-0950_other-type.md",
+        "task/0900/OTHER-TSK-0999_other-prefix.md",
+        "task/0900/TEST-TSK-0998.md",
+        "task/0900/TEST-TSK-0997_not-markdown.txt",
+        "task/README.md",
+        "task/0000/TEST-TSK-0996_x.index.md",
+    ]
+    for rel in files:
+        path = items_root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+    assert find_next_number(items_root, "TEST", "TSK") == 202
+    assert find_next_number(items_root, "TEST", "BUG") == 951
+    assert find_next_number(items_root, "TEST", "EPIC") == 1
+    assert find_next_number(tmp_path / "missing", "TEST", "TSK") == 1
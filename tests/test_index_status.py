@@ -118,3 +118,40 @@ None.
     assert len(status.indexes) == 1
     assert status.indexes[0].exists
     assert status.indexes[0].item_count == 1
+
+
+def test_load_items_parallel_matches_serial(tmp_path):
+    """Threaded item loading keeps list order and skips unparsable files."""
+    from kano_backlog_ops.backlog_index import _load_items
+    from kano_backlog_ops.item_utils import _PARALLEL_MIN_ITEMS
+
+    items_root = tmp_path / "items" / "task" / "0000"
+    items_root.mkdir(parents=True)
+    for n in range(_PARALLEL_MIN_ITEMS + 6):
+        (items_root / f"TEST-TSK-{n:04d}.md").write_text(
+            f"""---
+id: TEST-TSK-{n:04d}
+uid: 01234567-89ab-cdef-0123-456789ab{n:04d}
+type: Task
+state: Proposed
+title: Task {n}
+created: '2026-01-23'
+updated: '2026-01-23'
+---
+
+# Context
+Task {n}.
+""",
+            encoding="utf-8",
+        )
+    (items_root / "TEST-TSK-broken.md").write_text("---\nid: [\n---\n", encoding="utf-8")
+    store = CanonicalStore(tmp_path)
+    paths = sorted(store.list_items())
+
+    serial = _load_items(store, paths, max_workers=1)
+    parallel = _load_items(store, paths, max_workers=4)
+
+    assert len(serial) == len(paths) - 1
+    assert [(p, item.id, mtime) for p, item, mtime in parallel] == [
+        (p, item.id, mtime) for p, item, mtime in serial
+    ]
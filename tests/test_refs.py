@@ -0,0 +1,39 @@
+"""Test reference resolution against canonical storage."""
+
+import pytest
+
+from kano_backlog_core.canonical import CanonicalStore
+from kano_backlog_core.errors import RefNotFoundError
+from kano_backlog_core.models import ItemType
+from kano_backlog_core.refs import RefResolver
+
+
+def _store_with_items(tmp_path, count: int = 3) -> CanonicalStore:
+    store = CanonicalStore(tmp_path)
+    for i in range(count):
+        store.write(store.create(ItemType.TASK, f"Task {i}"))
+    return store
+
+
+def test_resolve_display_id_and_uid(tmp_path):
+    store = _store_with_items(tmp_path)
+    resolver = RefResolver(store)
+    target = store.read(sorted(store.list_items())[1])
+
+    assert resolver.resolve(target.id).uid == target.uid
+    assert resolver.resolve(target.uid).id == target.id
+    with pytest.raises(RefNotFoundError):
+        resolver.resolve("KABSD-TSK-0999")
+
+
+def test_resolve_display_id_without_matching_file_name(tmp_path):
+    store = _store_with_items(tmp_path)
+    path = sorted(store.list_items())[0]
+    item = store.read(path)
+    renamed = path.with_name("renamed.md")
+    path.rename(renamed)
+
+    resolved = RefResolver(store).resolve(item.id)
+
+    assert resolved.uid == item.uid
+    assert resolved.file_path == renamed
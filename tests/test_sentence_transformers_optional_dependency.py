@@ -41,3 +41,28 @@ def test_resolve_embedder_huggingface_alias_optional_dependency() -> None:
 
     adapter = resolve_embedder(cfg)
     assert adapter.model_name == cfg["model"]
+
+
+def test_embed_batch_returns_compact_float32_rows() -> None:
+    np = pytest.importorskip("numpy")
+    from array import array
+
+    from kano_backlog_core.embedding.sentence_transformers_adapter import (
+        SentenceTransformersEmbeddingAdapter,
+    )
+
+    matrix = np.arange(6, dtype=np.float32).reshape(2, 3) / 4
+
+    class FakeModel:
+        max_seq_length = 128
+
+        def encode(self, texts, **kwargs):
+            return matrix[: len(texts)]
+
+    adapter = SentenceTransformersEmbeddingAdapter(model_name="fake", dimension=3)
+    adapter._model = FakeModel()
+
+    results = adapter.embed_batch(["a", "b"])
+
+    assert [type(r.vector) for r in results] == [array, array]
+    assert [list(r.vector) for r in results] == matrix.tolist()
@@ -116,6 +116,26 @@ def test_template_engine_if_eq_helpers():
     assert "PENDING" not in engine.render(tpl, {"status": "done"})
 
 
+def test_template_engine_index_paths():
+    """Dot paths with [n] indexes resolve; malformed indexes render empty."""
+    engine = TemplateEngine()
+    ctx = {"meta": {"tags": ["a", "b"]}, "rows": [{"name": "first"}]}
+    tpl = "{{meta.tags[1]}}|{{rows[0].name}}|{{meta.tags[x]}}|{{meta.missing.deep}}"
+    assert engine.render(tpl, ctx) == "b|first||"
+    assert engine.render(tpl, ctx) == "b|first||"
+    # Out-of-range, negative and non-container lookups never raise.
+    tpl = "{{meta.tags[5]}}|{{meta.tags[-1]}}|{{rows[0].name.x}}|{{meta.tags[0].y}}|{{nope[0]}}"
+    assert engine.render(tpl, ctx) == "|b|||"
+
+
+def test_template_engine_malformed_blocks():
+    """Stray closing tags are dropped; an unclosed block runs to the end."""
+    engine = TemplateEngine()
+    tpl = "a{{/each}}b{{#each items}}[{{this}}]"
+    assert engine.render(tpl, {"items": [1, 2]}) == "ab[1][2]"
+    assert engine.render(tpl, {"items": []}) == "ab"
+
+
 def test_evidence_pack_json_roundtrip(sample_pack):
     """Verify JSON serialization and deserialization."""
     json_str = sample_pack.to_json()
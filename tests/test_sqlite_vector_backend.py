@@ -0,0 +1,331 @@
+"""Tests for SQLiteVectorBackend storage and query scoring."""
+
+import math
+import struct
+from unittest.mock import patch
+
+import pytest
+
+from kano_backlog_core.vector import sqlite_backend
+from kano_backlog_core.vector.sqlite_backend import SQLiteVectorBackend
+from kano_backlog_core.vector.types import VectorChunk
+
+
+VECTORS = {
+    "a": [1.0, 0.0, 0.0, 0.0],
+    "b": [0.6, 0.8, 0.0, 0.0],
+    "c": [0.0, 0.0, 1.0, 0.0],
+    "d": [-1.0, 0.5, 0.25, 2.0],
+    "zero": [0.0, 0.0, 0.0, 0.0],
+}
+QUERY = [0.9, 0.3, 0.1, -0.2]
+
+
+def _backend(
+    tmp_path, metric: str = "cosine", storage_format: str = "binary", quantization: str = "none"
+) -> SQLiteVectorBackend:
+    backend = SQLiteVectorBackend(
+        str(tmp_path / f"vectors.{metric}.{storage_format}.{quantization}.db"),
+        storage_format=storage_format,
+        quantization=quantization,
+    )
+    backend.prepare({}, dims=4, metric=metric)
+    for chunk_id, vector in VECTORS.items():
+        backend.upsert(
+            VectorChunk(chunk_id=chunk_id, text=f"text {chunk_id}", metadata={"id": chunk_id}, vector=vector)
+        )
+    backend.persist()
+    return backend
+
+
+def _expected_scores_for(vector, metric: str) -> float:
+    def dot(u, v):
+        return sum(x * y for x, y in zip(u, v))
+
+    if metric == "ip":
+        return dot(vector, QUERY)
+    if metric == "l2":
+        return -math.sqrt(sum((x - y) ** 2 for x, y in zip(vector, QUERY)))
+    norms = math.sqrt(dot(vector, vector)) * math.sqrt(dot(QUERY, QUERY))
+    return dot(vector, QUERY) / norms if norms else 0.0
+
+
+def _expected_scores(metric: str) -> dict:
+    return {chunk_id: _expected_scores_for(vector, metric) for chunk_id, vector in VECTORS.items()}
+
+
+@pytest.mark.parametrize("metric", ["cosine", "ip", "l2"])
+@pytest.mark.parametrize("storage_format", ["binary", "json"])
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_query_scores_and_ranking(tmp_path, metric, storage_format, use_numpy) -> None:
+    if use_numpy and sqlite_backend._numpy() is None:
+        pytest.skip("numpy not installed")
+    backend = _backend(tmp_path, metric, storage_format)
+    expected = _expected_scores(metric)
+
+    if use_numpy:
+        results = backend.query(QUERY, k=3)
+    else:
+        with patch.object(sqlite_backend, "_numpy", return_value=None):
+            results = backend.query(QUERY, k=3)
+
+    assert [r.chunk_id for r in results] == sorted(expected, key=expected.get, reverse=True)[:3]
+    for result in results:
+        assert result.score == pytest.approx(expected[result.chunk_id], abs=1e-6)
+        assert result.text == f"text {result.chunk_id}"
+        assert result.metadata == {"id": result.chunk_id}
+
+
+def test_query_chunk_id_filter(tmp_path) -> None:
+    backend = _backend(tmp_path)
+
+    results = backend.query(QUERY, k=10, filters={"chunk_ids": ["c", "d"]})
+
+    assert sorted(r.chunk_id for r in results) == ["c", "d"]
+    assert backend.query(QUERY, k=10, filters={"chunk_ids": []}) == []
+
+
+def test_query_dims_mismatch_raises(tmp_path) -> None:
+    backend = _backend(tmp_path)
+
+    with pytest.raises(ValueError, match="dims mismatch"):
+        backend.query([1.0, 0.0], k=1)
+
+
+def test_query_matrix_tracks_local_writes(tmp_path) -> None:
+    if sqlite_backend._numpy() is None:
+        pytest.skip("numpy not installed")
+    backend = _backend(tmp_path, metric="ip")
+    assert backend.query(QUERY, k=1)[0].chunk_id == "a"
+
+    backend.upsert(VectorChunk(chunk_id="e", text="text e", metadata={}, vector=[5.0, 0.0, 0.0, 0.0]))
+    assert backend.query(QUERY, k=1)[0].chunk_id == "e"
+
+    backend.delete("e")
+    assert backend.query(QUERY, k=1)[0].chunk_id == "a"
+    assert "e" not in {r.chunk_id for r in backend.query(QUERY, k=10)}
+
+
+def test_query_matrix_tracks_other_connections(tmp_path) -> None:
+    if sqlite_backend._numpy() is None:
+        pytest.skip("numpy not installed")
+    reader = _backend(tmp_path, metric="ip")
+    assert reader.query(QUERY, k=1)[0].chunk_id == "a"
+
+    writer = SQLiteVectorBackend(str(tmp_path / "vectors.ip.binary.none.db"))
+    writer.load()
+    writer.upsert(VectorChunk(chunk_id="e", text="text e", metadata={}, vector=[5.0, 0.0, 0.0, 0.0]))
+    writer.persist()
+
+    assert reader.query(QUERY, k=1)[0].chunk_id == "e"
+
+
+def test_query_without_vec0_uses_scan(tmp_path) -> None:
+    backend = _backend(tmp_path)
+    backend._has_vec0 = False
+
+    with patch.object(backend, "_query_vec0") as knn:
+        backend.query(QUERY, k=2)
+
+    knn.assert_not_called()
+
+
+def test_query_uses_vec0_when_in_sync(tmp_path) -> None:
+    backend = _backend(tmp_path)
+    backend._has_vec0 = True
+
+    with patch.object(backend, "_vec0_in_sync", return_value=True), patch.object(
+        backend, "_query_vec0", return_value=[]
+    ) as knn:
+        backend.query(QUERY, k=2)
+        # chunk_id filters are not expressible as a vec0 KNN constraint.
+        backend.query(QUERY, k=2, filters={"chunk_ids": ["a"]})
+
+    knn.assert_called_once_with(QUERY, 2)
+
+
+@pytest.mark.parametrize("metric", ["cosine", "l2"])
+def test_query_vec0_matches_scan(tmp_path, metric) -> None:
+    pytest.importorskip("sqlite_vec")
+    backend = _backend(tmp_path, metric)
+    if not backend._has_vec0:
+        pytest.skip("sqlite-vec extension cannot be loaded")
+    expected = _expected_scores(metric)
+
+    results = backend.query(QUERY, k=3)
+
+    assert [r.chunk_id for r in results] == sorted(expected, key=expected.get, reverse=True)[:3]
+    for result in results:
+        assert result.score == pytest.approx(expected[result.chunk_id], abs=1e-5)
+
+
+def test_upsert_numpy_vector_stored_as_float32_blob(tmp_path) -> None:
+    np = sqlite_backend._numpy()
+    if np is None:
+        pytest.skip("numpy not installed")
+    backend = _backend(tmp_path, metric="ip")
+    backend.upsert(VectorChunk(chunk_id="e", text="text e", metadata={}, vector=np.array([0.5, 0.25, 0.0, 1.0])))
+
+    (blob,) = backend._conn.execute("SELECT vector_json FROM backlog_chunks WHERE chunk_id = 'e'").fetchone()
+
+    assert blob == struct.pack("4f", 0.5, 0.25, 0.0, 1.0)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_cosine_vectors_normalized_at_insert(tmp_path, use_numpy) -> None:
+    if use_numpy and sqlite_backend._numpy() is None:
+        pytest.skip("numpy not installed")
+    if use_numpy:
+        backend = _backend(tmp_path)
+    else:
+        with patch.object(sqlite_backend, "_numpy", return_value=None):
+            backend = _backend(tmp_path)
+
+    (blob,) = backend._conn.execute("SELECT vector_json FROM backlog_chunks WHERE chunk_id = 'b'").fetchone()
+
+    assert backend._read_meta("normalized") == "1"
+    assert struct.unpack("4f", blob) == pytest.approx((0.6, 0.8, 0.0, 0.0))
+    (blob,) = backend._conn.execute("SELECT vector_json FROM backlog_chunks WHERE chunk_id = 'd'").fetchone()
+    assert math.fsum(x * x for x in struct.unpack("4f", blob)) == pytest.approx(1.0, abs=1e-6)
+    assert _backend(tmp_path, metric="l2")._read_meta("normalized") == "0"
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_unnormalized_cosine_db_keeps_raw_vectors(tmp_path, use_numpy) -> None:
+    if use_numpy and sqlite_backend._numpy() is None:
+        pytest.skip("numpy not installed")
+    path = tmp_path / "legacy.db"
+    legacy = SQLiteVectorBackend(str(path))
+    legacy.prepare({}, dims=4)
+    legacy._normalized = False
+    for chunk_id, vector in VECTORS.items():
+        legacy.upsert(VectorChunk(chunk_id=chunk_id, text=f"text {chunk_id}", metadata={}, vector=vector))
+    legacy._conn.execute("DELETE FROM meta WHERE key = 'normalized'")
+    legacy.persist()
+
+    backend = SQLiteVectorBackend(str(path))
+    backend.prepare({}, dims=4)
+    expected = _expected_scores("cosine")
+    if use_numpy:
+        results = backend.query(QUERY, k=5)
+    else:
+        with patch.object(sqlite_backend, "_numpy", return_value=None):
+            results = backend.query(QUERY, k=5)
+
+    assert backend._read_meta("normalized") == "0"
+    for result in results:
+        assert result.score == pytest.approx(expected[result.chunk_id], abs=1e-6)
+
+
+@pytest.mark.parametrize("metric", ["cosine", "ip", "l2"])
+def test_int8_quantized_query_reranks_exactly(tmp_path, metric) -> None:
+    if sqlite_backend._numpy() is None:
+        pytest.skip("numpy not installed")
+    backend = _backend(tmp_path, metric, quantization="int8")
+    expected = _expected_scores(metric)
+
+    results = backend.query(QUERY, k=3)
+
+    assert backend._matrix.matrix.dtype.name == "int8"
+    assert [r.chunk_id for r in results] == sorted(expected, key=expected.get, reverse=True)[:3]
+    for result in results:
+        assert result.score == pytest.approx(expected[result.chunk_id], abs=1e-6)
+
+
+def test_int8_codes_layout_and_backfill(tmp_path) -> None:
+    if sqlite_backend._numpy() is None:
+        pytest.skip("numpy not installed")
+    backend = _backend(tmp_path, "ip", quantization="int8")
+
+    (blob,) = backend._conn.execute("SELECT vector_i8 FROM backlog_chunks WHERE chunk_id = 'd'").fetchone()
+    assert struct.unpack("f", blob[:4])[0] == pytest.approx(2.0 / 127)
+    assert struct.unpack("4b", blob[4:]) == (-64, 32, 16, 127)
+
+    # Rows written before int8 was enabled are quantized when the matrix loads.
+    backend._conn.execute("UPDATE backlog_chunks SET vector_i8 = NULL")
+    backend.persist()
+    backend._invalidate_caches()
+    assert [r.chunk_id for r in backend.query(QUERY, k=1)] == ["a"]
+
+
+@pytest.mark.parametrize("storage_format", ["binary", "json"])
+def test_upsert_many_matches_single_upserts(tmp_path, storage_format) -> None:
+    single = _backend(tmp_path, "ip", storage_format)
+    bulk = SQLiteVectorBackend(str(tmp_path / f"bulk.{storage_format}.db"), storage_format=storage_format)
+    bulk.prepare({}, dims=4, metric="ip")
+    bulk.upsert_many(
+        VectorChunk(chunk_id=chunk_id, text=f"text {chunk_id}", metadata={"id": chunk_id}, vector=vector)
+        for chunk_id, vector in VECTORS.items()
+    )
+    bulk.upsert_many([VectorChunk(chunk_id="a", text="text a2", metadata={}, vector=[2.0, 0.0, 0.0, 0.0])])
+    bulk.upsert_many([])
+    bulk.persist()
+
+    sql = "SELECT chunk_id, vector_json FROM backlog_chunks WHERE chunk_id != 'a' ORDER BY chunk_id"
+    assert bulk._conn.execute(sql).fetchall() == single._conn.execute(sql).fetchall()
+    assert bulk.get_stats()["chunks_count"] == len(VECTORS)
+    top = bulk.query(QUERY, k=1)[0]
+    assert (top.chunk_id, top.text) == ("a", "text a2")
+
+
+def test_upsert_many_rejects_bad_dims(tmp_path) -> None:
+    backend = _backend(tmp_path)
+
+    with pytest.raises(ValueError, match="dims mismatch"):
+        backend.upsert_many([VectorChunk(chunk_id="x", text="", metadata={}, vector=[1.0, 2.0])])
+
+
+@pytest.mark.parametrize("metric", ["cosine", "ip", "l2"])
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_float16_storage_halves_blobs_and_keeps_ranking(tmp_path, metric, use_numpy) -> None:
+    if use_numpy and sqlite_backend._numpy() is None:
+        pytest.skip("numpy not installed")
+    backend = _backend(tmp_path, metric, storage_format="float16")
+    # A row written as float32 by an earlier "binary" configuration.
+    backend._storage_format = "binary"
+    backend.upsert(VectorChunk(chunk_id="f32", text="text f32", metadata={}, vector=[0.0, 0.0, 0.0, 1.0]))
+    backend.persist()
+    expected = _expected_scores(metric)
+    expected["f32"] = _expected_scores_for([0.0, 0.0, 0.0, 1.0], metric)
+
+    if use_numpy:
+        results = backend.query(QUERY, k=6)
+    else:
+        with patch.object(sqlite_backend, "_numpy", return_value=None):
+            results = backend.query(QUERY, k=6)
+
+    (blob,) = backend._conn.execute("SELECT vector_json FROM backlog_chunks WHERE chunk_id = 'd'").fetchone()
+    assert len(blob) == 2 * 4
+    assert [r.chunk_id for r in results] == sorted(expected, key=expected.get, reverse=True)
+    for result in results:
+        assert result.score == pytest.approx(expected[result.chunk_id], abs=2e-3)
+
+
+def test_mmap_size_applied_to_connection(tmp_path) -> None:
+    path = tmp_path / "vectors.cosine.binary.none.db"
+    _backend(tmp_path)._conn.close()
+    expected = _expected_scores("cosine")
+
+    backend = SQLiteVectorBackend(str(path), mmap_size=1 << 20)
+    backend.load()
+    (mmap_size,) = backend._conn.execute("PRAGMA mmap_size").fetchone()
+    results = backend.query(QUERY, k=5)
+
+    if mmap_size == 0:
+        pytest.skip("SQLite built without memory-mapped I/O")
+    assert mmap_size == 1 << 20
+    assert [r.chunk_id for r in results] == sorted(expected, key=expected.get, reverse=True)
+
+
+@pytest.mark.parametrize("storage_format", ["binary", "float16", "json"])
+def test_stored_vectors_for_texts(tmp_path, storage_format) -> None:
+    backend = _backend(tmp_path, "ip", storage_format)
+
+    found = backend.stored_vectors_for_texts(["text b", "text d", "unseen"])
+
+    assert set(found) == {"text b", "text d"}
+    assert list(found["text b"]) == pytest.approx(VECTORS["b"], abs=1e-3)
+    backend.upsert(VectorChunk(chunk_id="e", text="text e", metadata={}, vector=[0.0, 1.0, 0.0, 0.0]))
+    assert list(backend.stored_vectors_for_texts(["text e"])["text e"]) == [0.0, 1.0, 0.0, 0.0]
+    backend.delete("b")
+    assert backend.stored_vectors_for_texts(["text b"]) == {}
@@ -8,6 +8,7 @@ from kano_backlog_core.token_budget import (
     BudgetResult,
     TokenBudgetPolicy,
     enforce_token_budget,
+    enforce_token_budget_many,
     TokenBudgetResult,
 )
 from kano_backlog_core.chunking import ChunkingOptions
@@ -206,6 +207,38 @@ class TestTokenBudgetManager:
         if result.was_trimmed:
             assert len(result.text) > 0
 
+    def test_apply_budget_many_matches_apply_budget(self) -> None:
+        """Batched budgeting counts once and matches per-text results."""
+        tokenizer = HeuristicTokenizer("test-model", chars_per_token=4.0)
+        manager = self.create_test_manager(max_tokens=30, tokenizer=tokenizer)
+        texts = ["short text", "", "long " * 80, "你好世界 mixed", "x"]
+        calls = []
+        count_tokens_many = tokenizer.count_tokens_many
+        tokenizer.count_tokens_many = lambda batch: calls.append(batch) or count_tokens_many(batch)
+
+        results = manager.apply_budget_many(texts)
+
+        assert results == [manager.apply_budget(text) for text in texts]
+        assert calls == [[text for text in texts if text]]
+        assert manager.apply_budget_many([]) == []
+
+    def test_apply_budget_many_uses_known_counts(self) -> None:
+        """Texts with a known count are not re-counted."""
+        tokenizer = HeuristicTokenizer("test-model", chars_per_token=4.0)
+        manager = self.create_test_manager(max_tokens=30, tokenizer=tokenizer)
+        texts = ["short text", "long " * 80, "x"]
+        known = [tokenizer.count_tokens(texts[0]), tokenizer.count_tokens(texts[1]), None]
+        calls = []
+        count_tokens_many = tokenizer.count_tokens_many
+        tokenizer.count_tokens_many = lambda batch: calls.append(batch) or count_tokens_many(batch)
+
+        results = manager.apply_budget_many(texts, known)
+
+        assert results == [manager.apply_budget(text) for text in texts]
+        assert calls == [["x"]]
+        with pytest.raises(ValueError, match="known_counts"):
+            manager.apply_budget_many(texts, known[:1])
+
 
 class TestTokenBudgetManagerIntegration:
     """Integration tests for TokenBudgetManager with different tokenizers."""
@@ -275,6 +308,18 @@ class TestBackwardCompatibility:
         assert result.target_budget > 0
         assert result.safety_margin >= 0
 
+    def test_enforce_token_budget_many_matches_single(self) -> None:
+        """enforce_token_budget_many returns what enforce_token_budget does per text."""
+        tokenizer = HeuristicTokenizer("test-model")
+        texts = ["This is a test text.", "word " * 200, ""]
+
+        results = enforce_token_budget_many(texts, tokenizer, max_tokens=50)
+
+        assert results == [enforce_token_budget(text, tokenizer, max_tokens=50) for text in texts]
+        assert results[1].trimmed
+        with pytest.raises(ValueError, match="max_tokens must be positive"):
+            enforce_token_budget_many(texts, tokenizer, max_tokens=0)
+
     def test_enforce_token_budget_with_policy(self) -> None:
         """Test enforce_token_budget with custom policy."""
         tokenizer = HeuristicTokenizer("test-model")
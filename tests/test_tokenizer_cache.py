@@ -248,6 +248,27 @@ class TestCachingTokenizerAdapter:
         assert stats.hits == 0
         assert stats.cache_size == 1
     
+    def test_caching_adapter_count_tokens_many_batches_misses(self):
+        """Test batched counting serves hits and sends misses in one batch."""
+        mock_adapter = Mock()
+        mock_adapter.adapter_id = "test"
+        mock_adapter.model_name = "test-model"
+        mock_adapter.count_tokens_many.side_effect = lambda texts: [
+            TokenCount(count=len(t), method="test", tokenizer_id="test", is_exact=True)
+            for t in texts
+        ]
+        
+        cache = TokenCountCache()
+        caching_adapter = CachingTokenizerAdapter(mock_adapter, cache)
+        caching_adapter.count_tokens_many(["abc"])
+        
+        results = caching_adapter.count_tokens_many(["abc", "hello", "", "abc"])
+        
+        assert [r.count for r in results] == [3, 5, 0, 3]
+        assert mock_adapter.count_tokens_many.call_args.args[0] == ["hello", ""]
+        mock_adapter.count_tokens.assert_not_called()
+        assert caching_adapter.get_cache_stats().cache_size == 2
+    
     def test_caching_adapter_count_tokens_cache_hit(self):
         """Test token counting with cache hit."""
         mock_adapter = Mock()
@@ -753,6 +753,29 @@ The third paragraph provides additional content. Boundary selection should be de
             assert overlaps == first_overlaps, \
                 f"Run {i+1} produced different overlaps than run 1"
 
+    def test_chunks_carry_token_counts_without_recounting(self):
+        """Each slice is counted once per call, and chunks expose their counts."""
+        text = "Word one. Word two. Word three. Word four. Word five. Word six. " * 20
+        options = ChunkingOptions(target_tokens=20, max_tokens=40, overlap_tokens=8)
+        tokenizer = HeuristicTokenizer("count-test-model", chars_per_token=4.0)
+        counted = []
+        count_tokens = tokenizer.count_tokens
+        tokenizer.count_tokens = lambda t: counted.append(t) or count_tokens(t)
+
+        chunks = chunk_text_with_tokenizer("count-test", text, options, tokenizer)
+
+        assert len(counted) == len(set(counted))
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.token_count == count_tokens(chunk.text)
+        assert chunks[0] == Chunk(
+            source_id=chunks[0].source_id,
+            start_char=chunks[0].start_char,
+            end_char=chunks[0].end_char,
+            text=chunks[0].text,
+            chunk_id=chunks[0].chunk_id,
+        )
+
 
 class TestTokenizerAdapterIntegration:
     """Test integration between tokenizer adapters and chunking engine."""
@@ -200,7 +200,159 @@ class TestTiktokenAdapterMocked:
         
         # Verify encode was called correctly
         mock_encoding.encode.assert_called_once_with("Hello world", disallowed_special=())
-    
+
+    @patch('kano_backlog_core.tokenizer.tiktoken', create=True)
+    def test_token_counting_caches_repeated_text(self, mock_tiktoken):
+        """Test repeated texts are served from the bounded LRU without re-encoding."""
+        from kano_backlog_core.tokenizer import TiktokenAdapter
+
+        mock_encoding = Mock()
+        mock_encoding.name = "cl100k_base"
+        mock_encoding.encode.side_effect = lambda text, **kwargs: [0] * len(text.split())
+        mock_tiktoken.encoding_for_model.return_value = mock_encoding
+
+        adapter = TiktokenAdapter("gpt-4", cache_size=2)
+        first = adapter.count_tokens("one two")
+        assert adapter.count_tokens("one two") is first
+        assert mock_encoding.encode.call_count == 1
+
+        # Oldest entry is evicted from the adapter LRU once it is full, but
+        # its count is still served by the shared per-encoding cache
+        adapter.count_tokens("three")
+        adapter.count_tokens("four five six")
+        assert adapter.count_tokens("one two") is not first
+        assert adapter.count_tokens("one two").count == 2
+        assert mock_encoding.encode.call_count == 3
+
+        uncached = TiktokenAdapter("gpt-4", cache_size=0)
+        uncached.count_tokens("one two")
+        uncached.count_tokens("one two")
+        assert mock_encoding.encode.call_count == 5
+
+    @patch('kano_backlog_core.tokenizer.tiktoken', create=True)
+    def test_long_texts_cached_by_digest(self, mock_tiktoken):
+        """Test long texts are keyed by digest and never confused by sampling."""
+        from kano_backlog_core.tokenizer import CACHE_KEY_DIGEST_MIN_CHARS, TiktokenAdapter
+
+        mock_encoding = Mock()
+        mock_encoding.name = "cl100k_base"
+        mock_encoding.encode.side_effect = lambda text, **kwargs: [0] * len(text.split())
+        mock_tiktoken.encoding_for_model.return_value = mock_encoding
+
+        adapter = TiktokenAdapter("gpt-4")
+        half = "x" * CACHE_KEY_DIGEST_MIN_CHARS
+        spaced = half + " a b " + half
+        joined = half + "_a_b_" + half
+        assert adapter.count_tokens(spaced).count == 4
+        assert adapter.count_tokens(joined).count == 1
+        assert adapter.count_tokens(spaced).count == 4
+        assert mock_encoding.encode.call_count == 2
+        assert spaced not in adapter._cache
+
+    @patch('kano_backlog_core.tokenizer.tiktoken', create=True)
+    def test_token_counts_shared_across_adapters(self, mock_tiktoken):
+        """Test adapters on the same encoding reuse each other's counts."""
+        from kano_backlog_core.tokenizer import TiktokenAdapter
+
+        mock_encoding = Mock()
+        mock_encoding.name = "cl100k_base"
+        mock_encoding.encode.side_effect = lambda text, **kwargs: [0] * len(text.split())
+        mock_encoding.encode_batch.side_effect = lambda texts, **kwargs: [
+            [0] * len(t.split()) for t in texts
+        ]
+        mock_tiktoken.encoding_for_model.return_value = mock_encoding
+
+        first = TiktokenAdapter("gpt-4")
+        second = TiktokenAdapter("gpt-4")
+        first.count_tokens("one two")
+        first.count_tokens_many(["three four five"])
+
+        result = second.count_tokens("one two")
+        assert result.count == 2
+        assert result.tokenizer_id == second._tokenizer_id
+        assert [r.count for r in second.count_tokens_many(["three four five", "six"])] == [3, 1]
+        assert mock_encoding.encode.call_count == 1
+        assert mock_encoding.encode_batch.call_count == 2
+        assert mock_encoding.encode_batch.call_args.args[0] == ["six"]
+
+    @patch('kano_backlog_core.tokenizer.tiktoken', create=True)
+    def test_count_tokens_many_uses_encode_batch(self, mock_tiktoken):
+        """Test batched counting encodes distinct uncached texts in one call."""
+        from kano_backlog_core.tokenizer import TiktokenAdapter
+
+        mock_encoding = Mock()
+        mock_encoding.name = "cl100k_base"
+        mock_encoding.encode.side_effect = lambda text, **kwargs: [0] * len(text.split())
+        mock_encoding.encode_batch.side_effect = lambda texts, **kwargs: [
+            [0] * len(t.split()) for t in texts
+        ]
+        mock_tiktoken.encoding_for_model.return_value = mock_encoding
+
+        adapter = TiktokenAdapter("gpt-4")
+        adapter.count_tokens("cached text")
+        results = adapter.count_tokens_many(["a b c", "cached text", "a b c", None, "d"])
+
+        assert [r.count for r in results] == [3, 2, 3, 0, 1]
+        assert all(r.method == "tiktoken" for r in results)
+        mock_encoding.encode_batch.assert_called_once()
+        assert mock_encoding.encode_batch.call_args.args[0] == ["a b c", "d"]
+        assert mock_encoding.encode_batch.call_args.kwargs["disallowed_special"] == ()
+
+        # Batched results populate the per-text cache
+        adapter.count_tokens("d")
+        assert mock_encoding.encode.call_count == 1
+
+        adapter.count_tokens_many(["e f", "g"], max_workers=2)
+        assert mock_encoding.encode_batch.call_args.kwargs["num_threads"] == 2
+
+    @patch('kano_backlog_core.tokenizer.tiktoken', create=True)
+    def test_empty_and_none_share_zero_count(self, mock_tiktoken):
+        """Test None and empty text return one shared zero result without encoding."""
+        from kano_backlog_core.tokenizer import HeuristicTokenizer, TiktokenAdapter
+
+        mock_encoding = Mock()
+        mock_encoding.name = "cl100k_base"
+        mock_tiktoken.encoding_for_model.return_value = mock_encoding
+
+        adapter = TiktokenAdapter("gpt-4")
+        zero = adapter.count_tokens(None)
+        assert zero.count == 0 and zero.is_exact
+        assert adapter.count_tokens("") is zero
+        assert adapter.count_tokens(None) is zero
+        mock_encoding.encode.assert_not_called()
+
+        heuristic = HeuristicTokenizer("test-model")
+        assert heuristic.count_tokens("") is heuristic.count_tokens("")
+        assert heuristic.count_tokens("").count == 0
+
+    def test_tiktoken_imported_lazily_on_first_adapter(self):
+        """Test tiktoken is imported on first construction, then memoized."""
+        from kano_backlog_core import tokenizer as tokenizer_module
+
+        fake_tiktoken = Mock()
+        fake_tiktoken.encoding_for_model.return_value.name = "cl100k_base"
+        with patch.object(tokenizer_module, "tiktoken", tokenizer_module._NOT_LOADED):
+            with patch.dict("sys.modules", {"tiktoken": fake_tiktoken}):
+                adapter = tokenizer_module.TiktokenAdapter("lazy-import-model")
+                assert tokenizer_module.tiktoken is fake_tiktoken
+        assert adapter.encoding_name == "cl100k_base"
+        fake_tiktoken.encoding_for_model.assert_called_once_with("lazy-import-model")
+
+    @patch('kano_backlog_core.tokenizer.tiktoken', create=True)
+    def test_encodings_shared_across_adapters(self, mock_tiktoken):
+        """Test adapters for the same encoding reuse one loaded Encoding."""
+        from kano_backlog_core.tokenizer import TiktokenAdapter
+
+        mock_encoding = Mock()
+        mock_encoding.name = "p50k_base"
+        mock_tiktoken.get_encoding.return_value = mock_encoding
+
+        first = TiktokenAdapter("test-model", encoding_name="p50k_base")
+        second = TiktokenAdapter("other-model", encoding_name="p50k_base")
+
+        assert first._encoding is second._encoding is mock_encoding
+        mock_tiktoken.get_encoding.assert_called_once_with("p50k_base")
+
     @patch('kano_backlog_core.tokenizer.tiktoken', create=True)
     def test_token_counting_none_input(self, mock_tiktoken):
         """Test token counting with None input."""
@@ -319,6 +471,25 @@ class TestHuggingFaceAdapterMocked:
         
         # Verify encode was called with correct parameters
         mock_tokenizer.encode.assert_called_once_with("hello world", add_special_tokens=True)
+
+    @patch('kano_backlog_core.tokenizer.transformers', create=True)
+    def test_count_tokens_many_with_mocked_transformers(self, mock_transformers):
+        """Test batched counting uses one tokenizer call with return_length."""
+        from kano_backlog_core.tokenizer import HuggingFaceAdapter
+
+        mock_tokenizer = Mock()
+        mock_tokenizer.return_value = {"length": [4, 7]}
+        mock_transformers.AutoTokenizer.from_pretrained.return_value = mock_tokenizer
+
+        adapter = HuggingFaceAdapter("bert-base-uncased")
+        results = adapter.count_tokens_many(["hello world", "a longer sentence"])
+
+        assert [r.count for r in results] == [4, 7]
+        assert all(r.is_exact for r in results)
+        mock_tokenizer.assert_called_once_with(
+            ["hello world", "a longer sentence"], add_special_tokens=True, return_length=True
+        )
+        mock_tokenizer.encode.assert_not_called()
     
     @patch('kano_backlog_core.tokenizer.transformers', create=True)
     def test_token_counting_none_input(self, mock_transformers):
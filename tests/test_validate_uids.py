@@ -0,0 +1,81 @@
+"""Tests for validate_uids UUIDv7 checks."""
+
+from pathlib import Path
+
+from kano_backlog_ops.frontmatter import read_frontmatter_block
+from kano_backlog_ops.validate import validate_uids
+
+
+V7 = "018f3a2b-1c2d-7e4f-8a9b-0c1d2e3f4a5b"
+
+
+def _write_item(items_dir: Path, name: str, frontmatter: str, body: str = "# Title\n") -> Path:
+    path = items_dir / "task" / "0000" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\n{frontmatter}---\n\n{body}", encoding="utf-8")
+    return path
+
+
+def _validate(tmp_path: Path):
+    (result,) = validate_uids(product="demo", backlog_root=tmp_path)
+    return result
+
+
+def test_validate_uids_flags_non_v7(tmp_path: Path) -> None:
+    items = tmp_path / "products" / "demo" / "items"
+    _write_item(items, "ok.md", f"id: T-1\nuid: {V7}\n")
+    _write_item(items, "upper.md", f"id: T-2\nuid: {V7.upper()}\n")
+    _write_item(items, "v4.md", "id: T-3\nuid: 3f2504e0-4f89-41d3-9a0c-0305e82c3301\n")
+    _write_item(items, "braces.md", f"id: T-4\nuid: '{{{V7}}}'\n")
+    _write_item(items, "variant.md", "id: T-5\nuid: 018f3a2b-1c2d-7e4f-ca9b-0c1d2e3f4a5b\n")
+    _write_item(items, "missing.md", "id: T-6\n")
+    _write_item(items, "README.md", "uid: nope\n")
+    _write_item(items, "task.index.md", "uid: nope\n")
+
+    result = _validate(tmp_path)
+
+    assert result.product == "demo"
+    assert result.checked == 6
+    reasons = {v.path.name: v.reason for v in result.violations}
+    assert reasons == {
+        "v4.md": "UID is not UUIDv7",
+        "braces.md": "UID is not UUIDv7",
+        "variant.md": "UID is not UUIDv7",
+        "missing.md": "Missing uid",
+    }
+
+
+def test_validate_uids_reads_frontmatter_only(tmp_path: Path) -> None:
+    items = tmp_path / "products" / "demo" / "items"
+    # The body is not valid YAML and would fail a whole-file YAML parse.
+    _write_item(items, "body.md", f"uid: {V7}\n", body="---\nuid: [unclosed\n---\n")
+    no_fence = items / "task" / "0000" / "plain.md"
+    no_fence.write_text("# No frontmatter\n", encoding="utf-8")
+
+    result = _validate(tmp_path)
+
+    assert result.checked == 2
+    assert [(v.path.name, v.reason) for v in result.violations] == [("plain.md", "Missing uid")]
+
+
+def test_read_frontmatter_block(tmp_path: Path) -> None:
+    path = _write_item(tmp_path, "x.md", "id: T-1\nuid: abc\n", body="body\n---\nmore\n")
+    assert read_frontmatter_block(path) == "id: T-1\nuid: abc\n"
+
+    unclosed = tmp_path / "unclosed.md"
+    unclosed.write_text("---\nid: T-1\n", encoding="utf-8")
+    assert read_frontmatter_block(unclosed) is None
+
+
+def test_validate_uids_parallel_matches_sequential(tmp_path: Path) -> None:
+    items = tmp_path / "products" / "demo" / "items"
+    for i in range(80):
+        uid = V7 if i % 3 else f"3f2504e0-4f89-41d3-9a0c-0305e82c{i:04d}"
+        _write_item(items, f"T-{i:03d}.md", f"id: T-{i}\nuid: {uid}\n")
+
+    (sequential,) = validate_uids(product="demo", backlog_root=tmp_path, max_workers=1)
+    (parallel,) = validate_uids(product="demo", backlog_root=tmp_path, max_workers=4)
+
+    assert parallel.checked == sequential.checked == 80
+    assert parallel.violations == sequential.violations
+    assert len(parallel.violations) == 27
@@ -0,0 +1,64 @@
+"""Tests for reading historical files when restoring links from git."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from kano_backlog_ops.validate import _GitCatFileBatch, _git_show_file
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.check_output(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        text=True,
+    ).strip()
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "a.md").write_text("# A\nline\n", encoding="utf-8")
+    (tmp_path / "docs" / "crlf.md").write_bytes("café\r\nnext\r\n".encode("utf-8"))
+    (tmp_path / "empty.md").write_text("", encoding="utf-8")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "first")
+    return tmp_path
+
+
+def test_cat_file_batch_matches_git_show(git_repo: Path) -> None:
+    commit = _git(git_repo, "rev-parse", "HEAD")
+    paths = ["docs/a.md", "docs/crlf.md", "empty.md", "docs/missing.md", "docs", "docs/a.md"]
+
+    with _GitCatFileBatch(git_repo) as cat_file:
+        batched = [cat_file.read_text(commit, path) for path in paths]
+        spawned_once = cat_file._proc is not None
+
+    assert spawned_once
+    assert batched == [_git_show_file(git_repo, commit, path) for path in paths]
+    assert batched[1] == "café\nnext\n"
+    assert batched[3] is None
+
+
+def test_cat_file_batch_falls_back_without_process(git_repo: Path) -> None:
+    commit = _git(git_repo, "rev-parse", "HEAD")
+    cat_file = _GitCatFileBatch(git_repo)
+    cat_file._failed = True
+
+    assert cat_file.read_text(commit, "docs/a.md") == "# A\nline\n"
+    assert cat_file._proc is None
+
+
+def test_cat_file_batch_missing_paths_with_spaces_keep_process(git_repo: Path) -> None:
+    commit = _git(git_repo, "rev-parse", "HEAD")
+
+    with _GitCatFileBatch(git_repo) as cat_file:
+        assert cat_file.read_text(commit, "a b.md") is None
+        assert cat_file.read_text(commit, "docs/x y z.md") is None
+        assert cat_file.read_text(commit, "docs/a.md") == "# A\nline\n"
+        assert not cat_file._failed
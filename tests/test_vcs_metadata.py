@@ -2,8 +2,15 @@
 test_vcs_metadata.py - Tests for reproducible VCS metadata blocks.
 """
 
+import shutil
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
 from kano_backlog_core.vcs.base import VcsMeta
 from kano_backlog_core.vcs.detector import format_vcs_metadata
+from kano_backlog_core.vcs.git_adapter import GitAdapter
 
 
 def test_format_vcs_metadata_min_schema_and_order() -> None:
@@ -31,3 +38,91 @@ def test_format_vcs_metadata_none_is_empty() -> None:
     meta = VcsMeta(provider="git", branch="main", revno="1", hash="x", dirty="false")
     assert format_vcs_metadata(meta, mode="none") == ""
 
+
+
+def _git(repo, *args: str) -> str:
+    return subprocess.check_output(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        text=True,
+    ).strip()
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    _git(tmp_path, "init", "-q", "-b", "main")
+    (tmp_path / "a.txt").write_text("a\n", encoding="utf-8")
+    _git(tmp_path, "add", "a.txt")
+    _git(tmp_path, "commit", "-q", "-m", "first")
+    return tmp_path
+
+
+def test_git_adapter_metadata(git_repo) -> None:
+    head = _git(git_repo, "rev-parse", "HEAD")
+
+    meta = GitAdapter().get_metadata(git_repo)
+
+    assert (meta.hash, meta.revision, meta.branch, meta.ref) == (head, head, "main", "main")
+    assert (meta.revno, meta.dirty, meta.label) == ("1", "false", head[:7])
+
+    (git_repo / "untracked.txt").write_text("new\n", encoding="utf-8")
+    assert GitAdapter().get_metadata(git_repo).dirty == "false"
+
+    (git_repo / "a.txt").write_text("changed\n", encoding="utf-8")
+    assert GitAdapter().get_metadata(git_repo).dirty == "true"
+    _git(git_repo, "add", "a.txt")
+    assert GitAdapter().get_metadata(git_repo).dirty == "true"
+
+
+def test_git_adapter_detached_and_unborn(git_repo, tmp_path_factory) -> None:
+    _git(git_repo, "checkout", "-q", "--detach")
+    meta = GitAdapter().get_metadata(git_repo)
+    assert meta.branch == "HEAD"
+    assert meta.hash == _git(git_repo, "rev-parse", "HEAD")
+
+    empty = tmp_path_factory.mktemp("empty")
+    _git(empty, "init", "-q")
+    meta = GitAdapter().get_metadata(empty)
+    assert (meta.revision, meta.ref, meta.dirty) == ("unknown", "unknown", "unknown")
+
+
+def test_git_adapter_caches_ref_metadata_until_refs_change(git_repo) -> None:
+    adapter = GitAdapter()
+    first = adapter.get_metadata(git_repo)
+
+    calls = []
+    real_check_output = subprocess.check_output
+
+    def counting_check_output(cmd, *args, **kwargs):
+        calls.append(cmd[1])
+        return real_check_output(cmd, *args, **kwargs)
+
+    with patch("kano_backlog_core.vcs.git_adapter.subprocess.check_output", counting_check_output):
+        assert adapter.get_metadata(git_repo) == first
+        assert calls == ["--no-optional-locks"]
+
+    _git(git_repo, "tag", "v1")
+    assert adapter.get_metadata(git_repo).label == "v1"
+
+    _git(git_repo, "commit", "-q", "--allow-empty", "-m", "second")
+    meta = adapter.get_metadata(git_repo)
+    assert meta.hash == _git(git_repo, "rev-parse", "HEAD")
+    assert meta.revno == "2"
+
+    _git(git_repo, "checkout", "-q", "-b", "feature")
+    assert adapter.get_metadata(git_repo).branch == "feature"
+
+
+def test_git_adapter_sees_tags_moved_in_subfolders(git_repo) -> None:
+    adapter = GitAdapter()
+    _git(git_repo, "tag", "-a", "-m", "rel", "rel/v2")
+    assert adapter.get_metadata(git_repo).label == "rel/v2"
+
+    _git(git_repo, "commit", "-q", "--allow-empty", "-m", "second")
+    assert adapter.get_metadata(git_repo).label.startswith("rel/v2-1-g")
+
+    _git(git_repo, "tag", "-f", "-a", "-m", "rel", "rel/v2", "HEAD")
+    assert adapter.get_metadata(git_repo).label == _git(git_repo, "describe", "--tags", "--always")
+    assert adapter.get_metadata(git_repo).label == "rel/v2"
@@ -313,3 +313,44 @@ class TestIndexDocument:
 
 if __name__ == "__main__":
     pytest.main([__file__])
+
+
+def test_embedding_index_batch_size() -> None:
+    """batch_size option wins; otherwise the provider default applies."""
+    assert EmbeddingConfig(provider="openai").index_batch_size == 512
+    assert EmbeddingConfig(provider="Gemini").index_batch_size == 100
+    assert EmbeddingConfig(provider="noop").index_batch_size == 256
+    assert EmbeddingConfig(provider="openai", options={"batch_size": "64"}).index_batch_size == 64
+    with pytest.raises(ValueError, match="batch_size"):
+        _ = EmbeddingConfig(options={"batch_size": 0}).index_batch_size
+
+
+def test_vector_persist_interval() -> None:
+    """persist_interval defaults to 1024; 0 means persist only at the end."""
+    assert VectorConfig().persist_interval == 1024
+    assert VectorConfig(options={"persist_interval": "0"}).persist_interval == 0
+    with pytest.raises(ValueError, match="persist_interval"):
+        _ = VectorConfig(options={"persist_interval": -1}).persist_interval
+
+
+def test_index_document_reuses_resolved_embedder(tmp_path, monkeypatch) -> None:
+    """Repeated index_document calls with one config resolve the embedder once."""
+    from kano_backlog_ops import backlog_vector_index
+
+    resolved = []
+    resolve_embedder = backlog_vector_index.resolve_embedder
+
+    def counting_resolve(config):
+        resolved.append(config["model"])
+        return resolve_embedder(config)
+
+    monkeypatch.setattr(backlog_vector_index, "_INDEX_EMBEDDERS", {})
+    monkeypatch.setattr(backlog_vector_index, "resolve_embedder", counting_resolve)
+    config = TestIndexDocument().create_test_config()
+    other = TestIndexDocument().create_test_config(embedding_model="other-embedding")
+
+    for source_id in ("doc-1", "doc-2"):
+        index_document(source_id, "Some text to index.", config, cache_root=tmp_path)
+    index_document("doc-3", "Some text to index.", other, cache_root=tmp_path)
+
+    assert resolved == ["noop-embedding", "other-embedding"]
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 from pathlib import Path
 
+from kano_backlog_core.pipeline_config import EmbeddingConfig, VectorConfig
+from kano_backlog_core.vector.sqlite_backend import SQLiteVectorBackend
+from kano_backlog_ops import backlog_vector_index
 from kano_backlog_ops.backlog_vector_index import build_vector_index
 from conftest import write_project_backlog_config
 
@@ -25,6 +29,41 @@ def _find_vector_db(cache_dir: Path, product: str) -> Path:
     return dbs[0]
 
 
+def _write_task(items_root: Path, number: int, body: str) -> Path:
+    item_path = items_root / f"TEST-TSK-{number:03d}_test-task.md"
+    item_path.write_text(
+        f"""---
+id: TEST-TSK-{number:03d}
+uid: 01234567-89ab-cdef-0123-456789abc{number:03d}
+type: Task
+state: Proposed
+title: Test Task {number}
+priority: P3
+parent: null
+owner: test-agent
+area: general
+iteration: backlog
+tags: []
+created: '2026-01-23'
+updated: '2026-01-23'
+---
+
+{body}
+""",
+        encoding="utf-8",
+    )
+    return item_path
+
+
+def _read_vector_rows(db_path: Path, collection: str) -> list:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        cur = conn.execute(f"SELECT chunk_id, text, vector_json FROM {collection}_chunks ORDER BY chunk_id")
+        return cur.fetchall()
+    finally:
+        conn.close()
+
+
 def test_vector_index_incremental_and_prune(tmp_path: Path) -> None:
     write_project_backlog_config(tmp_path)
 
@@ -103,3 +142,131 @@ New content should change chunk ids.
     assert count3 > 0
     # Should not grow unbounded (stale chunk IDs must be pruned).
     assert count3 < count1 + 100
+
+
+def test_vector_index_concurrent_batches_match_sequential(tmp_path: Path, monkeypatch) -> None:
+    def build(root: Path) -> list:
+        write_project_backlog_config(root)
+        backlog_root = root / "_kano" / "backlog"
+        items_root = backlog_root / "products" / "test-product" / "items" / "task" / "0000"
+        items_root.mkdir(parents=True)
+        for number in range(1, 8):
+            _write_task(items_root, number, f"# Context\nTask {number} covers topic {number * 7}.")
+        result = build_vector_index(product="test-product", backlog_root=backlog_root, force=True)
+        db_path = _find_vector_db(root / ".kano" / "cache" / "backlog", product="test-product")
+        assert result.chunks_indexed == len(_read_vector_rows(db_path, "backlog"))
+        return _read_vector_rows(db_path, "backlog")
+
+    sequential = build(tmp_path / "sequential")
+
+    embed_threads = set()
+    resolve_embedder = backlog_vector_index.resolve_embedder
+
+    def resolve_concurrent(config):
+        embedder = resolve_embedder({**config, "max_concurrent": 3})
+        embed_batch = embedder.embed_batch
+
+        def tracking_embed_batch(texts):
+            embed_threads.add(threading.get_ident())
+            return embed_batch(texts)
+
+        monkeypatch.setattr(embedder, "embed_batch", tracking_embed_batch)
+        return embedder
+
+    monkeypatch.setattr(backlog_vector_index, "resolve_embedder", resolve_concurrent)
+    monkeypatch.setattr(EmbeddingConfig, "index_batch_size", property(lambda self: 1))
+    concurrent = build(tmp_path / "concurrent")
+
+    assert concurrent == sequential
+    assert threading.get_ident() not in embed_threads
+
+
+def test_vector_index_persists_in_bounded_intervals(tmp_path: Path, monkeypatch) -> None:
+    write_project_backlog_config(tmp_path)
+    backlog_root = tmp_path / "_kano" / "backlog"
+    items_root = backlog_root / "products" / "test-product" / "items" / "task" / "0000"
+    items_root.mkdir(parents=True)
+    for number in range(1, 8):
+        _write_task(items_root, number, f"# Context\nTask {number} covers topic {number * 7}.")
+
+    persisted_at = []
+    persist = SQLiteVectorBackend.persist
+
+    def tracking_persist(self):
+        persisted_at.append(self.get_stats()["chunks_count"])
+        persist(self)
+
+    monkeypatch.setattr(SQLiteVectorBackend, "persist", tracking_persist)
+    monkeypatch.setattr(EmbeddingConfig, "index_batch_size", property(lambda self: 1))
+    monkeypatch.setattr(VectorConfig, "persist_interval", property(lambda self: 2))
+    result = build_vector_index(product="test-product", backlog_root=backlog_root, force=True)
+
+    assert result.chunks_indexed >= 4
+    assert persisted_at[:-1] == list(range(2, result.chunks_indexed + 1, 2))
+    assert persisted_at[-1] == result.chunks_indexed
+
+
+def test_vector_index_reuses_vectors_of_already_embedded_text(tmp_path: Path, monkeypatch) -> None:
+    write_project_backlog_config(tmp_path)
+    backlog_root = tmp_path / "_kano" / "backlog"
+    items_root = backlog_root / "products" / "test-product" / "items" / "task" / "0000"
+    items_root.mkdir(parents=True)
+    body = "# Context\nShared context copied between tasks."
+    _write_task(items_root, 1, body)
+    first = build_vector_index(product="test-product", backlog_root=backlog_root, force=True)
+    assert first.chunks_reused == 0
+
+    embedded = []
+    resolve_embedder = backlog_vector_index.resolve_embedder
+
+    def resolve_tracking(config):
+        embedder = resolve_embedder(config)
+        embed_batch = embedder.embed_batch
+        monkeypatch.setattr(embedder, "embed_batch", lambda texts: embedded.extend(texts) or embed_batch(texts))
+        return embedder
+
+    monkeypatch.setattr(backlog_vector_index, "resolve_embedder", resolve_tracking)
+    _write_task(items_root, 2, body)
+    second = build_vector_index(product="test-product", backlog_root=backlog_root)
+
+    db_path = _find_vector_db(tmp_path / ".kano" / "cache" / "backlog", product="test-product")
+    rows = _read_vector_rows(db_path, "backlog")
+    assert second.chunks_reused > 0
+    assert second.chunks_indexed == second.chunks_reused + len(embedded)
+    assert not any("Shared context" in text for text in embedded)
+    by_text = {}
+    for _, text, vector in rows:
+        by_text.setdefault(text, set()).add(vector)
+    assert max(len(vectors) for vectors in by_text.values()) == 1
+    assert len(rows) > len(by_text)
+
+
+def test_vector_index_embeds_identical_texts_in_a_batch_once(tmp_path: Path, monkeypatch) -> None:
+    write_project_backlog_config(tmp_path)
+    backlog_root = tmp_path / "_kano" / "backlog"
+    items_root = backlog_root / "products" / "test-product" / "items" / "task" / "0000"
+    items_root.mkdir(parents=True)
+    for number in range(1, 4):
+        _write_task(items_root, number, "# Context\nShared context copied between tasks.")
+
+    embedded = []
+    resolve_embedder = backlog_vector_index.resolve_embedder
+
+    def resolve_tracking(config):
+        embedder = resolve_embedder(config)
+        embed_batch = embedder.embed_batch
+        monkeypatch.setattr(embedder, "embed_batch", lambda texts: embedded.extend(texts) or embed_batch(texts))
+        return embedder
+
+    monkeypatch.setattr(backlog_vector_index, "resolve_embedder", resolve_tracking)
+    result = build_vector_index(product="test-product", backlog_root=backlog_root, force=True)
+
+    db_path = _find_vector_db(tmp_path / ".kano" / "cache" / "backlog", product="test-product")
+    rows = _read_vector_rows(db_path, "backlog")
+    assert len(embedded) == len(set(embedded))
+    assert result.chunks_reused >= 2
+    assert result.chunks_indexed == len(rows) == result.chunks_reused + len(embedded)
+    by_text = {}
+    for _, text, vector in rows:
+        by_text.setdefault(text, set()).add(vector)
+    assert max(len(vectors) for vectors in by_text.values()) == 1
@@ -10,23 +10,11 @@ sys.path.insert(0, str(src_dir))
 
 from kano_backlog_core.models import ItemState, ItemType
 from kano_backlog_ops.workitem import create_item, get_item, list_items, update_state
-from conftest import write_project_backlog_config
+from conftest import scaffold_product
 
 
 def _scaffold_product(tmp_path: Path, *, name: str = "demo-product", prefix: str = "DE") -> Path:
-    backlog_root = tmp_path / "_kano" / "backlog"
-    product_root = backlog_root / "products" / name
-    items_root = product_root / "items"
-
-    for item_type in ["epic", "feature", "userstory", "task", "bug"]:
-        (items_root / item_type / "0000").mkdir(parents=True, exist_ok=True)
-
-    for required_dir in ["decisions", "views", "_meta"]:
-        (product_root / required_dir).mkdir(parents=True, exist_ok=True)
-
-    write_project_backlog_config(tmp_path, products={name: (name, prefix)})
-
-    return product_root
+    return scaffold_product(tmp_path, name, prefix)
 
 
 def test_get_item_resolves_by_id_uid_and_path(tmp_path: Path):
@@ -179,3 +167,31 @@ def test_update_state_syncs_parent_and_refreshes_dashboards(tmp_path: Path):
         assert (views_root / "Dashboard_PlainMarkdown_Done.md").exists()
     finally:
         os.chdir(cwd_before)
+
+
+def test_refresh_dashboards_reads_vcs_metadata_once(tmp_path: Path, monkeypatch):
+    from kano_backlog_core.vcs.base import VcsMeta
+    from kano_backlog_ops import view as view_ops
+
+    product_name = "demo-product"
+    product_root = _scaffold_product(tmp_path, name=product_name)
+    calls = []
+
+    def fake_detect(repo_root):
+        calls.append(repo_root)
+        return VcsMeta(provider="git", revision="abc", ref="main", dirty="false",
+                       branch="main", revno="7", hash="abc")
+
+    monkeypatch.setattr(view_ops, "detect_vcs_metadata", fake_detect)
+
+    result = view_ops.refresh_dashboards(
+        product=product_name,
+        agent="tester",
+        backlog_root=tmp_path / "_kano" / "backlog",
+    )
+
+    assert len(calls) == 1
+    assert len(result.views_refreshed) == 3
+    for path in result.views_refreshed:
+        assert path.parent == product_root / "views"
+        assert "vcs.revno: 7" in path.read_text(encoding="utf-8")